@@ -0,0 +1,296 @@
+"""Benchmarks dos caminhos críticos do DAO, do serviço e do adaptador
+
+Uso
+---
+    python -m benchmarks.bench_hot_paths --sizes 1000 100000 1000000 --output resultados.json
+    python -m benchmarks.bench_hot_paths --sizes 1000 --baseline resultados.json --max-regression 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+
+from benchmarks.seed import create_database
+from entities.task import Task
+from entities.task_status import TaskStatus
+from data_access_layer.dao.task_dao_impl import TaskDAOImpl
+from data_access_layer.dao.task_status_dao_impl import TaskStatusDAOImpl
+from data_access_layer.database_api_adapters.query_instrumentation import percentile
+from data_access_layer.database_api_adapters.sqlite_database_api_adapter import SQLiteDatabaseAPIAdapter
+from service_layer.service_factory import ServiceFactory
+
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+STATUS_NAMES = ("Disponível", "Fazendo", "Feita")
+
+
+def measure(operation: Callable[[int], Any], repetitions: int) -> Dict[str, float]:
+
+    """Mede a latência, a vazão e o pico de memória de uma operação
+
+    Parameters
+    ----------
+    operation: Callable[[int], Any]
+        Operação medida, que recebe o número da repetição
+    repetitions: int
+        Quantidade de execuções cronometradas. Uma execução adicional mede o pico de memória,
+        pois o rastreamento de memória distorce o tempo
+
+    Returns
+    -------
+    Dict[str, float]
+        Percentis de latência em milissegundos, vazão em operações por segundo e pico de memória em bytes
+    """
+
+    latencies = []
+
+    total_start = time.perf_counter()
+
+    for repetition in range(repetitions):
+
+        start = time.perf_counter()
+
+        operation(repetition)
+
+        latencies.append(time.perf_counter() - start)
+
+    total_time = time.perf_counter() - total_start
+
+    tracemalloc.start()
+
+    try:
+
+        operation(repetitions)
+
+        _, peak_memory = tracemalloc.get_traced_memory()
+
+    finally:
+
+        tracemalloc.stop()
+
+    latencies.sort()
+
+    return {
+        "repetitions": repetitions,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "throughput_ops_s": repetitions / total_time if total_time > 0 else float("inf"),
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_size(filename: str, task_count: int, point_repetitions: int, scan_repetitions: int) -> Dict[str, Dict[str, float]]:
+
+    """Executa todos os benchmarks sobre um banco de dados com 'task_count' tarefas
+
+    Parameters
+    ----------
+    filename: str
+        Caminho do arquivo do banco de dados de teste
+    task_count: int
+        Quantidade de tarefas do banco de dados
+    point_repetitions: int
+        Repetições das operações sobre uma única tarefa
+    scan_repetitions: int
+        Repetições das operações que percorrem a tabela inteira
+
+    Returns
+    -------
+    Dict[str, Dict[str, float]]
+        Resultados indexados pelo nome da operação
+    """
+
+    create_database(filename, task_count)
+
+    # Sem perfil de desempenho, para medir o código e não a configuração do SQLite
+    db_adapter = SQLiteDatabaseAPIAdapter(filename)
+
+    task_dao = TaskDAOImpl(db_adapter)
+    task_status_dao = TaskStatusDAOImpl(db_adapter)
+    task_service = ServiceFactory(filename, performance_profile=None).task_service()
+
+    randomizer = random.Random(task_count)
+    # A remoção sorteia 'point_repetitions' + 1 tarefas distintas
+    point_repetitions = min(point_repetitions, task_count - 1)
+    status = TaskStatus(1, STATUS_NAMES[0])
+
+    results = {}
+
+    results["task_dao.insert"] = measure(
+        lambda i: task_dao.insert(Task(0, f"Nova tarefa {i}", "Descrição", status)),
+        point_repetitions
+    )
+
+    results["task_dao.list_all"] = measure(
+        lambda i: task_dao.list_all(),
+        scan_repetitions
+    )
+
+    results["task_dao.fetch_columns"] = measure(
+        lambda i: task_dao.fetch_columns(),
+        scan_repetitions
+    )
+
+    results["task_status_dao.get_by_name"] = measure(
+        lambda i: task_status_dao.get_by_name(STATUS_NAMES[i % 3]),
+        point_repetitions
+    )
+
+    results["task_service.get_task_by_id"] = measure(
+        lambda i: task_service.get_task_by_id(randomizer.randint(1, task_count)),
+        point_repetitions
+    )
+
+    results["task_service.update_task_status"] = measure(
+        lambda i: task_service.update_task_status(randomizer.randint(1, task_count), STATUS_NAMES[i % 3]),
+        point_repetitions
+    )
+
+    # Cada repetição remove uma tarefa diferente; executada por último, pois altera o banco
+    delete_ids = randomizer.sample(range(1, task_count + 1), point_repetitions + 1)
+
+    results["task_service.delete_task"] = measure(
+        lambda i: task_service.delete_task(delete_ids[i]),
+        point_repetitions
+    )
+
+    db_adapter.close_connection()
+
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+
+    """Compara a latência mediana de dois resultados
+
+    Parameters
+    ----------
+    results: Dict[str, Any]
+        Resultados da execução atual
+    baseline: Dict[str, Any]
+        Resultados de referência
+    max_regression: float
+        Aumento relativo máximo aceito na latência mediana (0.2 = 20%)
+
+    Returns
+    -------
+    List[str]
+        Descrição das operações que ficaram mais lentas que o aceito
+    """
+
+    regressions = []
+
+    for size, operations in results["results"].items():
+
+        for operation, metrics in operations.items():
+
+            reference = baseline.get("results", {}).get(size, {}).get(operation)
+
+            if reference is None or reference["p50_ms"] <= 0:
+
+                continue
+
+            change = metrics["p50_ms"] / reference["p50_ms"] - 1
+
+            if change > max_regression:
+
+                regressions.append(
+                    f"{operation} ({size} tarefas): p50 {reference['p50_ms']:.3f} ms -> {metrics['p50_ms']:.3f} ms (+{change:.0%})"
+                )
+
+    return regressions
+
+
+def main(arguments: List[str] = None) -> int:
+
+    """Executa os benchmarks pela linha de comando
+
+    Parameters
+    ----------
+    arguments: List[str]
+        Argumentos da linha de comando. Se None, usa sys.argv
+
+    Returns
+    -------
+    int
+        Código de saída: 1 se houve regressão em relação à referência, 0 caso contrário
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos críticos do gerenciador de tarefas")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Quantidades de tarefas dos bancos de teste")
+    parser.add_argument("--point-repetitions", type=int, default=1000, help="Repetições das operações sobre uma tarefa")
+    parser.add_argument("--scan-repetitions", type=int, default=3, help="Repetições das operações sobre a tabela inteira")
+    parser.add_argument("--output", help="Arquivo JSON onde os resultados são gravados")
+    parser.add_argument("--baseline", help="Arquivo JSON de uma execução anterior, para detectar regressões")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Aumento relativo máximo aceito no p50 (padrão: 0.2)")
+    parser.add_argument("--workdir", help="Diretório dos bancos de teste (padrão: diretório temporário)")
+
+    options = parser.parse_args(arguments)
+
+    results = {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+
+        workdir = options.workdir or temporary_directory
+
+        for size in options.sizes:
+
+            print(f"Executando benchmarks com {size} tarefas...", file=sys.stderr)
+
+            results["results"][str(size)] = run_size(
+                os.path.join(workdir, f"benchmark_{size}.db"),
+                size,
+                options.point_repetitions,
+                options.scan_repetitions,
+            )
+
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+
+    if options.output:
+
+        with open(options.output, "w", encoding="utf-8") as output_file:
+
+            output_file.write(output)
+
+    else:
+
+        print(output)
+
+    if options.baseline:
+
+        with open(options.baseline, encoding="utf-8") as baseline_file:
+
+            regressions = compare(results, json.load(baseline_file), options.max_regression)
+
+        for regression in regressions:
+
+            print(f"REGRESSÃO: {regression}", file=sys.stderr)
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -0,0 +1,326 @@
+"""Benchmark da inicialização da linha de comando (main.py)
+
+Mede, em processos novos, o tempo de importação de main.py (python -X importtime), o tempo até o menu
+ser mostrado e o tempo até o resultado da primeira listagem, e verifica que os módulos adiados
+(sqlite3, serviços, DAOs e perfilamento) não são importados antes do primeiro comando
+
+Uso
+---
+    python -m benchmarks.bench_startup --output inicializacao.json
+    python -m benchmarks.bench_startup --baseline inicializacao.json --max-regression 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+
+from benchmarks.seed import create_database
+
+
+# Diretório raiz do projeto, onde fica main.py
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que só devem ser importados quando o primeiro comando precisar do banco de dados
+DEFERRED_MODULES = (
+    "argparse",
+    "sqlite3",
+    "service_layer.service_factory",
+    "service_layer.task_service",
+    "service_layer.task_status_service",
+    "data_access_layer.dao.task_dao_impl",
+    "data_access_layer.migrations.migration_runner",
+    "presentation_layer.session_profiler",
+    "cProfile",
+)
+
+# Texto mostrado junto com o menu, aguardando a primeira escolha
+FIRST_PROMPT = b"Sua escolha: "
+
+# Texto mostrado logo após o resultado de um comando
+AFTER_RESULT = b"Pressione Enter para continuar..."
+
+
+def import_times() -> Tuple[float, Dict[str, float]]:
+
+    """Importa main.py em um processo novo com 'python -X importtime'
+
+    Returns
+    -------
+    Tuple[float, Dict[str, float]]
+        Tempo total da importação de main.py e tempo acumulado de cada módulo importado, em milissegundos
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=PROJECT_DIRECTORY, capture_output=True, text=True, check=True
+    )
+
+    modules = {}
+
+    # Linhas no formato "import time: <próprio> | <acumulado> | <módulo>", em microssegundos
+    for line in process.stderr.splitlines():
+
+        if not line.startswith("import time:"):
+
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|")
+
+        if cumulative.strip().isdigit():
+
+            modules[name.strip()] = int(cumulative) / 1000
+
+    return modules["main"], modules
+
+
+def time_until(stdin: bytes, marker: bytes, workdir: str) -> float:
+
+    """Executa main.py em um processo novo e mede o tempo até 'marker' aparecer na saída
+
+    Parameters
+    ----------
+    stdin: bytes
+        Entrada digitada pelo usuário
+    marker: bytes
+        Texto aguardado na saída
+    workdir: str
+        Diretório de trabalho, com o banco de dados em database/schema.db
+
+    Returns
+    -------
+    float
+        Tempo desde a criação do processo, em milissegundos
+    """
+
+    start = time.perf_counter()
+
+    process = subprocess.Popen(
+        [sys.executable, "-u", os.path.join(PROJECT_DIRECTORY, "main.py")],
+        cwd=workdir, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+
+    process.stdin.write(stdin)
+    process.stdin.close()
+
+    output = b""
+    elapsed = None
+
+    try:
+
+        while True:
+
+            chunk = os.read(process.stdout.fileno(), 65536)
+
+            if not chunk:
+
+                break
+
+            output += chunk
+
+            if marker in output:
+
+                elapsed = (time.perf_counter() - start) * 1000
+                break
+
+    finally:
+
+        # A sessão não precisa terminar normalmente: o processo é encerrado assim que o texto aparece
+        process.kill()
+        process.stdout.close()
+        process.wait()
+
+    if elapsed is None:
+
+        raise RuntimeError(f"Texto {marker!r} não encontrado na saída de main.py!")
+
+    return elapsed
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+
+    """Resume as medições de uma etapa
+
+    Parameters
+    ----------
+    values: List[float]
+        Tempos medidos, em milissegundos
+
+    Returns
+    -------
+    Dict[str, float]
+        Mediana e mínimo, em milissegundos
+    """
+
+    return {"p50_ms": statistics.median(values), "min_ms": min(values)}
+
+
+def run(repetitions: int, task_count: int, workdir: str) -> Tuple[Dict[str, Dict[str, float]], List[str], Dict[str, float]]:
+
+    """Executa as medições de inicialização
+
+    Parameters
+    ----------
+    repetitions: int
+        Quantidade de processos medidos por etapa
+    task_count: int
+        Quantidade de tarefas do banco de dados da primeira listagem
+    workdir: str
+        Diretório onde o banco de dados de teste é criado
+
+    Returns
+    -------
+    Tuple[Dict[str, Dict[str, float]], List[str], Dict[str, float]]
+        Medições por etapa, módulos adiados importados por main.py e os módulos mais lentos da importação
+    """
+
+    os.makedirs(os.path.join(workdir, "database"), exist_ok=True)
+    create_database(os.path.join(workdir, "database", "schema.db"), task_count)
+
+    import_totals = []
+
+    for _ in range(repetitions):
+
+        total, modules = import_times()
+        import_totals.append(total)
+
+    eager_modules = [module for module in DEFERRED_MODULES if module in modules]
+    slowest = dict(sorted(modules.items(), key=lambda item: -item[1])[:10])
+
+    # O processo extra aquece o cache de arquivos do sistema operacional
+    time_until(b"", FIRST_PROMPT, workdir)
+
+    first_prompt = [time_until(b"", FIRST_PROMPT, workdir) for _ in range(repetitions)]
+    # Lista a primeira página e volta ao menu
+    first_result = [time_until(b"2\n\n", AFTER_RESULT, workdir) for _ in range(repetitions)]
+
+    results = {
+        "import_main": _summary(import_totals),
+        "first_prompt": _summary(first_prompt),
+        "first_result": _summary(first_result),
+    }
+
+    return results, eager_modules, slowest
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+
+    """Compara o tempo mediano de cada etapa com o de uma execução de referência
+
+    Parameters
+    ----------
+    results: Dict[str, Any]
+        Resultados da execução atual
+    baseline: Dict[str, Any]
+        Resultados de referência
+    max_regression: float
+        Aumento relativo máximo aceito no tempo mediano (0.2 = 20%)
+
+    Returns
+    -------
+    List[str]
+        Descrição das etapas que ficaram mais lentas que o aceito
+    """
+
+    regressions = []
+
+    for stage, metrics in results["results"].items():
+
+        reference = baseline.get("results", {}).get(stage)
+
+        if reference is None or reference["p50_ms"] <= 0:
+
+            continue
+
+        change = metrics["p50_ms"] / reference["p50_ms"] - 1
+
+        if change > max_regression:
+
+            regressions.append(f"{stage}: p50 {reference['p50_ms']:.1f} ms -> {metrics['p50_ms']:.1f} ms (+{change:.0%})")
+
+    return regressions
+
+
+def main(arguments: List[str] = None) -> int:
+
+    """Executa o benchmark pela linha de comando
+
+    Parameters
+    ----------
+    arguments: List[str]
+        Argumentos da linha de comando. Se None, usa sys.argv
+
+    Returns
+    -------
+    int
+        Código de saída: 1 se algum módulo adiado foi importado por main.py ou se houve regressão
+        em relação à referência, 0 caso contrário
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark da inicialização do gerenciador de tarefas")
+    parser.add_argument("--repetitions", type=int, default=10, help="Processos medidos por etapa (padrão: 10)")
+    parser.add_argument("--tasks", type=int, default=1000, help="Tarefas do banco de dados de teste (padrão: 1000)")
+    parser.add_argument("--output", help="Arquivo JSON onde os resultados são gravados")
+    parser.add_argument("--baseline", help="Arquivo JSON de uma execução anterior, para detectar regressões")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Aumento relativo máximo aceito no p50 (padrão: 0.2)")
+
+    options = parser.parse_args(arguments)
+
+    with tempfile.TemporaryDirectory() as workdir:
+
+        stages, eager_modules, slowest = run(options.repetitions, options.tasks, workdir)
+
+    results = {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "tasks": options.tasks,
+        },
+        "results": stages,
+        "eager_modules": eager_modules,
+        "slowest_imports_ms": slowest,
+    }
+
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+
+    if options.output:
+
+        with open(options.output, "w", encoding="utf-8") as output_file:
+
+            output_file.write(output)
+
+    else:
+
+        print(output)
+
+    failed = False
+
+    for module in eager_modules:
+
+        print(f"IMPORTAÇÃO ANTECIPADA: {module} é importado por main.py", file=sys.stderr)
+        failed = True
+
+    if options.baseline:
+
+        with open(options.baseline, encoding="utf-8") as baseline_file:
+
+            regressions = compare(results, json.load(baseline_file), options.max_regression)
+
+        for regression in regressions:
+
+            print(f"REGRESSÃO: {regression}", file=sys.stderr)
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+
+    sys.exit(main())
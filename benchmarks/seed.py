@@ -0,0 +1,62 @@
+import os
+import sqlite3
+from typing import Iterator, Tuple
+
+
+from data_access_layer.migrations.migration_runner import MigrationRunner
+
+
+def _task_rows(task_count: int) -> Iterator[Tuple[str, str, int]]:
+
+    """Gera os dados das tarefas do banco de dados de teste
+
+    Parameters
+    ----------
+    task_count: int
+        Quantidade de tarefas geradas
+
+    Returns
+    -------
+    Iterator[Tuple[str, str, int]]
+        Triplas (nome, descrição, identificador do status), distribuídas entre os três status
+    """
+
+    for i in range(1, task_count + 1):
+
+        yield (f"Tarefa {i}", f"Descrição da tarefa {i}", i % 3 + 1)
+
+
+def create_database(filename: str, task_count: int) -> None:
+
+    """Cria um banco de dados SQLite com o esquema da aplicação e 'task_count' tarefas
+
+    Parameters
+    ----------
+    filename: str
+        Caminho do arquivo do banco de dados. Um arquivo existente é substituído
+    task_count: int
+        Quantidade de tarefas inseridas
+    """
+
+    if os.path.exists(filename):
+
+        os.remove(filename)
+
+    MigrationRunner(filename).migrate(include_offline=True)
+
+    connection = sqlite3.connect(filename)
+
+    try:
+
+        connection.execute("PRAGMA synchronous = OFF")
+
+        connection.executemany(
+            "INSERT INTO task(name, description, status_id) VALUES (?, ?, ?)",
+            _task_rows(task_count)
+        )
+
+        connection.commit()
+
+    finally:
+
+        connection.close()
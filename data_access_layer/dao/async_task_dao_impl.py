@@ -0,0 +1,104 @@
+from typing import AsyncIterator, Sequence, Tuple, Union
+
+
+from entities.task import Task
+from entities.task_status import TaskStatus
+from entities.task_table import TaskTable
+from data_access_layer.dao.task_dao_impl import TaskDAOImpl
+from data_access_layer.database_api_adapters.async_database_api_adapter import AsyncDatabaseAPIAdapter
+
+
+class AsyncTaskDAOImpl:
+
+    """
+    Versão assíncrona de TaskDAOImpl. Cada método é a corrotina correspondente ao método de mesmo nome de
+    data_access_layer.dao.task_dao.TaskDAO, executado fora do laço de eventos pelo adaptador assíncrono
+    """
+
+    def __init__(self, db_api_adapter: AsyncDatabaseAPIAdapter) -> None:
+
+        """Inicializa um objeto AsyncTaskDAOImpl
+        
+        Parameters
+        ----------
+        db_api_adapter: data_access_layer.database_api_adapters.async_database_api_adapter.AsyncDatabaseAPIAdapter
+            Adaptador assíncrono de API de banco de dados a ser utilizado
+        """
+
+        self._db_api_adapter = db_api_adapter
+        self._task_dao = TaskDAOImpl(db_api_adapter.sync_adapter)
+
+    async def insert(self, task: Task) -> int:
+
+        return await self._db_api_adapter.run(self._task_dao.insert, task)
+
+    async def insert_many(self, tasks: Sequence[Task]) -> None:
+
+        await self._db_api_adapter.run(self._task_dao.insert_many, tasks)
+
+    async def list_all(self) -> Union[Tuple[Task], None]:
+
+        return await self._db_api_adapter.run(self._task_dao.list_all)
+
+    async def iter_all(self, batch_size: int = 1000) -> AsyncIterator[Task]:
+
+        # Cada lote é uma página obtida por chave, liberando a thread de trabalho entre os lotes
+        after_id = None
+
+        while True:
+
+            tasks = await self.list_page(batch_size, after_id)
+
+            if not tasks:
+
+                return
+
+            for task in tasks:
+
+                yield task
+
+            after_id = tasks[-1].id
+
+    async def fetch_columns(self, status_id: Union[int, None] = None, batch_size: int = 1000) -> TaskTable:
+
+        return await self._db_api_adapter.run(self._task_dao.fetch_columns, status_id, batch_size)
+
+    async def list_page(self, limit: int, after_id: Union[int, None] = None) -> Union[Tuple[Task], None]:
+
+        return await self._db_api_adapter.run(self._task_dao.list_page, limit, after_id)
+
+    async def list_by_status(self, status_id: int) -> Union[Tuple[Task], None]:
+
+        return await self._db_api_adapter.run(self._task_dao.list_by_status, status_id)
+
+    async def count_by_status(self) -> Tuple[Tuple[TaskStatus, int]]:
+
+        return await self._db_api_adapter.run(self._task_dao.count_by_status)
+
+    async def search(self, query: str, limit: int) -> Union[Tuple[Task], None]:
+
+        return await self._db_api_adapter.run(self._task_dao.search, query, limit)
+
+    async def get_by_id(self, task_id: int) -> Union[Task, None]:
+
+        return await self._db_api_adapter.run(self._task_dao.get_by_id, task_id)
+
+    async def exists(self, task_id: int) -> bool:
+
+        return await self._db_api_adapter.run(self._task_dao.exists, task_id)
+
+    async def delete(self, task_id: int) -> None:
+
+        await self._db_api_adapter.run(self._task_dao.delete, task_id)
+
+    async def delete_many(self, task_ids: Sequence[int]) -> None:
+
+        await self._db_api_adapter.run(self._task_dao.delete_many, task_ids)
+
+    async def update_status(self, task_id: int, status: TaskStatus) -> None:
+
+        await self._db_api_adapter.run(self._task_dao.update_status, task_id, status)
+
+    async def update_status_many(self, updates: Sequence[Tuple[int, TaskStatus]]) -> None:
+
+        await self._db_api_adapter.run(self._task_dao.update_status_many, updates)
@@ -0,0 +1,39 @@
+from typing import Tuple, Union
+
+
+from entities.task_status import TaskStatus
+from data_access_layer.dao.task_status_dao_impl import TaskStatusDAOImpl
+from data_access_layer.database_api_adapters.async_database_api_adapter import AsyncDatabaseAPIAdapter
+
+
+class AsyncTaskStatusDAOImpl:
+
+    """
+    Versão assíncrona de TaskStatusDAOImpl. Cada método é a corrotina correspondente ao método de mesmo nome de
+    data_access_layer.dao.task_status_dao.TaskStatusDAO, executado fora do laço de eventos pelo adaptador assíncrono
+    """
+
+    def __init__(self, db_api_adapter: AsyncDatabaseAPIAdapter) -> None:
+
+        """Inicializa um objeto AsyncTaskStatusDAOImpl
+        
+        Parameters
+        ----------
+        db_api_adapter: data_access_layer.database_api_adapters.async_database_api_adapter.AsyncDatabaseAPIAdapter
+            Adaptador assíncrono de API de banco de dados a ser utilizado
+        """
+
+        self._db_api_adapter = db_api_adapter
+        self._task_status_dao = TaskStatusDAOImpl(db_api_adapter.sync_adapter)
+
+    async def list_all(self) -> Union[Tuple[TaskStatus], None]:
+
+        return await self._db_api_adapter.run(self._task_status_dao.list_all)
+
+    async def get_by_name(self, status_name: str) -> Union[TaskStatus, None]:
+
+        return await self._db_api_adapter.run(self._task_status_dao.get_by_name, status_name)
+
+    async def get_by_id(self, status_id: int) -> Union[TaskStatus, None]:
+
+        return await self._db_api_adapter.run(self._task_status_dao.get_by_id, status_id)
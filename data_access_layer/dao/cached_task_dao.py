@@ -0,0 +1,479 @@
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import Callable, ContextManager, Dict, Iterator, Sequence, Tuple, Union
+
+
+from entities.task import Task
+from entities.task_status import TaskStatus
+from entities.task_table import TaskTable
+from data_access_layer.dao.task_dao import TaskDAO
+
+
+# Entrada do cache: tarefa, instante de expiração (None se não expira) e tamanho aproximado em bytes
+_TaskCacheEntry = Tuple[Task, Union[float, None], int]
+
+
+class CachedTaskDAO(TaskDAO):
+
+    """
+    Decorador de um TaskDAO que mantém em memória as tarefas lidas por 'get_by_id' (cache read-through).
+    O cache é limitado pela quantidade de entradas e, opcionalmente, por um orçamento aproximado de memória;
+    ao atingir o limite, as tarefas usadas há mais tempo são descartadas (LRU). As escritas feitas por meio
+    deste DAO invalidam as tarefas afetadas.
+
+    As tarefas em cache são compartilhadas entre as consultas e não devem ser alteradas pelo chamador.
+    Escritas feitas por outros caminhos só são percebidas após a expiração da entrada ('ttl').
+
+    Enquanto a transação de uma escrita não é confirmada, outras conexões ainda leem a versão anterior da tarefa
+    e podem armazená-la. Por isso, as escritas devem ocorrer dentro de 'deferred_invalidation', envolvendo a
+    transação mais externa, para que as tarefas escritas sejam descartadas novamente após a confirmação
+    """
+
+    def __init__(self, task_dao: TaskDAO, max_entries: int = 1024, max_memory_bytes: Union[int, None] = None,
+                 ttl: Union[float, None] = None) -> None:
+
+        """Inicializa um objeto CachedTaskDAO
+
+        Parameters
+        ----------
+        task_dao: data_access_layer.dao.task_dao.TaskDAO
+            DAO decorado, consultado quando a tarefa não está em cache
+        max_entries: int
+            Quantidade máxima de tarefas em cache (padrão: 1024)
+        max_memory_bytes: Union[int, None]
+            Memória aproximada máxima ocupada pelas tarefas em cache, em bytes. Se None, não há limite de memória
+        ttl: Union[float, None]
+            Tempo, em segundos, após o qual uma tarefa em cache é lida novamente. Se None, as tarefas não expiram
+        """
+
+        if not isinstance(max_entries, int) or max_entries <= 0:
+
+            raise ValueError("A quantidade máxima de entradas deve ser um número inteiro positivo!")
+
+        if max_memory_bytes is not None and (not isinstance(max_memory_bytes, int) or max_memory_bytes <= 0):
+
+            raise ValueError("O orçamento de memória deve ser um número inteiro positivo!")
+
+        if ttl is not None and (not isinstance(ttl, (int, float)) or ttl <= 0):
+
+            raise ValueError("O tempo de expiração deve ser um número positivo!")
+
+        self._task_dao = task_dao
+        self._max_entries = max_entries
+        self._max_memory_bytes = max_memory_bytes
+        self._ttl = ttl
+
+        self._lock = Lock()
+        self._entries: 'OrderedDict[int, _TaskCacheEntry]' = OrderedDict()
+        self._memory_bytes = 0
+
+        # Incrementado a cada invalidação, para descartar leituras iniciadas antes dela
+        self._version = 0
+
+        # Por thread: profundidade de 'deferred_invalidation' e tarefas escritas no bloco mais externo
+        self._local = local()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def hits(self) -> int:
+
+        """Quantidade de consultas respondidas pelo cache
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+
+        """Quantidade de consultas que precisaram acessar o DAO decorado
+        """
+
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+
+        """Quantidade de tarefas descartadas por falta de espaço ou por expiração
+        """
+
+        return self._evictions
+
+    @property
+    def memory_bytes(self) -> int:
+
+        """Memória aproximada ocupada pelas tarefas em cache, em bytes
+        """
+
+        return self._memory_bytes
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+    def statistics(self) -> Dict[str, int]:
+
+        """Obtém os contadores do cache
+
+        Returns
+        -------
+        Dict[str, int]
+            Acertos, faltas, descartes, quantidade de entradas e memória aproximada em bytes
+        """
+
+        with self._lock:
+
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+            }
+
+    def invalidate(self, task_id: Union[int, None] = None) -> None:
+
+        """Descarta uma tarefa em cache ou, se 'task_id' for None, todas elas
+
+        Parameters
+        ----------
+        task_id: Union[int, None]
+            Identificador da tarefa descartada
+        """
+
+        with self._lock:
+
+            self._version += 1
+
+            if task_id is None:
+
+                self._entries.clear()
+                self._memory_bytes = 0
+
+            else:
+
+                self._discard(task_id)
+
+    def _invalidate_many(self, task_ids: Sequence[int]) -> None:
+
+        """Descarta várias tarefas em cache
+
+        Parameters
+        ----------
+        task_ids: Sequence[int]
+            Identificadores das tarefas descartadas
+        """
+
+        with self._lock:
+
+            self._version += 1
+
+            for task_id in task_ids:
+
+                self._discard(task_id)
+
+    @contextmanager
+    def deferred_invalidation(self) -> Iterator[None]:
+
+        """Descarta novamente, na saída do bloco 'with' mais externo, as tarefas escritas pela thread dentro dele.
+        Deve envolver a transação das escritas, para que o descarte ocorra após a sua confirmação ou desfazimento
+
+        Returns
+        -------
+        Iterator[None]
+            Gerenciador de contexto
+        """
+
+        state = self._local
+        depth = getattr(state, "depth", 0)
+
+        if depth == 0:
+
+            state.written = set()
+
+        state.depth = depth + 1
+
+        try:
+
+            yield
+
+        finally:
+
+            state.depth = depth
+
+            if depth == 0:
+
+                written = state.written
+                state.written = None
+
+                if written:
+
+                    self._invalidate_many(list(written))
+
+    @contextmanager
+    def write_transaction(self, transaction: Callable[[], ContextManager[None]]) -> Iterator[None]:
+
+        """Abre uma transação de escrita dentro de 'deferred_invalidation': as tarefas escritas são descartadas
+        do cache novamente após a confirmação, pois leituras por outras conexões podem ter armazenado a versão anterior
+
+        Parameters
+        ----------
+        transaction: Callable[[], ContextManager[None]]
+            Cria a transação do banco de dados, como 'transaction' do adaptador
+
+        Returns
+        -------
+        Iterator[None]
+            Gerenciador de contexto da transação
+        """
+
+        with self.deferred_invalidation(), transaction():
+
+            yield
+
+    def _invalidate_written(self, task_ids: Sequence[int]) -> None:
+
+        """Descarta as tarefas afetadas por uma escrita e, dentro de 'deferred_invalidation', registra-as
+        para um novo descarte após a transação
+
+        Parameters
+        ----------
+        task_ids: Sequence[int]
+            Identificadores das tarefas escritas
+        """
+
+        self._invalidate_many(task_ids)
+
+        written = getattr(self._local, "written", None)
+
+        if written is not None:
+
+            written.update(task_ids)
+
+    def _discard(self, task_id: int) -> None:
+
+        """Remove uma entrada do cache. Deve ser chamado com o lock adquirido
+
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa
+        """
+
+        entry = self._entries.pop(task_id, None)
+
+        if entry is not None:
+
+            self._memory_bytes -= entry[2]
+
+    @staticmethod
+    def _estimate_size(task: Task) -> int:
+
+        """Estima a memória ocupada por uma tarefa. O status é compartilhado entre as tarefas e não é contado
+
+        Parameters
+        ----------
+        task: entities.task.Task
+            Tarefa
+
+        Returns
+        -------
+        int
+            Tamanho aproximado em bytes
+        """
+
+        return sys.getsizeof(task) + sys.getsizeof(task.name) + sys.getsizeof(task.description)
+
+    def _store(self, task: Task, version: int) -> None:
+
+        """Armazena uma tarefa lida do DAO decorado, descartando as menos usadas se o limite for excedido
+
+        Parameters
+        ----------
+        task: entities.task.Task
+            Tarefa lida
+        version: int
+            Versão do cache no início da leitura. Se houve invalidação desde então, a tarefa não é armazenada
+        """
+
+        size = self._estimate_size(task)
+
+        if self._max_memory_bytes is not None and size > self._max_memory_bytes:
+
+            return
+
+        expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+
+        with self._lock:
+
+            if version != self._version:
+
+                return
+
+            self._discard(task.id)
+
+            self._entries[task.id] = (task, expires_at, size)
+            self._memory_bytes += size
+
+            while len(self._entries) > self._max_entries or (
+                self._max_memory_bytes is not None and self._memory_bytes > self._max_memory_bytes
+            ):
+
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+
+                self._memory_bytes -= evicted_size
+                self._evictions += 1
+
+    def _lookup(self, task_id: int) -> Union[Task, None]:
+
+        """Busca uma tarefa no cache, descartando-a se tiver expirado. Deve ser chamado com o lock adquirido
+
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa
+
+        Returns
+        -------
+        Union[entities.task.Task, None]
+            Tarefa em cache ou None se ela não estiver em cache
+        """
+
+        entry = self._entries.get(task_id)
+
+        if entry is None:
+
+            return None
+
+        if entry[1] is not None and entry[1] <= time.monotonic():
+
+            self._discard(task_id)
+            self._evictions += 1
+
+            return None
+
+        self._entries.move_to_end(task_id)
+
+        return entry[0]
+
+    def get_by_id(self, task_id: int) -> Union[Task, None]:
+
+        with self._lock:
+
+            task = self._lookup(task_id)
+
+            if task is not None:
+
+                self._hits += 1
+
+                return task
+
+            self._misses += 1
+
+            version = self._version
+
+        task = self._task_dao.get_by_id(task_id)
+
+        if task is not None:
+
+            self._store(task, version)
+
+        return task
+
+    def exists(self, task_id: int) -> bool:
+
+        with self._lock:
+
+            if self._lookup(task_id) is not None:
+
+                return True
+
+        return self._task_dao.exists(task_id)
+
+    def insert(self, task: Task) -> int:
+
+        task_id = self._task_dao.insert(task)
+
+        self._invalidate_inserted((task,))
+
+        return task_id
+
+    def insert_many(self, tasks: Sequence[Task]) -> None:
+
+        self._task_dao.insert_many(tasks)
+
+        self._invalidate_inserted(tasks)
+
+    def _invalidate_inserted(self, tasks: Sequence[Task]) -> None:
+
+        """Descarta as tarefas gravadas com um ID informado. Tarefas novas (ID 0) não invalidam nada,
+        pois tarefas inexistentes nunca são mantidas em cache
+
+        Parameters
+        ----------
+        tasks: Sequence[entities.task.Task]
+            Tarefas gravadas
+        """
+
+        task_ids = [task.id for task in tasks if task.id]
+
+        if task_ids:
+
+            self._invalidate_written(task_ids)
+
+    def list_all(self) -> Union[Tuple[Task], None]:
+
+        return self._task_dao.list_all()
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Task]:
+
+        return self._task_dao.iter_all(batch_size)
+
+    def fetch_columns(self, status_id: Union[int, None] = None, batch_size: int = 1000) -> TaskTable:
+
+        return self._task_dao.fetch_columns(status_id, batch_size)
+
+    def list_page(self, limit: int, after_id: Union[int, None] = None) -> Union[Tuple[Task], None]:
+
+        return self._task_dao.list_page(limit, after_id)
+
+    def list_by_status(self, status_id: int) -> Union[Tuple[Task], None]:
+
+        return self._task_dao.list_by_status(status_id)
+
+    def count_by_status(self) -> Tuple[Tuple[TaskStatus, int]]:
+
+        return self._task_dao.count_by_status()
+
+    def search(self, query: str, limit: int) -> Union[Tuple[Task], None]:
+
+        return self._task_dao.search(query, limit)
+
+    def delete(self, task_id: int) -> None:
+
+        self._task_dao.delete(task_id)
+
+        self._invalidate_written((task_id,))
+
+    def delete_many(self, task_ids: Sequence[int]) -> None:
+
+        self._task_dao.delete_many(task_ids)
+
+        self._invalidate_written(task_ids)
+
+    def update_status(self, task_id: int, status: TaskStatus) -> None:
+
+        self._task_dao.update_status(task_id, status)
+
+        self._invalidate_written((task_id,))
+
+    def update_status_many(self, updates: Sequence[Tuple[int, TaskStatus]]) -> None:
+
+        self._task_dao.update_status_many(updates)
+
+        self._invalidate_written([task_id for task_id, _ in updates])
@@ -0,0 +1,83 @@
+from threading import Lock
+from typing import Dict, Tuple, Union
+
+
+from entities.task_status import TaskStatus
+from data_access_layer.dao.task_status_dao import TaskStatusDAO
+
+
+_StatusCache = Tuple[Union[Tuple[TaskStatus], None], Dict[int, TaskStatus], Dict[str, TaskStatus]]
+
+
+class CachedTaskStatusDAO(TaskStatusDAO):
+
+    """
+    Decorador de um TaskStatusDAO que mantém todos os status da tarefa em memória.
+    A tabela de status é pequena e raramente muda, então ela é carregada uma única vez
+    e as consultas seguintes não acessam o banco de dados até que 'invalidate' seja chamado
+    """
+
+    def __init__(self, task_status_dao: TaskStatusDAO) -> None:
+
+        """Inicializa um objeto CachedTaskStatusDAO
+        
+        Parameters
+        ----------
+        task_status_dao: data_access_layer.dao.task_status_dao.TaskStatusDAO
+            DAO decorado, consultado apenas quando o cache está vazio
+        """
+
+        self._task_status_dao = task_status_dao
+        self._lock = Lock()
+        self._cache: Union[_StatusCache, None] = None
+
+    def invalidate(self) -> None:
+
+        """Descarta os status em memória, forçando uma nova leitura do banco de dados na próxima consulta
+        """
+
+        with self._lock:
+
+            self._cache = None
+
+    def _load(self) -> '_StatusCache':
+
+        """Obtém os status em memória, carregando-os do DAO decorado caso ainda não tenham sido carregados
+
+        Returns
+        -------
+        _StatusCache
+            Todos os status, os status indexados pelo identificador e os status indexados pelo nome
+        """
+
+        cache = self._cache
+
+        if cache is not None:
+
+            return cache
+
+        with self._lock:
+
+            if self._cache is None:
+
+                all_status = self._task_status_dao.list_all()
+
+                self._cache = (
+                    all_status,
+                    {status.id: status for status in all_status or ()},
+                    {status.name: status for status in all_status or ()},
+                )
+
+            return self._cache
+
+    def list_all(self) -> Union[Tuple[TaskStatus], None]:
+
+        return self._load()[0]
+
+    def get_by_name(self, status_name: str) -> Union[TaskStatus, None]:
+
+        return self._load()[2].get(status_name)
+
+    def get_by_id(self, status_id: int) -> Union[TaskStatus, None]:
+
+        return self._load()[1].get(status_id)
@@ -0,0 +1,431 @@
+import re
+from bisect import bisect_right
+from typing import Iterator, List, Sequence, Set, Tuple, Union
+
+
+from entities.task import Task
+from entities.task_status import TaskStatus
+from entities.task_table import TaskTable
+from data_access_layer.dao.task_dao import TaskDAO
+from data_access_layer.database_api_adapters.in_memory_database import InMemoryDatabase, words
+
+
+# Termo de uma busca: texto entre aspas (aspas internas duplicadas) ou palavra, seguido opcionalmente de '*'
+_SEARCH_TERM = re.compile(r'"((?:[^"]|"")*)"(\*?)|([^\s"*]+)(\*?)')
+
+
+class InMemoryTaskDAO(TaskDAO):
+
+    def __init__(self, database: InMemoryDatabase) -> None:
+
+        """Inicializa um objeto InMemoryTaskDAO
+
+        Parameters
+        ----------
+        database: data_access_layer.database_api_adapters.in_memory_database.InMemoryDatabase
+            Banco de dados em memória a ser utilizado
+        """
+
+        self._database = database
+
+    def insert(self, task: Task) -> int:
+
+        self.insert_many((task,))
+
+        return self._database.last_task_id
+
+    def insert_many(self, tasks: Sequence[Task]) -> None:
+
+        database = self._database
+
+        # As tarefas são gravadas em uma única transação, como em 'execute_many'
+        with database.transaction():
+
+            for task in tasks:
+
+                status_id = task.status.id
+
+                if status_id not in database.statuses:
+
+                    raise ValueError(f"Status '{status_id}' não encontrado!")
+
+                database.last_task_id += 1
+                task_id = database.last_task_id
+
+                database.add_task_row(task_id, (task.name, task.description, status_id))
+
+                database.log_undo(lambda task_id=task_id: self._undo_insert(task_id))
+
+    def _undo_insert(self, task_id: int) -> None:
+
+        """Desfaz a gravação de uma tarefa
+
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa gravada
+        """
+
+        self._database.remove_task_row(task_id)
+
+        self._database.last_task_id = task_id - 1
+
+    def list_all(self) -> Union[Tuple[Task], None]:
+
+        with self._database.lock:
+
+            return self._to_tasks(self._database.task_ids)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Task]:
+
+        # Cada lote é uma página obtida por chave, como em AsyncTaskDAOImpl.iter_all
+        after_id = None
+
+        while True:
+
+            tasks = self.list_page(batch_size, after_id)
+
+            if not tasks:
+
+                return
+
+            yield from tasks
+
+            after_id = tasks[-1].id
+
+    def fetch_columns(self, status_id: Union[int, None] = None, batch_size: int = 1000) -> TaskTable:
+
+        # As linhas já estão em memória: 'batch_size' não se aplica
+        database = self._database
+
+        with database.lock:
+
+            if status_id is None:
+
+                task_ids = database.task_ids
+
+            else:
+
+                task_ids = sorted(database.task_ids_by_status.get(status_id, ()))
+
+            return TaskTable._from_rows(self._iter_rows(task_ids))
+
+    def _iter_rows(self, task_ids: Sequence[int]) -> Iterator[Tuple[int, str, str, int, str]]:
+
+        """Percorre as linhas de tarefas no formato da junção entre 'task' e 'task_status'
+
+        Parameters
+        ----------
+        task_ids: Sequence[int]
+            Identificadores de tarefas existentes
+
+        Returns
+        -------
+        Iterator[Tuple[int, str, str, int, str]]
+            Linhas (id, nome, descrição, id do status, nome do status)
+        """
+
+        tasks = self._database.tasks
+        statuses = self._database.statuses
+
+        for task_id in task_ids:
+
+            name, description, status_id = tasks[task_id]
+
+            yield task_id, name, description, status_id, statuses[status_id].name
+
+    def list_page(self, limit: int, after_id: Union[int, None] = None) -> Union[Tuple[Task], None]:
+
+        with self._database.lock:
+
+            task_ids = self._database.task_ids
+
+            # Busca binária pelo início da página na lista ordenada de identificadores
+            start = 0 if after_id is None else bisect_right(task_ids, after_id)
+
+            return self._to_tasks(task_ids[start:start + limit])
+
+    def list_by_status(self, status_id: int) -> Union[Tuple[Task], None]:
+
+        with self._database.lock:
+
+            return self._to_tasks(sorted(self._database.task_ids_by_status.get(status_id, ())))
+
+    def count_by_status(self) -> Tuple[Tuple[TaskStatus, int]]:
+
+        database = self._database
+
+        with database.lock:
+
+            return tuple([
+                (status, len(database.task_ids_by_status.get(status_id, ())))
+                for status_id, status in sorted(database.statuses.items())
+            ])
+
+    def search(self, query: str, limit: int) -> Union[Tuple[Task], None]:
+
+        database = self._database
+        terms = _parse_search(query)
+
+        if not terms:
+
+            return None
+
+        with database.lock:
+
+            candidates: Union[Set[int], None] = None
+
+            # Cada palavra da busca precisa aparecer na tarefa; a busca começa pela palavra menos frequente
+            for word, prefix in sorted(terms, key=lambda term: self._count_matches(*term)):
+
+                matches = self._match(word, prefix)
+                candidates = matches if candidates is None else candidates & matches
+
+                if not candidates:
+
+                    return None
+
+            # Relevância: ocorrências no nome pesam mais que na descrição, como em TaskDAOImpl.search, e
+            # no empate vêm primeiro os textos mais curtos, como na normalização pelo tamanho do BM25
+            def relevance(task_id: int) -> Tuple[int, int, int]:
+
+                name, description, _ = database.tasks[task_id]
+                name_words, description_words = words(name), words(description)
+
+                score = 10 * _count_occurrences(name_words, terms) + _count_occurrences(description_words, terms)
+
+                return -score, 10 * len(name_words) + len(description_words), task_id
+
+            return self._to_tasks(sorted(candidates, key=relevance)[:limit])
+
+    def _match(self, word: str, prefix: bool) -> Set[int]:
+
+        """Obtém as tarefas que contêm uma palavra
+
+        Parameters
+        ----------
+        word: str
+            Palavra normalizada
+        prefix: bool
+            Se True, também considera as palavras que começam com 'word'
+
+        Returns
+        -------
+        Set[int]
+            Identificadores das tarefas
+        """
+
+        task_ids_by_word = self._database.task_ids_by_word
+
+        if not prefix:
+
+            return set(task_ids_by_word.get(word, ()))
+
+        matches: Set[int] = set()
+
+        for indexed_word, task_ids in task_ids_by_word.items():
+
+            if indexed_word.startswith(word):
+
+                matches |= task_ids
+
+        return matches
+
+    def _count_matches(self, word: str, prefix: bool) -> int:
+
+        """Estima a quantidade de tarefas que contêm uma palavra, para ordenar os termos da busca
+
+        Parameters
+        ----------
+        word: str
+            Palavra normalizada
+        prefix: bool
+            Se a palavra é buscada como prefixo
+
+        Returns
+        -------
+        int
+            Quantidade de tarefas com a palavra exata (prefixos são avaliados por último)
+        """
+
+        if prefix:
+
+            return len(self._database.tasks)
+
+        return len(self._database.task_ids_by_word.get(word, ()))
+
+    def get_by_id(self, task_id: int) -> Union[Task, None]:
+
+        with self._database.lock:
+
+            if task_id not in self._database.tasks:
+
+                return None
+
+            return self._to_task(task_id)
+
+    def exists(self, task_id: int) -> bool:
+
+        return task_id in self._database.tasks
+
+    def delete(self, task_id: int) -> None:
+
+        self.delete_many((task_id,))
+
+    def delete_many(self, task_ids: Sequence[int]) -> None:
+
+        database = self._database
+
+        with database.transaction():
+
+            for task_id in task_ids:
+
+                # Assim como no SQL, remover uma tarefa inexistente não tem efeito
+                if task_id not in database.tasks:
+
+                    continue
+
+                row = database.remove_task_row(task_id)
+
+                database.log_undo(lambda task_id=task_id, row=row: database.add_task_row(task_id, row))
+
+    def update_status(self, task_id: int, status: TaskStatus) -> None:
+
+        self.update_status_many(((task_id, status),))
+
+    def update_status_many(self, updates: Sequence[Tuple[int, TaskStatus]]) -> None:
+
+        database = self._database
+
+        with database.transaction():
+
+            for task_id, status in updates:
+
+                if task_id not in database.tasks:
+
+                    continue
+
+                if status.id not in database.statuses:
+
+                    raise ValueError(f"Status '{status.id}' não encontrado!")
+
+                self._set_status(task_id, status.id)
+
+    def _set_status(self, task_id: int, status_id: int) -> None:
+
+        """Altera o status de uma tarefa, atualizando o índice por status
+
+        Parameters
+        ----------
+        task_id: int
+            Identificador de uma tarefa existente
+        status_id: int
+            Identificador do novo status
+        """
+
+        database = self._database
+
+        name, description, old_status_id = database.tasks[task_id]
+
+        database.tasks[task_id] = (name, description, status_id)
+
+        database.task_ids_by_status[old_status_id].discard(task_id)
+        database.task_ids_by_status.setdefault(status_id, set()).add(task_id)
+
+        database.log_undo(lambda: self._set_status(task_id, old_status_id))
+
+    def _to_task(self, task_id: int) -> Task:
+
+        """Converte uma linha da tabela de tarefas em um objeto Task
+
+        Parameters
+        ----------
+        task_id: int
+            Identificador de uma tarefa existente
+
+        Returns
+        -------
+        entities.task.Task
+            Objeto Task com os dados da tarefa
+        """
+
+        name, description, status_id = self._database.tasks[task_id]
+
+        return Task._from_row(task_id, name, description, self._database.statuses[status_id])
+
+    def _to_tasks(self, task_ids: Sequence[int]) -> Union[Tuple[Task], None]:
+
+        """Converte várias linhas da tabela de tarefas em objetos Task
+
+        Parameters
+        ----------
+        task_ids: Sequence[int]
+            Identificadores de tarefas existentes
+
+        Returns
+        -------
+        Union[Tuple[entities.task.Task], None]
+            Objetos Task, na ordem dos identificadores, ou None se não houver identificadores
+        """
+
+        if not task_ids:
+
+            return None
+
+        return tuple([self._to_task(task_id) for task_id in task_ids])
+
+
+def _parse_search(query: str) -> List[Tuple[str, bool]]:
+
+    """Converte uma busca no subconjunto da sintaxe do FTS5 usado por TaskService.search_tasks
+    (termos entre aspas ou não, opcionalmente seguidos de '*') em palavras normalizadas
+
+    Parameters
+    ----------
+    query: str
+        Busca no formato do FTS5
+
+    Returns
+    -------
+    List[Tuple[str, bool]]
+        Pares (palavra, se é buscada como prefixo)
+    """
+
+    terms = []
+
+    for quoted, quoted_prefix, bare, bare_prefix in _SEARCH_TERM.findall(query):
+
+        term_words = words(quoted.replace('""', '"') or bare)
+
+        # Como no FTS5, o '*' se aplica à última palavra do termo
+        terms.extend([(word, False) for word in term_words[:-1]])
+
+        if term_words:
+
+            terms.append((term_words[-1], bool(quoted_prefix or bare_prefix)))
+
+    return terms
+
+
+def _count_occurrences(text_words: List[str], terms: List[Tuple[str, bool]]) -> int:
+
+    """Conta as ocorrências das palavras da busca em um texto
+
+    Parameters
+    ----------
+    text_words: List[str]
+        Palavras normalizadas do texto
+    terms: List[Tuple[str, bool]]
+        Palavras da busca e se cada uma é buscada como prefixo
+
+    Returns
+    -------
+    int
+        Quantidade de palavras do texto que correspondem a algum termo
+    """
+
+    return sum([
+        1 for text_word in text_words
+        if any(text_word.startswith(word) if prefix else text_word == word for word, prefix in terms)
+    ])
+
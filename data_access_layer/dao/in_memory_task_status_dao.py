@@ -0,0 +1,37 @@
+from typing import Tuple, Union
+
+
+from entities.task_status import TaskStatus
+from data_access_layer.dao.task_status_dao import TaskStatusDAO
+from data_access_layer.database_api_adapters.in_memory_database import InMemoryDatabase
+
+
+class InMemoryTaskStatusDAO(TaskStatusDAO):
+
+    def __init__(self, database: InMemoryDatabase) -> None:
+
+        """Inicializa um objeto InMemoryTaskStatusDAO
+
+        Parameters
+        ----------
+        database: data_access_layer.database_api_adapters.in_memory_database.InMemoryDatabase
+            Banco de dados em memória a ser utilizado
+        """
+
+        self._database = database
+
+    def list_all(self) -> Union[Tuple[TaskStatus], None]:
+
+        if not self._database.statuses:
+
+            return None
+
+        return tuple(self._database.statuses.values())
+
+    def get_by_name(self, status_name: str) -> Union[TaskStatus, None]:
+
+        return self._database.statuses_by_name.get(status_name)
+
+    def get_by_id(self, status_id: int) -> Union[TaskStatus, None]:
+
+        return self._database.statuses.get(status_id)
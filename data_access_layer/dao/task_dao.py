@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Union
+from typing import Iterator, Sequence, Tuple, Union
 
 
 from entities.task import Task
 from entities.task_status import TaskStatus
+from entities.task_table import TaskTable
 
 
 class TaskDAO(ABC):
@@ -13,7 +14,7 @@ class TaskDAO(ABC):
     """
 
     @abstractmethod
-    def insert(self, task: Task) -> None:
+    def insert(self, task: Task) -> int:
         
         """Cria uma nova tarefa no banco de dados, a partir dos dados de 'task'
 
@@ -21,6 +22,24 @@ class TaskDAO(ABC):
         ----------
         task: entities.task.Task
             Objeto Task com os dados a serem armazenados no banco de dados
+
+        Returns
+        -------
+        int
+            Identificador gerado para a nova tarefa
+        """
+
+        pass
+
+    @abstractmethod
+    def insert_many(self, tasks: Sequence[Task]) -> None:
+
+        """Cria novas tarefas no banco de dados em uma única transação, a partir dos dados de 'tasks'
+
+        Parameters
+        ----------
+        tasks: Sequence[entities.task.Task]
+            Objetos Task com os dados a serem armazenados no banco de dados
         """
 
         pass
@@ -38,6 +57,151 @@ class TaskDAO(ABC):
 
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Task]:
+
+        """Percorre todas as tarefas do banco de dados sob demanda, sem carregá-las todas em memória
+
+        Parameters
+        ----------
+        batch_size: int
+            Quantidade de tarefas lidas do banco de dados por vez
+
+        Returns
+        -------
+        Iterator[entities.task.Task] 
+            Objetos Task com os dados armazenados no banco de dados
+        """
+
+        pass
+
+    @abstractmethod
+    def fetch_columns(self, status_id: Union[int, None] = None, batch_size: int = 1000) -> TaskTable:
+
+        """Lê as tarefas do banco de dados em formato colunar, sem criar um objeto Task por tarefa
+
+        Parameters
+        ----------
+        status_id: Union[int, None]
+            Identificador do status das tarefas a serem lidas. Se None, lê todas as tarefas
+        batch_size: int
+            Quantidade de tarefas lidas do banco de dados por vez
+
+        Returns
+        -------
+        entities.task_table.TaskTable
+            Tabela com as tarefas, ordenadas pelo identificador (vazia se não houver tarefas)
+        """
+
+        pass
+
+    @abstractmethod
+    def list_page(self, limit: int, after_id: Union[int, None] = None) -> Union[Tuple[Task], None]:
+
+        """Lista uma página de tarefas do banco de dados, ordenadas pelo identificador (paginação por chave)
+
+        Parameters
+        ----------
+        limit: int
+            Quantidade máxima de tarefas da página
+        after_id: Union[int, None]
+            Identificador da última tarefa da página anterior. Se None, lista a primeira página
+
+        Returns
+        -------
+        Union[Tuple[entities.task.Task], None] 
+            Objetos Task da página, ou None se não houver tarefas após 'after_id'
+        """
+
+        pass
+
+    @abstractmethod
+    def list_by_status(self, status_id: int) -> Union[Tuple[Task], None]:
+
+        """Lista as tarefas do banco de dados que possuem um determinado status
+
+        Parameters
+        ----------
+        status_id: int
+            Identificador do status das tarefas a serem listadas
+
+        Returns
+        -------
+        Union[Tuple[entities.task.Task], None] 
+            Objetos Task com o status especificado, ordenados pelo identificador
+        """
+
+        pass
+
+    @abstractmethod
+    def count_by_status(self) -> Tuple[Tuple[TaskStatus, int]]:
+
+        """Conta as tarefas do banco de dados agrupadas por status
+
+        Returns
+        -------
+        Tuple[Tuple[entities.task_status.TaskStatus, int]]
+            Pares (status, quantidade de tarefas) para cada status cadastrado, inclusive os sem tarefas
+        """
+
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> Union[Tuple[Task], None]:
+
+        """Busca tarefas pelo texto do nome e da descrição, usando o índice de busca textual
+
+        Parameters
+        ----------
+        query: str
+            Consulta na sintaxe de busca textual do SGBD (no SQLite, a sintaxe do FTS5)
+        limit: int
+            Quantidade máxima de tarefas retornadas
+
+        Returns
+        -------
+        Union[Tuple[entities.task.Task], None] 
+            Objetos Task encontrados, dos mais aos menos relevantes, ou None se nenhuma tarefa for encontrada
+        """
+
+        pass
+
+    @abstractmethod
+    def get_by_id(self, task_id: int) -> Union[Task, None]:
+
+        """Obtém uma tarefa do banco de dados, a partir do seu identificador
+
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa a ser obtida
+
+        Returns
+        -------
+        Union[entities.task.Task, None] 
+            Objeto Task com o identificador especificado
+        """
+
+        pass
+
+    @abstractmethod
+    def exists(self, task_id: int) -> bool:
+
+        """Verifica se uma tarefa existe no banco de dados, a partir do seu identificador
+
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa a ser verificada
+
+        Returns
+        -------
+        bool
+            True se a tarefa existe, False caso contrário
+        """
+
+        pass
+
     @abstractmethod
     def delete(self, task_id: int) -> None:
 
@@ -51,6 +215,19 @@ class TaskDAO(ABC):
 
         pass
 
+    @abstractmethod
+    def delete_many(self, task_ids: Sequence[int]) -> None:
+
+        """Remove tarefas do banco de dados em uma única transação, a partir dos seus identificadores
+
+        Parameters
+        ----------
+        task_ids: Sequence[int]
+            Identificadores das tarefas a serem removidas do banco de dados
+        """
+
+        pass
+
     @abstractmethod
     def update_status(self, task_id: int, status: TaskStatus) -> None:
 
@@ -64,4 +241,17 @@ class TaskDAO(ABC):
             Status a ser alterado 
         """
 
+        pass
+
+    @abstractmethod
+    def update_status_many(self, updates: Sequence[Tuple[int, TaskStatus]]) -> None:
+
+        """Altera o status de várias tarefas do banco de dados em uma única transação
+
+        Parameters
+        ----------
+        updates: Sequence[Tuple[int, entities.task_status.TaskStatus]]
+            Pares (identificador da tarefa, novo status) a serem aplicados
+        """
+
         pass
\ No newline at end of file
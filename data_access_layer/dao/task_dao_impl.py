@@ -1,8 +1,9 @@
-from typing import Tuple, Union
+from typing import Any, Iterator, Sequence, Tuple, Union
 
 
 from entities.task import Task
 from entities.task_status import TaskStatus
+from entities.task_table import TaskTable
 from data_access_layer.dao.task_dao import TaskDAO
 from data_access_layer.database_api_adapters.database_api_adapter import DatabaseAPIAdapter
 
@@ -22,50 +23,225 @@ class TaskDAOImpl(TaskDAO):
         self._db_api_adapter = db_api_adapter
         self._db_api_adapter.connect()
 
-    def insert(self, task: Task) -> None:
+    def insert(self, task: Task) -> int:
 
         query = """
         INSERT INTO task(name, description, status_id) 
         VALUES (?, ?, ?)
         """
 
-        self._db_api_adapter.execute(
+        return self._db_api_adapter.execute(
             query, (task.name, task.description, task.status.id)
         )
 
+    def insert_many(self, tasks: Sequence[Task]) -> None:
+
+        query = """
+        INSERT INTO task(name, description, status_id) 
+        VALUES (?, ?, ?)
+        """
+
+        self._db_api_adapter.execute_many(
+            query, [(task.name, task.description, task.status.id) for task in tasks]
+        )
+
     def list_all(self) -> Union[Tuple[Task], None]:
 
         query = """
         SELECT
             t.id as task_id,
             t.name as task_name,
-            t.description as task_description,
+            COALESCE(t.description, '') as task_description,
+            s.id as status_id,
+            s.name as status_name
+        FROM task as t
+        JOIN task_status as s ON t.status_id = s.id
+        """
+
+        rows = self._db_api_adapter.fetch_all_tuples(query)
+
+        if not rows:
+
+            return None
+
+        return self._to_tasks(rows)
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Task]:
+
+        query = """
+        SELECT
+            t.id as task_id,
+            t.name as task_name,
+            COALESCE(t.description, '') as task_description,
+            s.id as status_id,
+            s.name as status_name
+        FROM task as t
+        JOIN task_status as s ON t.status_id = s.id
+        """
+
+        for row in self._db_api_adapter.iter_tuples(query, (), batch_size):
+
+            yield self._to_task(row)
+
+    def fetch_columns(self, status_id: Union[int, None] = None, batch_size: int = 1000) -> TaskTable:
+
+        # As linhas são lidas em lotes e copiadas diretamente para as colunas da tabela
+        query = """
+        SELECT
+            t.id as task_id,
+            t.name as task_name,
+            COALESCE(t.description, '') as task_description,
+            s.id as status_id,
+            s.name as status_name
+        FROM task as t
+        JOIN task_status as s ON t.status_id = s.id
+        """
+
+        parameters = ()
+
+        if status_id is not None:
+
+            query += "WHERE t.status_id = ?\n"
+            parameters = (status_id,)
+
+        query += "ORDER BY t.id"
+
+        return TaskTable._from_rows(self._db_api_adapter.iter_tuples(query, parameters, batch_size))
+
+    def list_page(self, limit: int, after_id: Union[int, None] = None) -> Union[Tuple[Task], None]:
+
+        # A busca parte da chave primária, sem percorrer as páginas anteriores
+        query = """
+        SELECT
+            t.id as task_id,
+            t.name as task_name,
+            COALESCE(t.description, '') as task_description,
             s.id as status_id,
             s.name as status_name
         FROM task as t
         JOIN task_status as s ON t.status_id = s.id
+        WHERE t.id > ?
+        ORDER BY t.id
+        LIMIT ?
+        """
+
+        rows = self._db_api_adapter.fetch_all_tuples(
+            query, (0 if after_id is None else after_id, limit)
+        )
+
+        if not rows:
+
+            return None
+
+        return self._to_tasks(rows)
+
+    def list_by_status(self, status_id: int) -> Union[Tuple[Task], None]:
+
+        # Percorre apenas o intervalo do status no índice idx_task_status_id
+        query = """
+        SELECT
+            t.id as task_id,
+            t.name as task_name,
+            COALESCE(t.description, '') as task_description,
+            s.id as status_id,
+            s.name as status_name
+        FROM task as t
+        JOIN task_status as s ON t.status_id = s.id
+        WHERE t.status_id = ?
+        ORDER BY t.id
+        """
+
+        rows = self._db_api_adapter.fetch_all_tuples(query, (status_id,))
+
+        if not rows:
+
+            return None
+
+        return self._to_tasks(rows)
+
+    def count_by_status(self) -> Tuple[Tuple[TaskStatus, int]]:
+
+        query = """
+        SELECT
+            s.id as status_id,
+            s.name as status_name,
+            COUNT(t.id) as total
+        FROM task_status as s
+        LEFT JOIN task as t ON t.status_id = s.id
+        GROUP BY s.id, s.name
+        ORDER BY s.id
         """
 
         registries = self._db_api_adapter.fetch_all(query)
 
         if not registries:
 
-            return None
+            return tuple()
 
-        tasks = tuple([
-            Task(
-                registry["task_id"],
-                registry["task_name"],
-                registry["task_description"],
-                TaskStatus(
-                    registry["status_id"],
-                    registry["status_name"],
-                )
-            )
+        return tuple([
+            (TaskStatus.shared(registry["status_id"], registry["status_name"]), registry["total"])
             for registry in registries
         ])
 
-        return tasks
+    def search(self, query: str, limit: int) -> Union[Tuple[Task], None]:
+
+        # Ordena pela relevância (BM25) calculada pelo FTS5; ocorrências no nome pesam mais que na descrição
+        sql = """
+        SELECT
+            t.id as task_id,
+            t.name as task_name,
+            COALESCE(t.description, '') as task_description,
+            s.id as status_id,
+            s.name as status_name
+        FROM task_fts as f
+        JOIN task as t ON t.id = f.rowid
+        JOIN task_status as s ON t.status_id = s.id
+        WHERE task_fts MATCH ?
+        ORDER BY bm25(task_fts, 10.0, 1.0)
+        LIMIT ?
+        """
+
+        rows = self._db_api_adapter.fetch_all_tuples(sql, (query, limit))
+
+        if not rows:
+
+            return None
+
+        return self._to_tasks(rows)
+
+    def get_by_id(self, task_id: int) -> Union[Task, None]:
+
+        query = """
+        SELECT
+            t.id as task_id,
+            t.name as task_name,
+            COALESCE(t.description, '') as task_description,
+            s.id as status_id,
+            s.name as status_name
+        FROM task as t
+        JOIN task_status as s ON t.status_id = s.id
+        WHERE t.id = ?
+        """
+
+        row = self._db_api_adapter.fetch_one_tuple(query, (task_id,))
+
+        if not row:
+
+            return None
+
+        return self._to_task(row)
+
+    def exists(self, task_id: int) -> bool:
+
+        query = """
+        SELECT 1 as found
+        FROM task
+        WHERE id = ?
+        """
+
+        registry = self._db_api_adapter.fetch_one(query, (task_id,))
+
+        return registry is not None
 
     def delete(self, task_id: int) -> None:
 
@@ -78,6 +254,17 @@ class TaskDAOImpl(TaskDAO):
             query, (task_id,)
         )
 
+    def delete_many(self, task_ids: Sequence[int]) -> None:
+
+        query = """
+        DELETE FROM task
+        WHERE id = ?
+        """
+
+        self._db_api_adapter.execute_many(
+            query, [(task_id,) for task_id in task_ids]
+        )
+
     def update_status(self, task_id: int, status: TaskStatus) -> None:
 
         query = """
@@ -87,4 +274,64 @@ class TaskDAOImpl(TaskDAO):
 
         self._db_api_adapter.execute(
             query, (status.id, task_id)
-        )
\ No newline at end of file
+        )
+
+    def update_status_many(self, updates: Sequence[Tuple[int, TaskStatus]]) -> None:
+
+        query = """
+        UPDATE task SET status_id = ?
+        WHERE id = ?
+        """
+
+        self._db_api_adapter.execute_many(
+            query, [(status.id, task_id) for task_id, status in updates]
+        )
+
+    def _to_task(self, row: Tuple[Any, ...]) -> Task:
+
+        """Converte uma linha da junção entre 'task' e 'task_status' em um objeto Task
+
+        Parameters
+        ----------
+        row: Tuple[Any, ...]
+            Linha com os campos task_id, task_name, task_description, status_id e status_name, nessa ordem
+
+        Returns
+        -------
+        entities.task.Task
+            Objeto Task com os dados da linha
+        """
+
+        task_id, task_name, task_description, status_id, status_name = row
+
+        # Registros do banco de dados já respeitam o esquema, então a validação é dispensada.
+        # Tarefas com o mesmo status compartilham um único objeto TaskStatus
+        return Task._from_row(
+            task_id,
+            task_name,
+            task_description,
+            TaskStatus.shared(status_id, status_name)
+        )
+
+    def _to_tasks(self, rows: Sequence[Tuple[Any, ...]]) -> Tuple[Task]:
+
+        """Converte as linhas da junção entre 'task' e 'task_status' em objetos Task
+
+        Parameters
+        ----------
+        rows: Sequence[Tuple[Any, ...]]
+            Linhas com os campos task_id, task_name, task_description, status_id e status_name, nessa ordem
+
+        Returns
+        -------
+        Tuple[entities.task.Task]
+            Objetos Task com os dados das linhas
+        """
+
+        from_row = Task._from_row
+        shared_status = TaskStatus.shared
+
+        return tuple([
+            from_row(task_id, task_name, task_description, shared_status(status_id, status_name))
+            for task_id, task_name, task_description, status_id, status_name in rows
+        ])
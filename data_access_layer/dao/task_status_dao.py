@@ -40,4 +40,22 @@ class TaskStatusDAO(ABC):
             Objeto TaskStatus com o nome especificado
         """
 
+        pass
+
+    @abstractmethod
+    def get_by_id(self, status_id: int) -> Union[TaskStatus, None]:
+
+        """Obtém um status da tarefa do banco de dados, a partir do seu identificador
+
+        Parameters
+        ----------
+        status_id: int
+            Identificador do status da tarefa a ser obtido
+
+        Returns
+        -------
+        Union[entities.task_status.TaskStatus, None] 
+            Objeto TaskStatus com o identificador especificado
+        """
+
         pass
\ No newline at end of file
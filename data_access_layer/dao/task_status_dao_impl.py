@@ -35,7 +35,7 @@ class TaskStatusDAOImpl(TaskStatusDAO):
             return None
 
         tasks_status = tuple([
-            TaskStatus(
+            TaskStatus.shared(
                 registry["id"],
                 registry["name"],
             )
@@ -58,7 +58,28 @@ class TaskStatusDAOImpl(TaskStatusDAO):
 
             return None
         
-        task_status = TaskStatus(
+        task_status = TaskStatus.shared(
+            registry["id"],
+            registry["name"]
+        )
+
+        return task_status
+
+    def get_by_id(self, status_id: int) -> Union[TaskStatus, None]:
+
+        query = """
+        SELECT id, name
+        FROM task_status
+        WHERE id = ?
+        """
+
+        registry = self._db_api_adapter.fetch_one(query, (status_id,))
+
+        if not registry:
+
+            return None
+        
+        task_status = TaskStatus.shared(
             registry["id"],
             registry["name"]
         )
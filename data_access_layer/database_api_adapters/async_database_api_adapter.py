@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Any, Callable, Dict, List, Sequence, Tuple, TypeVar, Union
+
+
+from data_access_layer.database_api_adapters.database_api_adapter import DatabaseAPIAdapter
+
+
+Result = TypeVar("Result")
+
+
+class AsyncDatabaseAPIAdapter(ABC):
+
+    """
+    Adaptador assíncrono (asyncio) da API de um SGBD genérico. As operações são executadas fora do
+    laço de eventos, de modo que as corrotinas que aguardam o banco de dados não o bloqueiam
+    """
+
+    @property
+    @abstractmethod
+    def sync_adapter(self) -> DatabaseAPIAdapter:
+
+        """Acessa o adaptador síncrono usado pelas funções executadas por 'run'
+
+        Returns
+        -------
+        data_access_layer.database_api_adapters.database_api_adapter.DatabaseAPIAdapter
+            Adaptador síncrono, que só deve ser usado dentro de funções passadas a 'run'
+        """
+
+        pass
+
+    @abstractmethod
+    async def run(self, function: Callable[..., Result], *args: Any) -> Result:
+
+        """Executa uma função síncrona que acessa o banco de dados por meio de 'sync_adapter', fora do laço de eventos
+
+        Parameters
+        ----------
+        function: Callable[..., Result]
+            Função executada
+        args: Any
+            Argumentos passados à função
+
+        Returns
+        -------
+        Result
+            Valor retornado pela função
+        """
+
+        pass
+
+    @abstractmethod
+    async def connect(self) -> None:
+
+        """Estabelece uma conexão com o banco de dados
+        """
+
+        pass
+
+    @abstractmethod
+    async def execute(self, query: str, parameters: Tuple[Any]=()) -> Union[int, None]:
+
+        """Executa um comando DML que não retorna instâncias (INSERT, UPDATE ou DELETE)
+
+        Parameters
+        ----------
+        query: str
+            Comando DML. Pode ou não conter placeholders, os quais são identificados pelo caractere '?' (interrogação)
+        parameters: Tuple[Any]
+            Valores passados ao comando DML nos placeholders (?), conforme a ordem da sequência
+
+        Returns
+        -------
+        Union[int, None]
+            Identificador da linha gravada por um INSERT, ou None se o SGBD não o informar
+        """
+
+        pass
+
+    @abstractmethod
+    async def execute_many(self, query: str, parameters_sequence: Sequence[Tuple[Any]]) -> None:
+
+        """Executa um comando DML (INSERT, UPDATE ou DELETE) para cada conjunto de parâmetros, em uma única transação
+
+        Parameters
+        ----------
+        query: str
+            Comando DML. Pode ou não conter placeholders, os quais são identificados pelo caractere '?' (interrogação)
+        parameters_sequence: Sequence[Tuple[Any]]
+            Sequência de valores passados ao comando DML nos placeholders (?), sendo um conjunto de valores por execução
+        """
+
+        pass
+
+    @abstractmethod
+    def transaction(self) -> AsyncContextManager[None]:
+
+        """Agrupa os comandos executados dentro do bloco 'async with' em uma única transação.
+        Enquanto a transação está aberta, comandos de outras corrotinas aguardam o seu fim
+
+        Returns
+        -------
+        AsyncContextManager[None]
+            Gerenciador de contexto assíncrono da transação
+        """
+
+        pass
+
+    @abstractmethod
+    async def fetch_all(self, query: str, parameters: Tuple[Any]=()) -> Union[List[Dict[str, Any]], None]:
+
+        """Realiza uma consulta (SELECT) que retorna múltiplas instâncias
+
+        Parameters
+        ----------
+        query: str
+            Comando DML. Pode ou não conter placeholders, os quais são identificados pelo caractere '?' (interrogação)
+        parameters: Tuple[Any]
+            Valores passados ao comando DML nos placeholders (?), conforme a ordem da sequência
+
+        Returns
+        -------
+        Union[List[Dict[str, Any]], None]
+            Sequência de dicionários com os dados de cada instância, sendo os campos (colunas) da tabela as chaves do dicionário
+        """
+
+        pass
+
+    @abstractmethod
+    async def fetch_one(self, query: str, parameters: Tuple[Any]=()) -> Union[Dict[str, Any], None]:
+
+        """Realiza uma consulta (SELECT) que retorna uma única instância
+
+        Parameters
+        ----------
+        query: str
+            Comando DML. Pode ou não conter placeholders, os quais são identificados pelo caractere '?' (interrogação)
+        parameters: Tuple[Any]
+            Valores passados ao comando DML nos placeholders (?), conforme a ordem da sequência
+
+        Returns
+        -------
+        Union[Dict[str, Any], None]
+            Dados da instância, sendo os campos (colunas) da tabela as chaves do dicionário
+        """
+
+        pass
+
+    @abstractmethod
+    async def close_connection(self) -> None:
+
+        """Fecha a conexão com o banco de dados
+        """
+
+        pass
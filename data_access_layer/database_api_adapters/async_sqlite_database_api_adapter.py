@@ -0,0 +1,169 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Sequence, Tuple, TypeVar, Union
+
+
+from data_access_layer.database_api_adapters.async_database_api_adapter import AsyncDatabaseAPIAdapter
+from data_access_layer.database_api_adapters.database_api_adapter import DatabaseAPIAdapter
+from data_access_layer.database_api_adapters.sqlite_performance_profile import SQLitePerformanceProfile
+from data_access_layer.database_api_adapters.sqlite_pooled_database_api_adapter import SQLitePooledDatabaseAPIAdapter
+
+
+Result = TypeVar("Result")
+
+
+class AsyncSQLiteDatabaseAPIAdapter(AsyncDatabaseAPIAdapter):
+
+    """
+    Adaptador assíncrono da API do SQLite. Todas as operações são enfileiradas para uma única thread de
+    trabalho dedicada, dona da conexão, e as corrotinas aguardam o resultado sem bloquear o laço de eventos.
+
+    Uma transação reserva a thread de trabalho para a corrotina que a abriu: comandos de outras corrotinas
+    aguardam o fim da transação, em vez de serem executados dentro dela
+    """
+
+    def __init__(self, filename: str, profile: Union[SQLitePerformanceProfile, str] = "balanced",
+                 statement_cache_size: int = 128, setup: Union[Callable[[sqlite3.Connection], None], None] = None) -> None:
+
+        """Inicializa um objeto AsyncSQLiteDatabaseAPIAdapter
+
+        Parameters
+        ----------
+        filename: str
+            Nome do arquivo do banco de dados
+        profile: Union[SQLitePerformanceProfile, str]
+            Perfil de desempenho, ou nome de um perfil predefinido (durable, balanced ou bulk-load)
+        statement_cache_size: int
+            Quantidade de comandos preparados mantidos em cache pela conexão
+        setup: Union[Callable[[sqlite3.Connection], None], None]
+            Função executada uma única vez pela thread de trabalho sobre a conexão, ao abri-la, antes de qualquer
+            comando (por exemplo, a aplicação das migrações). Se None, a conexão é usada diretamente
+        """
+
+        # Uma única conexão, aberta e usada apenas pela thread de trabalho
+        self._sync_adapter = SQLitePooledDatabaseAPIAdapter(
+            filename, 1, profile=profile, statement_cache_size=statement_cache_size, setup=setup
+        )
+        self._executor: Union[ThreadPoolExecutor, None] = None
+        self._lock = asyncio.Lock()
+
+        # Tarefa (asyncio.Task) dona da transação aberta
+        self._transaction_owner: Union[asyncio.Task, None] = None
+
+    @property
+    def sync_adapter(self) -> DatabaseAPIAdapter:
+
+        return self._sync_adapter
+
+    async def _submit(self, function: Callable[..., Result], *args: Any) -> Result:
+
+        """Enfileira uma função para a thread de trabalho e aguarda o seu resultado
+
+        Parameters
+        ----------
+        function: Callable[..., Result]
+            Função executada
+        args: Any
+            Argumentos passados à função
+
+        Returns
+        -------
+        Result
+            Valor retornado pela função
+        """
+
+        if self._executor is None:
+
+            raise RuntimeError("O adaptador não está conectado!")
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(function, *args))
+
+    async def run(self, function: Callable[..., Result], *args: Any) -> Result:
+
+        if self._transaction_owner is not None and self._transaction_owner is asyncio.current_task():
+
+            # A corrotina já reservou a thread de trabalho ao abrir a transação
+            return await self._submit(function, *args)
+
+        async with self._lock:
+
+            return await self._submit(function, *args)
+
+    async def connect(self) -> None:
+
+        if self._executor is None:
+
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async-sqlite")
+
+        await self._submit(self._sync_adapter.connect)
+
+    async def execute(self, query: str, parameters: Tuple[Any]=()) -> Union[int, None]:
+
+        return await self.run(self._sync_adapter.execute, query, parameters)
+
+    async def execute_many(self, query: str, parameters_sequence: Sequence[Tuple[Any]]) -> None:
+
+        await self.run(self._sync_adapter.execute_many, query, parameters_sequence)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+
+        nested = self._transaction_owner is not None and self._transaction_owner is asyncio.current_task()
+
+        if not nested:
+
+            await self._lock.acquire()
+
+            self._transaction_owner = asyncio.current_task()
+
+        try:
+
+            # Entrada e saída do gerenciador síncrono ocorrem na mesma thread de trabalho
+            context = self._sync_adapter.transaction()
+
+            await self._submit(context.__enter__)
+
+            try:
+
+                yield
+
+            except BaseException as error:
+
+                await self._submit(context.__exit__, type(error), error, error.__traceback__)
+
+                raise
+
+            await self._submit(context.__exit__, None, None, None)
+
+        finally:
+
+            if not nested:
+
+                self._transaction_owner = None
+
+                self._lock.release()
+
+    async def fetch_all(self, query: str, parameters: Tuple[Any]=()) -> Union[List[Dict[str, Any]], None]:
+
+        return await self.run(self._sync_adapter.fetch_all, query, parameters)
+
+    async def fetch_one(self, query: str, parameters: Tuple[Any]=()) -> Union[Dict[str, Any], None]:
+
+        return await self.run(self._sync_adapter.fetch_one, query, parameters)
+
+    async def close_connection(self) -> None:
+
+        if self._executor is None:
+
+            return
+
+        async with self._lock:
+
+            await self._submit(self._sync_adapter.close_connection)
+
+            executor, self._executor = self._executor, None
+
+        executor.shutdown(wait=True)
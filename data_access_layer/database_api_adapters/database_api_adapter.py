@@ -1,5 +1,11 @@
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Union, Any
+from typing import ContextManager, Dict, Iterator, List, Sequence, Tuple, Union, Any
+
+
+from data_access_layer.database_api_adapters.query_instrumentation import QueryEvent, QueryListener
+
 
 class DatabaseAPIAdapter(ABC):
 
@@ -7,6 +13,69 @@ class DatabaseAPIAdapter(ABC):
     Adaptador da API de um SGBD (Sistema de Gerenciamento de Banco de Dados) genérico
     """
 
+    # Ouvintes da instrumentação. Sem ouvintes, os comandos apenas testam esta tupla vazia
+    _listeners: Tuple[QueryListener, ...] = ()
+
+    def add_listener(self, listener: QueryListener) -> None:
+
+        """Passa a notificar um ouvinte a cada comando executado (execute, execute_many, fetch_all, fetch_one,
+        fetch_all_tuples, fetch_one_tuple) e a cada transação confirmada. Os iteradores não são instrumentados
+
+        Parameters
+        ----------
+        listener: data_access_layer.database_api_adapters.query_instrumentation.QueryListener
+            Ouvinte notificado
+        """
+
+        # A tupla é substituída, e não alterada, para que threads executando comandos não a vejam pela metade
+        self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener: QueryListener) -> None:
+
+        """Deixa de notificar um ouvinte
+
+        Parameters
+        ----------
+        listener: data_access_layer.database_api_adapters.query_instrumentation.QueryListener
+            Ouvinte adicionado por 'add_listener'
+        """
+
+        self._listeners = tuple([current for current in self._listeners if current is not listener])
+
+    def _notify(self, operation: str, query: str, parameters_shape: str, start: float,
+                row_count: Union[int, None], commit_duration: Union[float, None] = None) -> None:
+
+        """Notifica os ouvintes sobre um comando executado. Só deve ser chamado se houver ouvintes
+
+        Parameters
+        ----------
+        operation: str
+            Método do adaptador que executou o comando
+        query: str
+            Comando executado
+        parameters_shape: str
+            Tipos dos parâmetros do comando
+        start: float
+            Instante do início do comando, obtido por time.perf_counter
+        row_count: Union[int, None]
+            Linhas retornadas ou afetadas
+        commit_duration: Union[float, None]
+            Duração da confirmação da transação, se o comando a confirmou
+        """
+
+        event = QueryEvent(operation, query, parameters_shape, time.perf_counter() - start, row_count, commit_duration)
+
+        for listener in self._listeners:
+
+            try:
+
+                listener.on_query(event)
+
+            except Exception:
+
+                # Uma falha da instrumentação não deve interromper o acesso ao banco de dados
+                logging.getLogger(__name__).exception("Falha no ouvinte %r", listener)
+
     @abstractmethod
     def connect(self) -> None:
 
@@ -16,7 +85,7 @@ class DatabaseAPIAdapter(ABC):
         pass
 
     @abstractmethod
-    def execute(self, query: str, parameters: Tuple[Any]=()) -> None:
+    def execute(self, query: str, parameters: Tuple[Any]=()) -> Union[int, None]:
 
         """Executa um comando DML que não retorna instâncias (INSERT, UPDATE ou DELETE)
 
@@ -27,6 +96,26 @@ class DatabaseAPIAdapter(ABC):
         parameters: Tuple[Any]
             Valores passados ao comando DML nos placeholders (?), conforme a ordem da sequência
 
+        Returns
+        -------
+        Union[int, None]
+            Identificador da linha gravada por um INSERT, ou None se o SGBD não o informar
+        """
+
+        pass
+
+    @abstractmethod
+    def execute_many(self, query: str, parameters_sequence: Sequence[Tuple[Any]]) -> None:
+
+        """Executa um comando DML (INSERT, UPDATE ou DELETE) para cada conjunto de parâmetros, em uma única transação
+
+        Parameters
+        ----------
+        query: str
+            Comando DML. Pode ou não conter placeholders, os quais são identificados pelo caractere '?' (interrogação)
+        parameters_sequence: Sequence[Tuple[Any]]
+            Sequência de valores passados ao comando DML nos placeholders (?), sendo um conjunto de valores por execução
+
         """
 
         pass
@@ -51,6 +140,28 @@ class DatabaseAPIAdapter(ABC):
 
         pass
     
+    @abstractmethod
+    def iter_rows(self, query: str, parameters: Tuple[Any]=(), batch_size: int=1000) -> Iterator[Dict[str, Any]]:
+
+        """Realiza uma consulta (SELECT) que retorna as instâncias sob demanda, em lotes de 'batch_size'
+
+        Parameters
+        ----------
+        query: str
+            Comando DML. Pode ou não conter placeholders, os quais são identificados pelo caractere '?' (interrogação)
+        parameters: Tuple[Any]
+            Valores passados ao comando DML nos placeholders (?), conforme a ordem da sequência
+        batch_size: int
+            Quantidade de instâncias lidas do banco de dados por vez
+
+        Returns
+        -------
+        Iterator[Dict[str, Any]]
+            Iterador de dicionários com os dados de cada instância, sendo os campos (colunas) da tabela as chaves do dicionário
+        """
+
+        pass
+    
     @abstractmethod
     def fetch_one(self, query: str, parameters: Tuple[Any]=()) -> Union[Dict[str, Any], None]:
 
@@ -71,10 +182,90 @@ class DatabaseAPIAdapter(ABC):
 
         pass
     
+    @abstractmethod
+    def fetch_all_tuples(self, query: str, parameters: Tuple[Any]=()) -> Union[List[Tuple[Any, ...]], None]:
+
+        """Realiza uma consulta (SELECT) que retorna múltiplas instâncias como tuplas, sem criar um dicionário
+        por instância. Indicado para consultas frequentes cujas colunas são conhecidas pela posição
+
+        Parameters
+        ----------
+        query: str
+            Comando DML. Pode ou não conter placeholders, os quais são identificados pelo caractere '?' (interrogação)
+        parameters: Tuple[Any]
+            Valores passados ao comando DML nos placeholders (?), conforme a ordem da sequência
+
+        Returns
+        -------
+        Union[List[Tuple[Any, ...]], None]
+            Sequência de tuplas com os dados de cada instância, na ordem das colunas da consulta
+        """
+
+        pass
+
+    @abstractmethod
+    def iter_tuples(self, query: str, parameters: Tuple[Any]=(), batch_size: int=1000) -> Iterator[Tuple[Any, ...]]:
+
+        """Realiza uma consulta (SELECT) que retorna as instâncias como tuplas, sob demanda, em lotes de 'batch_size'
+
+        Parameters
+        ----------
+        query: str
+            Comando DML. Pode ou não conter placeholders, os quais são identificados pelo caractere '?' (interrogação)
+        parameters: Tuple[Any]
+            Valores passados ao comando DML nos placeholders (?), conforme a ordem da sequência
+        batch_size: int
+            Quantidade de instâncias lidas do banco de dados por vez
+
+        Returns
+        -------
+        Iterator[Tuple[Any, ...]]
+            Iterador de tuplas com os dados de cada instância, na ordem das colunas da consulta
+        """
+
+        pass
+
+    @abstractmethod
+    def fetch_one_tuple(self, query: str, parameters: Tuple[Any]=()) -> Union[Tuple[Any, ...], None]:
+
+        """Realiza uma consulta (SELECT) que retorna uma única instância como tupla
+
+        Parameters
+        ----------
+        query: str
+            Comando DML. Pode ou não conter placeholders, os quais são identificados pelo caractere '?' (interrogação)
+        parameters: Tuple[Any]
+            Valores passados ao comando DML nos placeholders (?), conforme a ordem da sequência
+
+        Returns
+        -------
+        Union[Tuple[Any, ...], None]
+            Dados da instância, na ordem das colunas da consulta
+        """
+
+        pass
+    
     @abstractmethod
     def close_connection(self) -> None:
 
         """Fecha a conexão com o banco de dados
         """
 
+        pass
+
+    @abstractmethod
+    def transaction(self) -> ContextManager[None]:
+
+        """Agrupa os comandos executados dentro do bloco 'with' em uma única transação
+
+        Dentro do bloco, 'execute' e 'execute_many' não confirmam (commit) cada comando; a confirmação
+        ocorre na saída do bloco mais externo. Qualquer exceção desfaz (rollback) o bloco. Blocos
+        aninhados são tratados como pontos de salvamento (SAVEPOINT), desfazendo apenas o próprio bloco
+
+        Returns
+        -------
+        ContextManager[None]
+            Gerenciador de contexto da transação
+        """
+
         pass
\ No newline at end of file
@@ -0,0 +1,257 @@
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from threading import RLock
+from typing import Callable, Dict, Iterator, List, Sequence, Set, Tuple, Union
+
+
+from entities.task_status import TaskStatus
+
+
+# Status criados por database/init.sql
+DEFAULT_STATUS_NAMES = ("Disponível", "Fazendo", "Feita")
+
+# Palavra para a busca: sequência de letras e dígitos
+_WORD = re.compile(r"[^\W_]+")
+
+# Linha da tabela de tarefas: nome, descrição e identificador do status
+TaskRow = Tuple[str, Union[str, None], int]
+
+
+class InMemoryDatabase:
+
+    """
+    Banco de dados em memória, em Python puro, para testes e cargas descartáveis.
+
+    Guarda as tabelas de tarefas e de status em dicionários, com índices pelo identificador, pelo status e
+    pelas palavras do nome e da descrição, e é usado pelos DAOs InMemoryTaskDAO e InMemoryTaskStatusDAO.
+    Substitui o adaptador SQLite nos serviços: 'transaction' tem a mesma semântica (blocos aninhados são
+    pontos de salvamento), implementada por um registro das operações a desfazer. Nada é gravado em disco
+    """
+
+    def __init__(self, status_names: Sequence[str] = DEFAULT_STATUS_NAMES) -> None:
+
+        """Inicializa um objeto InMemoryDatabase
+
+        Parameters
+        ----------
+        status_names: Sequence[str]
+            Nomes dos status cadastrados, na ordem dos identificadores (padrão: os status de database/init.sql)
+        """
+
+        # Bloqueio reentrante: uma transação mantém o banco para si até a sua conclusão
+        self.lock = RLock()
+
+        self.statuses: Dict[int, TaskStatus] = {}
+        self.statuses_by_name: Dict[str, TaskStatus] = {}
+
+        for status_id, status_name in enumerate(status_names, start=1):
+
+            status = TaskStatus.shared(status_id, status_name)
+
+            self.statuses[status_id] = status
+            self.statuses_by_name[status_name] = status
+
+        self.tasks: Dict[int, TaskRow] = {}
+        # Identificadores das tarefas em ordem crescente, para as leituras ordenadas e paginadas
+        self.task_ids: List[int] = []
+        self.task_ids_by_status: Dict[int, Set[int]] = {status_id: set() for status_id in self.statuses}
+        self.task_ids_by_word: Dict[str, Set[int]] = {}
+        # Como em AUTOINCREMENT, identificadores de tarefas removidas não são reutilizados
+        self.last_task_id = 0
+
+        self._undo_log: Union[List[Callable[[], None]], None] = None
+
+    def connect(self) -> None:
+
+        """Sem efeito: o banco de dados em memória não possui conexão
+        """
+
+        pass
+
+    def close_connection(self) -> None:
+
+        """Sem efeito: o banco de dados em memória não possui conexão
+        """
+
+        pass
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+
+        """Agrupa as operações executadas dentro do bloco 'with' em uma única transação
+
+        Qualquer exceção desfaz as operações do bloco. Blocos aninhados são tratados como pontos de salvamento,
+        desfazendo apenas o próprio bloco. Outras threads aguardam a conclusão da transação
+
+        Returns
+        -------
+        Iterator[None]
+            Gerenciador de contexto da transação
+        """
+
+        with self.lock:
+
+            outermost = self._undo_log is None
+
+            if outermost:
+
+                self._undo_log = []
+
+            savepoint = len(self._undo_log)
+
+            try:
+
+                yield
+
+            except BaseException:
+
+                undo_log = self._undo_log
+                block_undo_log = undo_log[savepoint:]
+
+                del undo_log[savepoint:]
+
+                # Desfaz as operações do bloco, da mais recente à mais antiga, sem registrá-las
+                self._undo_log = None
+
+                try:
+
+                    for undo in reversed(block_undo_log):
+
+                        undo()
+
+                finally:
+
+                    self._undo_log = undo_log
+
+                raise
+
+            finally:
+
+                if outermost:
+
+                    self._undo_log = None
+
+    def log_undo(self, undo: Callable[[], None]) -> None:
+
+        """Registra a operação que desfaz uma escrita, se houver uma transação em andamento
+
+        Parameters
+        ----------
+        undo: Callable[[], None]
+            Função que desfaz a escrita
+        """
+
+        if self._undo_log is not None:
+
+            self._undo_log.append(undo)
+
+    def add_task_row(self, task_id: int, row: TaskRow) -> None:
+
+        """Grava uma linha da tabela de tarefas e atualiza os índices
+
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa
+        row: TaskRow
+            Nome, descrição e identificador do status da tarefa
+        """
+
+        name, description, status_id = row
+
+        self.tasks[task_id] = row
+
+        # Os identificadores novos são sempre os maiores; 'insort' só percorre a lista ao desfazer remoções
+        if not self.task_ids or self.task_ids[-1] < task_id:
+
+            self.task_ids.append(task_id)
+
+        else:
+
+            insort(self.task_ids, task_id)
+
+        self.task_ids_by_status.setdefault(status_id, set()).add(task_id)
+
+        for word in set(words(name)) | set(words(description)):
+
+            self.task_ids_by_word.setdefault(word, set()).add(task_id)
+
+    def remove_task_row(self, task_id: int) -> TaskRow:
+
+        """Remove uma linha da tabela de tarefas e atualiza os índices
+
+        Parameters
+        ----------
+        task_id: int
+            Identificador de uma tarefa existente
+
+        Returns
+        -------
+        TaskRow
+            Linha removida
+        """
+
+        row = self.tasks.pop(task_id)
+        name, description, status_id = row
+
+        del self.task_ids[bisect_left(self.task_ids, task_id)]
+
+        self.task_ids_by_status[status_id].discard(task_id)
+
+        for word in set(words(name)) | set(words(description)):
+
+            task_ids = self.task_ids_by_word[word]
+            task_ids.discard(task_id)
+
+            if not task_ids:
+
+                del self.task_ids_by_word[word]
+
+        return row
+
+
+def words(text: Union[str, None]) -> List[str]:
+
+    """Separa um texto em palavras para a busca, como o tokenizador 'unicode61' do FTS5:
+    letras minúsculas, sem acentos, e qualquer caractere não alfanumérico como separador
+
+    Parameters
+    ----------
+    text: Union[str, None]
+        Texto a ser separado
+
+    Returns
+    -------
+    List[str]
+        Palavras do texto, na ordem em que aparecem
+    """
+
+    if not text:
+
+        return []
+
+    return _WORD.findall(_strip_accents(text.casefold()))
+
+
+def _strip_accents(text: str) -> str:
+
+    """Remove os acentos de um texto
+
+    Parameters
+    ----------
+    text: str
+        Texto original
+
+    Returns
+    -------
+    str
+        Texto sem os sinais diacríticos
+    """
+
+    if text.isascii():
+
+        return text
+
+    return "".join([character for character in unicodedata.normalize("NFD", text) if not unicodedata.combining(character)])
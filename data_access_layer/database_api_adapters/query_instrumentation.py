@@ -0,0 +1,276 @@
+import logging
+import re
+from abc import ABC, abstractmethod
+from collections import deque
+from threading import Lock
+from typing import Any, Deque, Dict, List, NamedTuple, Sequence, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEvent(NamedTuple):
+
+    """
+    Dados de um comando executado por um adaptador de banco de dados
+    """
+
+    # execute, execute_many, fetch_all, fetch_one, fetch_all_tuples, fetch_one_tuple ou commit
+    operation: str
+    query: str
+    # Tipos dos parâmetros, sem os valores (ex.: "(int, str)" ou "500 x (int, str)")
+    parameters_shape: str
+    # Duração em segundos, incluindo a confirmação da transação, se houver
+    duration: float
+    # Linhas retornadas (consultas) ou afetadas (escritas); None se não se aplica
+    row_count: Union[int, None]
+    # Duração em segundos da confirmação da transação (COMMIT); None se o comando não a confirmou
+    commit_duration: Union[float, None]
+
+
+def parameters_shape(parameters: Tuple[Any]) -> str:
+
+    """Descreve os tipos dos parâmetros de um comando, sem expor os seus valores
+
+    Parameters
+    ----------
+    parameters: Tuple[Any]
+        Parâmetros do comando
+
+    Returns
+    -------
+    str
+        Tipos dos parâmetros, como "(int, str)"
+    """
+
+    return "(" + ", ".join([type(parameter).__name__ for parameter in parameters]) + ")"
+
+
+def parameters_sequence_shape(parameters_sequence: Sequence[Tuple[Any]]) -> str:
+
+    """Descreve os tipos de uma sequência de conjuntos de parâmetros, a partir do primeiro conjunto
+
+    Parameters
+    ----------
+    parameters_sequence: Sequence[Tuple[Any]]
+        Conjuntos de parâmetros de um comando executado várias vezes
+
+    Returns
+    -------
+    str
+        Quantidade de conjuntos e tipos do primeiro, como "500 x (int, str)"
+    """
+
+    if not isinstance(parameters_sequence, Sequence):
+
+        return "? x ?"
+
+    if len(parameters_sequence) == 0:
+
+        return "0 x ()"
+
+    return f"{len(parameters_sequence)} x {parameters_shape(parameters_sequence[0])}"
+
+
+class QueryListener(ABC):
+
+    """
+    Ouvinte dos comandos executados por um adaptador de banco de dados.
+    É chamado na thread que executou o comando, logo após a sua execução, e não deve lançar exceções
+    """
+
+    @abstractmethod
+    def on_query(self, event: QueryEvent) -> None:
+
+        """Recebe os dados de um comando executado
+
+        Parameters
+        ----------
+        event: QueryEvent
+            Dados do comando
+        """
+
+        pass
+
+
+def _normalize(query: str) -> str:
+
+    """Remove os espaços redundantes de um comando, para agrupar as execuções do mesmo comando
+
+    Parameters
+    ----------
+    query: str
+        Comando SQL
+
+    Returns
+    -------
+    str
+        Comando em uma única linha
+    """
+
+    return re.sub(r"\s+", " ", query).strip()
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+
+    """Calcula um percentil por interpolação linear
+
+    Parameters
+    ----------
+    sorted_values: List[float]
+        Valores em ordem crescente
+    fraction: float
+        Percentil desejado, entre 0 e 1
+
+    Returns
+    -------
+    float
+        Valor do percentil
+    """
+
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class QueryStatistics(QueryListener):
+
+    """
+    Agregador em memória das durações dos comandos, agrupados pelo texto do comando
+    """
+
+    def __init__(self, max_samples: int = 10_000) -> None:
+
+        """Inicializa um objeto QueryStatistics
+
+        Parameters
+        ----------
+        max_samples: int
+            Quantidade de durações mais recentes mantidas por comando para o cálculo dos percentis (padrão: 10000)
+        """
+
+        if not isinstance(max_samples, int) or max_samples <= 0:
+
+            raise ValueError("A quantidade de amostras deve ser um número inteiro positivo!")
+
+        self._max_samples = max_samples
+        self._lock = Lock()
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._total_durations: Dict[Tuple[str, str], float] = {}
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+
+    def on_query(self, event: QueryEvent) -> None:
+
+        key = (event.operation, _normalize(event.query))
+
+        with self._lock:
+
+            if key not in self._counts:
+
+                self._counts[key] = 0
+                self._total_durations[key] = 0.0
+                self._samples[key] = deque(maxlen=self._max_samples)
+
+            self._counts[key] += 1
+            self._total_durations[key] += event.duration
+            self._samples[key].append(event.duration)
+
+    def reset(self) -> None:
+
+        """Descarta os dados agregados
+        """
+
+        with self._lock:
+
+            self._counts.clear()
+            self._total_durations.clear()
+            self._samples.clear()
+
+    def report(self) -> List[Dict[str, Any]]:
+
+        """Resume os comandos executados, do maior ao menor tempo total
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Para cada comando: operação, texto, quantidade de execuções, tempo total e
+            percentis p50, p95 e p99 da duração, em milissegundos
+        """
+
+        with self._lock:
+
+            entries = [
+                (key, self._counts[key], self._total_durations[key], sorted(self._samples[key]))
+                for key in self._counts
+            ]
+
+        report = [
+            {
+                "operation": operation,
+                "query": query,
+                "count": count,
+                "total_ms": total * 1000,
+                "p50_ms": percentile(samples, 0.50) * 1000,
+                "p95_ms": percentile(samples, 0.95) * 1000,
+                "p99_ms": percentile(samples, 0.99) * 1000,
+            }
+            for (operation, query), count, total, samples in entries
+        ]
+
+        report.sort(key=lambda entry: entry["total_ms"], reverse=True)
+
+        return report
+
+
+class SlowQueryLog(QueryListener):
+
+    """
+    Registro dos comandos mais lentos que um limite. Cada comando lento é mantido em memória
+    e registrado como aviso no logger deste módulo
+    """
+
+    def __init__(self, threshold_ms: float = 100.0, max_entries: int = 1000) -> None:
+
+        """Inicializa um objeto SlowQueryLog
+
+        Parameters
+        ----------
+        threshold_ms: float
+            Duração, em milissegundos, a partir da qual um comando é considerado lento (padrão: 100)
+        max_entries: int
+            Quantidade de comandos lentos mais recentes mantidos em memória (padrão: 1000)
+        """
+
+        if not isinstance(threshold_ms, (int, float)) or threshold_ms < 0:
+
+            raise ValueError("O limite de duração deve ser um número não negativo!")
+
+        if not isinstance(max_entries, int) or max_entries <= 0:
+
+            raise ValueError("A quantidade de entradas deve ser um número inteiro positivo!")
+
+        self._threshold = threshold_ms / 1000
+        self._entries: Deque[QueryEvent] = deque(maxlen=max_entries)
+
+    @property
+    def entries(self) -> Tuple[QueryEvent]:
+
+        """Comandos lentos mais recentes, do mais antigo ao mais novo
+        """
+
+        return tuple(self._entries)
+
+    def on_query(self, event: QueryEvent) -> None:
+
+        if event.duration < self._threshold:
+
+            return
+
+        self._entries.append(event)
+
+        logger.warning(
+            "Comando lento (%.1f ms, %s linhas, %s): %s %s",
+            event.duration * 1000, event.row_count, event.operation, _normalize(event.query), event.parameters_shape
+        )
@@ -1,8 +1,12 @@
 import sqlite3
-from typing import Dict, List, Tuple, Union, Any
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, Union, Any
 
 
 from data_access_layer.database_api_adapters.database_api_adapter import DatabaseAPIAdapter
+from data_access_layer.database_api_adapters.query_instrumentation import parameters_sequence_shape, parameters_shape
+from data_access_layer.database_api_adapters.sqlite_performance_profile import SQLitePerformanceProfile
 
 class SQLiteDatabaseAPIAdapter(DatabaseAPIAdapter):
 
@@ -12,6 +16,13 @@ class SQLiteDatabaseAPIAdapter(DatabaseAPIAdapter):
 
     _instance = None
 
+    # Conexão aberta; None até o primeiro comando
+    _connection: Union[sqlite3.Connection, None] = None
+
+    # Quantidade de blocos 'transaction' abertos na conexão. Definida na classe, e não em __init__, para que
+    # uma nova construção da instância compartilhada não a zere durante uma transação
+    _transaction_depth: int = 0
+
     def __new__(cls, *args, **kwargs) -> 'SQLiteDatabaseAPIAdapter':
 
         """Retorna uma instância da classe SQLiteDatabaseAPIAdapter alocada em memória
@@ -28,7 +39,9 @@ class SQLiteDatabaseAPIAdapter(DatabaseAPIAdapter):
 
         return cls._instance
     
-    def __init__(self, filename: str) -> None:
+    def __init__(self, filename: str, profile: Union[SQLitePerformanceProfile, str, None] = None,
+                 statement_cache_size: int = 128,
+                 setup: Union[Callable[[sqlite3.Connection], None], None] = None) -> None:
 
         """Inicializa um objeto SQLiteDatabaseAPIAdapter
 
@@ -36,36 +49,242 @@ class SQLiteDatabaseAPIAdapter(DatabaseAPIAdapter):
         ----------
         filename: str
             Nome do arquivo do banco de dados
+        profile: Union[SQLitePerformanceProfile, str, None]
+            Perfil de desempenho, ou nome de um perfil predefinido (durable, balanced ou bulk-load),
+            aplicado ao conectar. Se None, mantém a configuração padrão do SQLite
+        statement_cache_size: int
+            Quantidade de comandos preparados mantidos em cache pela conexão
+        setup: Union[Callable[[sqlite3.Connection], None], None]
+            Função executada uma única vez sobre a primeira conexão aberta, antes de qualquer comando
+            (por exemplo, a aplicação das migrações). Se None, a conexão é usada diretamente
         """
 
         if not isinstance(filename, str) or filename == "":
 
             raise ValueError("O nome do arquivo do banco deve ser uma sequência de caracteres não vazio!")
         
+        if not isinstance(statement_cache_size, int) or statement_cache_size < 0:
+
+            raise ValueError("O tamanho do cache de comandos deve ser um inteiro não negativo!")
+
         self._filename = filename
+        self._statement_cache_size = statement_cache_size
+        self._profile = SQLitePerformanceProfile.resolve(profile)
+        self._setup = setup
 
     def connect(self):
 
-        self.connection = sqlite3.connect(self._filename)
+        # A conexão só é aberta no primeiro comando. A instância é compartilhada: chamadas repetidas
+        # reaproveitam a conexão aberta, em vez de substituí-la (e deixar a anterior aberta)
+        if self._connection is None:
+
+            return
+
+        if (self._connected_filename, self._connected_statement_cache_size) == (self._filename, self._statement_cache_size):
+
+            self._apply_profile()
+
+            return
+
+        self._connection.close()
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+
+        """Conexão com o banco de dados, aberta no primeiro acesso
+
+        Returns
+        -------
+        sqlite3.Connection
+            Conexão aberta
+        """
+
+        connection = self._connection
+
+        if connection is None:
+
+            connection = self._open_connection()
+
+        return connection
+
+    def _open_connection(self) -> sqlite3.Connection:
+
+        """Abre a conexão com o banco de dados, aplica o perfil de desempenho e executa a preparação, se houver
+
+        Returns
+        -------
+        sqlite3.Connection
+            Conexão aberta
+        """
+
+        connection = sqlite3.connect(self._filename, cached_statements=self._statement_cache_size)
+
+        self._connection = connection
+        self._connected_filename = self._filename
+        self._connected_statement_cache_size = self._statement_cache_size
+        self._applied_profile = None
+
+        try:
+
+            self._apply_profile()
+
+            if self._setup is not None:
+
+                self._setup(connection)
+
+                self._setup = None
+
+        except BaseException:
+
+            connection.close()
+
+            self._connection = None
+
+            raise
+
+        return connection
+
+    def _apply_profile(self) -> None:
+
+        """Aplica o perfil de desempenho à conexão, caso ainda não tenha sido aplicado
+        """
+
+        if self._profile is None or self._profile is self._applied_profile:
+
+            return
+
+        for pragma in self._profile.pragmas():
+
+            self.connection.execute(pragma).close()
+
+        self._applied_profile = self._profile
     
-    def execute(self, query: str, parameters: Tuple[Any]=()) -> None:
+    def execute(self, query: str, parameters: Tuple[Any]=()) -> Union[int, None]:
+
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
 
         cursor = self.connection.cursor()
 
-        cursor.execute(query, parameters)
+        try:
+
+            cursor.execute(query, parameters)
+
+            row_count = cursor.rowcount
+            last_row_id = cursor.lastrowid
+
+        finally:
+
+            cursor.close()
+
+        commit_duration = None
+
+        if self._transaction_depth == 0:
+
+            commit_start = time.perf_counter() if listeners else 0.0
+
+            self.connection.commit()
+
+            if listeners:
+
+                commit_duration = time.perf_counter() - commit_start
+
+        if listeners:
+
+            self._notify("execute", query, parameters_shape(parameters), start, row_count, commit_duration)
+
+        return last_row_id
+
+    def execute_many(self, query: str, parameters_sequence: Sequence[Tuple[Any]]) -> None:
+
+        with self.transaction():
+
+            listeners = self._listeners
+            start = time.perf_counter() if listeners else 0.0
+
+            cursor = self.connection.cursor()
+
+            try:
+
+                cursor.executemany(query, parameters_sequence)
+
+                row_count = cursor.rowcount
+
+            finally:
+
+                cursor.close()
+
+            if listeners:
+
+                self._notify("execute_many", query, parameters_sequence_shape(parameters_sequence), start, row_count)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+
+        if self._transaction_depth == 0:
+
+            # Obtém o bloqueio de escrita já no início, para que as leituras do bloco
+            # não sejam invalidadas por outra conexão antes da escrita
+            begin, commit, rollback = "BEGIN IMMEDIATE", "COMMIT", "ROLLBACK"
+
+        else:
+
+            savepoint = f"sp_{self._transaction_depth}"
+            begin, commit, rollback = f"SAVEPOINT {savepoint}", f"RELEASE {savepoint}", f"ROLLBACK TO {savepoint}"
 
-        self.connection.commit()
+        self.connection.execute(begin)
 
-        cursor.close()
+        self._transaction_depth += 1
+
+        try:
+
+            yield
+
+            listeners = self._listeners
+            start = time.perf_counter() if listeners else 0.0
+
+            # A profundidade só é reduzida depois da confirmação: se o COMMIT falhar (por exemplo, com o banco
+            # ocupado), a transação continua aberta e é desfeita abaixo
+            self.connection.execute(commit)
+
+        except BaseException:
+
+            self._transaction_depth -= 1
+
+            if self._transaction_depth > 0:
+
+                # ROLLBACK TO mantém o savepoint aberto
+                self.connection.execute(rollback)
+                self.connection.execute(commit)
+
+            elif self.connection.in_transaction:
+
+                self.connection.execute(rollback)
+
+            raise
+
+        self._transaction_depth -= 1
+
+        if listeners and self._transaction_depth == 0:
+
+            self._notify("commit", commit, "()", start, None, time.perf_counter() - start)
     
     def fetch_all(self, query: str, parameters: Tuple[Any]=()) -> Union[List[Dict[str, Any]], None]:
 
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
+
         cursor = self.connection.cursor()
 
         cursor = cursor.execute(query, parameters)
 
         rows = cursor.fetchall()
 
+        if listeners:
+
+            self._notify("fetch_all", query, parameters_shape(parameters), start, len(rows))
+
         if not rows:
 
             return None
@@ -79,14 +298,51 @@ class SQLiteDatabaseAPIAdapter(DatabaseAPIAdapter):
 
         return data
     
+    def iter_rows(self, query: str, parameters: Tuple[Any]=(), batch_size: int=1000) -> Iterator[Dict[str, Any]]:
+
+        if not isinstance(batch_size, int) or batch_size <= 0:
+
+            raise ValueError("O tamanho do lote deve ser um inteiro positivo!")
+
+        cursor = self.connection.cursor()
+
+        try:
+
+            cursor.execute(query, parameters)
+
+            column_names = list(map(lambda x: x[0], cursor.description))
+
+            while True:
+
+                rows = cursor.fetchmany(batch_size)
+
+                if not rows:
+
+                    break
+
+                for row in rows:
+
+                    yield {column_name: value for column_name, value in zip(column_names, row)}
+
+        finally:
+
+            cursor.close()
+    
     def fetch_one(self, query: str, parameters: Tuple[Any]=()) -> Union[Dict[str, Any], None]:
 
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
+
         cursor = self.connection.cursor()
 
         cursor = cursor.execute(query, parameters)
 
         row = cursor.fetchone()
 
+        if listeners:
+
+            self._notify("fetch_one", query, parameters_shape(parameters), start, 0 if row is None else 1)
+
         if not row:
 
             return None
@@ -97,7 +353,81 @@ class SQLiteDatabaseAPIAdapter(DatabaseAPIAdapter):
 
         return data
 
+    def fetch_all_tuples(self, query: str, parameters: Tuple[Any]=()) -> Union[List[Tuple[Any, ...]], None]:
+
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
+
+        cursor = self.connection.execute(query, parameters)
+
+        try:
+
+            rows = cursor.fetchall()
+
+        finally:
+
+            cursor.close()
+
+        if listeners:
+
+            self._notify("fetch_all_tuples", query, parameters_shape(parameters), start, len(rows))
+
+        if not rows:
+
+            return None
+
+        return rows
+
+    def iter_tuples(self, query: str, parameters: Tuple[Any]=(), batch_size: int=1000) -> Iterator[Tuple[Any, ...]]:
+
+        if not isinstance(batch_size, int) or batch_size <= 0:
+
+            raise ValueError("O tamanho do lote deve ser um inteiro positivo!")
+
+        cursor = self.connection.execute(query, parameters)
+
+        try:
+
+            while True:
+
+                rows = cursor.fetchmany(batch_size)
+
+                if not rows:
+
+                    break
+
+                yield from rows
+
+        finally:
+
+            cursor.close()
+
+    def fetch_one_tuple(self, query: str, parameters: Tuple[Any]=()) -> Union[Tuple[Any, ...], None]:
+
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
+
+        cursor = self.connection.execute(query, parameters)
+
+        try:
+
+            row = cursor.fetchone()
+
+        finally:
+
+            cursor.close()
+
+        if listeners:
+
+            self._notify("fetch_one_tuple", query, parameters_shape(parameters), start, 0 if row is None else 1)
+
+        return row
+
     def close_connection(self) -> None:
 
-        self.connection.close()
+        if self._connection is not None:
+
+            self._connection.close()
+
+        self._connection = None
 
@@ -0,0 +1,129 @@
+from typing import Dict, Tuple, Union
+
+
+class SQLitePerformanceProfile:
+
+    """
+    Conjunto de PRAGMAs de desempenho aplicados a cada conexão SQLite ao conectar
+    """
+
+    JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+    SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+    TEMP_STORES = ("DEFAULT", "FILE", "MEMORY")
+
+    def __init__(self, journal_mode: str = "WAL", synchronous: str = "NORMAL", cache_size: int = -2000,
+                 mmap_size: int = 0, temp_store: str = "DEFAULT", busy_timeout: int = 5000) -> None:
+
+        """Inicializa um objeto SQLitePerformanceProfile
+
+        Parameters
+        ----------
+        journal_mode: str
+            Modo do diário de transações (PRAGMA journal_mode). WAL permite leituras durante uma escrita
+        synchronous: str
+            Frequência de sincronização com o disco (PRAGMA synchronous)
+        cache_size: int
+            Tamanho do cache de páginas (PRAGMA cache_size). Valores negativos são em KiB
+        mmap_size: int
+            Quantidade máxima de bytes do arquivo mapeados em memória (PRAGMA mmap_size)
+        temp_store: str
+            Local das tabelas e índices temporários (PRAGMA temp_store)
+        busy_timeout: int
+            Tempo máximo, em milissegundos, de espera por um bloqueio (PRAGMA busy_timeout)
+        """
+
+        if not isinstance(journal_mode, str) or journal_mode.upper() not in self.JOURNAL_MODES:
+
+            raise ValueError(f"O modo do diário deve ser um dos seguintes: {', '.join(self.JOURNAL_MODES)}")
+
+        if not isinstance(synchronous, str) or synchronous.upper() not in self.SYNCHRONOUS_MODES:
+
+            raise ValueError(f"O modo de sincronização deve ser um dos seguintes: {', '.join(self.SYNCHRONOUS_MODES)}")
+
+        if not isinstance(temp_store, str) or temp_store.upper() not in self.TEMP_STORES:
+
+            raise ValueError(f"O armazenamento temporário deve ser um dos seguintes: {', '.join(self.TEMP_STORES)}")
+
+        if not isinstance(cache_size, int):
+
+            raise ValueError("O tamanho do cache deve ser um inteiro!")
+
+        if not isinstance(mmap_size, int) or mmap_size < 0:
+
+            raise ValueError("O tamanho do mapeamento em memória deve ser um inteiro não negativo!")
+
+        if not isinstance(busy_timeout, int) or busy_timeout < 0:
+
+            raise ValueError("O tempo de espera por bloqueio deve ser um inteiro não negativo!")
+
+        self.journal_mode = journal_mode.upper()
+        self.synchronous = synchronous.upper()
+        self.cache_size = cache_size
+        self.mmap_size = mmap_size
+        self.temp_store = temp_store.upper()
+        self.busy_timeout = busy_timeout
+
+    def pragmas(self) -> Tuple[str]:
+
+        """Monta os comandos PRAGMA do perfil, na ordem em que devem ser executados
+
+        Returns
+        -------
+        Tuple[str]
+            Comandos PRAGMA
+        """
+
+        return (
+            f"PRAGMA busy_timeout = {self.busy_timeout}",
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA cache_size = {self.cache_size}",
+            f"PRAGMA mmap_size = {self.mmap_size}",
+            f"PRAGMA temp_store = {self.temp_store}",
+        )
+
+    @classmethod
+    def resolve(cls, profile: Union['SQLitePerformanceProfile', str, None]) -> Union['SQLitePerformanceProfile', None]:
+
+        """Obtém um perfil a partir do seu nome, ou o próprio perfil caso já seja um objeto
+
+        Parameters
+        ----------
+        profile: Union[SQLitePerformanceProfile, str, None]
+            Perfil, nome de um perfil predefinido (durable, balanced ou bulk-load) ou None
+
+        Returns
+        -------
+        Union[SQLitePerformanceProfile, None]
+            Perfil correspondente, ou None se nenhum perfil foi informado
+        """
+
+        if profile is None or isinstance(profile, SQLitePerformanceProfile):
+
+            return profile
+
+        if not isinstance(profile, str) or profile not in PERFORMANCE_PROFILES:
+
+            raise ValueError(f"O perfil de desempenho deve ser um dos seguintes: {', '.join(PERFORMANCE_PROFILES)}")
+
+        return PERFORMANCE_PROFILES[profile]
+
+
+# Perfis predefinidos
+PERFORMANCE_PROFILES: Dict[str, SQLitePerformanceProfile] = {
+    # Nenhuma transação confirmada é perdida, mesmo em caso de queda de energia
+    "durable": SQLitePerformanceProfile(
+        journal_mode="WAL", synchronous="FULL", cache_size=-2000,
+        mmap_size=0, temp_store="DEFAULT", busy_timeout=5000,
+    ),
+    # Uma queda de energia pode desfazer as últimas transações, mas nunca corrompe o banco
+    "balanced": SQLitePerformanceProfile(
+        journal_mode="WAL", synchronous="NORMAL", cache_size=-64000,
+        mmap_size=256 * 1024 * 1024, temp_store="MEMORY", busy_timeout=5000,
+    ),
+    # Cargas em massa que podem ser refeitas do início em caso de falha
+    "bulk-load": SQLitePerformanceProfile(
+        journal_mode="WAL", synchronous="OFF", cache_size=-256000,
+        mmap_size=1024 * 1024 * 1024, temp_store="MEMORY", busy_timeout=5000,
+    ),
+}
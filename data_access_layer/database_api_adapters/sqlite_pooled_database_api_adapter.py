@@ -0,0 +1,551 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, Union, Any
+
+
+from data_access_layer.database_api_adapters.database_api_adapter import DatabaseAPIAdapter
+from data_access_layer.database_api_adapters.query_instrumentation import parameters_sequence_shape, parameters_shape
+from data_access_layer.database_api_adapters.sqlite_performance_profile import SQLitePerformanceProfile
+
+
+class SQLitePooledDatabaseAPIAdapter(DatabaseAPIAdapter):
+
+    """
+    Adaptador da API do SQLite com um conjunto (pool) limitado de conexões, seguro para uso por várias threads.
+
+    Cada operação obtém uma conexão do pool e a devolve ao terminar. Dentro de 'transaction' a conexão
+    fica presa à thread até o fim do bloco, de modo que todos os comandos do bloco usem a mesma transação.
+    Com o modo WAL (padrão dos perfis predefinidos), leituras concorrentes não são bloqueadas por uma escrita
+    """
+
+    def __init__(self, filename: str, pool_size: int = 5, acquire_timeout: Union[float, None] = None,
+                 profile: Union[SQLitePerformanceProfile, str] = "balanced", statement_cache_size: int = 128,
+                 setup: Union[Callable[[sqlite3.Connection], None], None] = None) -> None:
+
+        """Inicializa um objeto SQLitePooledDatabaseAPIAdapter
+
+        Parameters
+        ----------
+        filename: str
+            Nome do arquivo do banco de dados
+        pool_size: int
+            Quantidade máxima de conexões abertas ao mesmo tempo
+        acquire_timeout: Union[float, None]
+            Tempo máximo, em segundos, de espera por uma conexão livre. Se None, espera indefinidamente
+        profile: Union[SQLitePerformanceProfile, str]
+            Perfil de desempenho, ou nome de um perfil predefinido (durable, balanced ou bulk-load),
+            aplicado a cada conexão aberta
+        statement_cache_size: int
+            Quantidade de comandos preparados mantidos em cache por cada conexão
+        setup: Union[Callable[[sqlite3.Connection], None], None]
+            Função executada uma única vez sobre a primeira conexão aberta, antes de qualquer comando
+            (por exemplo, a aplicação das migrações). Se None, as conexões são usadas diretamente
+        """
+
+        if not isinstance(filename, str) or filename == "":
+
+            raise ValueError("O nome do arquivo do banco deve ser uma sequência de caracteres não vazio!")
+
+        if filename == ":memory:":
+
+            # Cada conexão a ':memory:' abriria um banco de dados diferente
+            raise ValueError("O pool de conexões exige um banco de dados em arquivo!")
+
+        if not isinstance(pool_size, int) or pool_size <= 0:
+
+            raise ValueError("O tamanho do pool deve ser um inteiro positivo!")
+
+        if not isinstance(statement_cache_size, int) or statement_cache_size < 0:
+
+            raise ValueError("O tamanho do cache de comandos deve ser um inteiro não negativo!")
+
+        self._filename = filename
+        self._statement_cache_size = statement_cache_size
+        self._pool_size = pool_size
+        self._acquire_timeout = acquire_timeout
+        self._profile = SQLitePerformanceProfile.resolve(profile)
+        self._setup = setup
+
+        self._idle_connections: "LifoQueue[sqlite3.Connection]" = LifoQueue(maxsize=pool_size)
+        self._all_connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._open = False
+
+    @property
+    def pool_size(self) -> int:
+
+        """Acessa o valor do atributo privado 'pool_size'
+
+        Returns
+        -------
+        int
+            Quantidade máxima de conexões abertas ao mesmo tempo
+        """
+
+        return self._pool_size
+
+    def connect(self) -> None:
+
+        # As conexões são abertas sob demanda, conforme as threads as solicitam
+        self._open = True
+
+    def _create_connection(self) -> sqlite3.Connection:
+
+        """Abre uma nova conexão com o banco de dados
+
+        Returns
+        -------
+        sqlite3.Connection
+            Conexão que pode ser usada por qualquer thread, desde que por uma de cada vez
+        """
+
+        connection = sqlite3.connect(
+            self._filename, check_same_thread=False, cached_statements=self._statement_cache_size
+        )
+
+        if self._profile is not None:
+
+            for pragma in self._profile.pragmas():
+
+                connection.execute(pragma).close()
+
+        # As conexões são criadas sob o bloqueio do pool: nenhuma outra é aberta antes do fim da preparação
+        if self._setup is not None:
+
+            try:
+
+                self._setup(connection)
+
+            except BaseException:
+
+                connection.close()
+
+                raise
+
+            self._setup = None
+
+        return connection
+
+    def acquire(self) -> sqlite3.Connection:
+
+        """Obtém uma conexão do pool para a thread atual, aguardando caso todas estejam em uso.
+        Chamadas aninhadas na mesma thread recebem a mesma conexão
+
+        Returns
+        -------
+        sqlite3.Connection
+            Conexão reservada para a thread atual até a chamada correspondente de 'release'
+        """
+
+        if not self._open:
+
+            raise RuntimeError("O pool de conexões não está aberto!")
+
+        local = self._local
+
+        if getattr(local, "acquired", 0) > 0:
+
+            local.acquired += 1
+
+            return local.connection
+
+        try:
+
+            connection = self._idle_connections.get_nowait()
+
+        except Empty:
+
+            connection = None
+
+            with self._lock:
+
+                if len(self._all_connections) < self._pool_size:
+
+                    connection = self._create_connection()
+
+                    self._all_connections.append(connection)
+
+            if connection is None:
+
+                try:
+
+                    connection = self._idle_connections.get(timeout=self._acquire_timeout)
+
+                except Empty:
+
+                    raise TimeoutError("Nenhuma conexão do pool ficou livre a tempo!") from None
+
+        local.connection = connection
+        local.acquired = 1
+        local.transaction_depth = 0
+
+        return connection
+
+    def release(self, connection: sqlite3.Connection) -> None:
+
+        """Devolve ao pool uma conexão obtida por 'acquire'
+
+        Parameters
+        ----------
+        connection: sqlite3.Connection
+            Conexão obtida pela thread atual
+        """
+
+        local = self._local
+
+        if getattr(local, "acquired", 0) == 0 or local.connection is not connection:
+
+            raise RuntimeError("A conexão não pertence à thread atual!")
+
+        local.acquired -= 1
+
+        if local.acquired > 0:
+
+            return
+
+        local.connection = None
+
+        if connection.in_transaction:
+
+            # Nunca devolve ao pool uma conexão com transação pendente
+            connection.rollback()
+
+        with self._lock:
+
+            # Conexões abertas antes de um 'close_connection' não pertencem mais ao pool, mesmo após um novo 'connect'
+            current = self._open and connection in self._all_connections
+
+        if current:
+
+            self._idle_connections.put_nowait(connection)
+
+        else:
+
+            connection.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+
+        """Obtém uma conexão do pool durante o bloco 'with', devolvendo-a ao final
+
+        Returns
+        -------
+        Iterator[sqlite3.Connection]
+            Conexão reservada para a thread atual
+        """
+
+        connection = self.acquire()
+
+        try:
+
+            yield connection
+
+        finally:
+
+            self.release(connection)
+
+    def execute(self, query: str, parameters: Tuple[Any]=()) -> Union[int, None]:
+
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
+        commit_duration = None
+
+        with self.connection() as connection:
+
+            cursor = connection.cursor()
+
+            try:
+
+                cursor.execute(query, parameters)
+
+                row_count = cursor.rowcount
+                last_row_id = cursor.lastrowid
+
+            finally:
+
+                cursor.close()
+
+            if self._local.transaction_depth == 0:
+
+                commit_start = time.perf_counter() if listeners else 0.0
+
+                connection.commit()
+
+                if listeners:
+
+                    commit_duration = time.perf_counter() - commit_start
+
+        if listeners:
+
+            self._notify("execute", query, parameters_shape(parameters), start, row_count, commit_duration)
+
+        return last_row_id
+
+    def execute_many(self, query: str, parameters_sequence: Sequence[Tuple[Any]]) -> None:
+
+        with self.transaction():
+
+            listeners = self._listeners
+            start = time.perf_counter() if listeners else 0.0
+
+            cursor = self._local.connection.cursor()
+
+            try:
+
+                cursor.executemany(query, parameters_sequence)
+
+                row_count = cursor.rowcount
+
+            finally:
+
+                cursor.close()
+
+            if listeners:
+
+                self._notify("execute_many", query, parameters_sequence_shape(parameters_sequence), start, row_count)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+
+        with self.connection() as connection:
+
+            local = self._local
+
+            if local.transaction_depth == 0:
+
+                begin, commit, rollback = "BEGIN IMMEDIATE", "COMMIT", "ROLLBACK"
+
+            else:
+
+                savepoint = f"sp_{local.transaction_depth}"
+                begin, commit, rollback = f"SAVEPOINT {savepoint}", f"RELEASE {savepoint}", f"ROLLBACK TO {savepoint}"
+
+            connection.execute(begin)
+
+            local.transaction_depth += 1
+
+            try:
+
+                yield
+
+            except BaseException:
+
+                local.transaction_depth -= 1
+
+                connection.execute(rollback)
+
+                if local.transaction_depth > 0:
+
+                    # ROLLBACK TO mantém o savepoint aberto
+                    connection.execute(commit)
+
+                raise
+
+            local.transaction_depth -= 1
+
+            listeners = self._listeners
+            start = time.perf_counter() if listeners else 0.0
+
+            connection.execute(commit)
+
+            if listeners and local.transaction_depth == 0:
+
+                self._notify("commit", commit, "()", start, None, time.perf_counter() - start)
+
+    def fetch_all(self, query: str, parameters: Tuple[Any]=()) -> Union[List[Dict[str, Any]], None]:
+
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
+
+        with self.connection() as connection:
+
+            cursor = connection.execute(query, parameters)
+
+            try:
+
+                rows = cursor.fetchall()
+
+                if listeners:
+
+                    self._notify("fetch_all", query, parameters_shape(parameters), start, len(rows))
+
+                if not rows:
+
+                    return None
+
+                column_names = list(map(lambda x: x[0], cursor.description))
+
+            finally:
+
+                cursor.close()
+
+        data = [
+            {column_name: value for column_name, value in zip(column_names, row)}
+            for row in rows
+        ]
+
+        return data
+
+    def iter_rows(self, query: str, parameters: Tuple[Any]=(), batch_size: int=1000) -> Iterator[Dict[str, Any]]:
+
+        if not isinstance(batch_size, int) or batch_size <= 0:
+
+            raise ValueError("O tamanho do lote deve ser um inteiro positivo!")
+
+        # A conexão fica reservada enquanto o iterador não for esgotado ou fechado
+        with self.connection() as connection:
+
+            cursor = connection.execute(query, parameters)
+
+            try:
+
+                column_names = list(map(lambda x: x[0], cursor.description))
+
+                while True:
+
+                    rows = cursor.fetchmany(batch_size)
+
+                    if not rows:
+
+                        break
+
+                    for row in rows:
+
+                        yield {column_name: value for column_name, value in zip(column_names, row)}
+
+            finally:
+
+                cursor.close()
+
+    def fetch_one(self, query: str, parameters: Tuple[Any]=()) -> Union[Dict[str, Any], None]:
+
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
+
+        with self.connection() as connection:
+
+            cursor = connection.execute(query, parameters)
+
+            try:
+
+                row = cursor.fetchone()
+
+                if listeners:
+
+                    self._notify("fetch_one", query, parameters_shape(parameters), start, 0 if row is None else 1)
+
+                if not row:
+
+                    return None
+
+                column_names = list(map(lambda x: x[0], cursor.description))
+
+            finally:
+
+                cursor.close()
+
+        data = {column_name: value for column_name, value in zip(column_names, row)}
+
+        return data
+
+    def fetch_all_tuples(self, query: str, parameters: Tuple[Any]=()) -> Union[List[Tuple[Any, ...]], None]:
+
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
+
+        with self.connection() as connection:
+
+            cursor = connection.execute(query, parameters)
+
+            try:
+
+                rows = cursor.fetchall()
+
+            finally:
+
+                cursor.close()
+
+        if listeners:
+
+            self._notify("fetch_all_tuples", query, parameters_shape(parameters), start, len(rows))
+
+        if not rows:
+
+            return None
+
+        return rows
+
+    def iter_tuples(self, query: str, parameters: Tuple[Any]=(), batch_size: int=1000) -> Iterator[Tuple[Any, ...]]:
+
+        if not isinstance(batch_size, int) or batch_size <= 0:
+
+            raise ValueError("O tamanho do lote deve ser um inteiro positivo!")
+
+        # A conexão fica reservada enquanto o iterador não for esgotado ou fechado
+        with self.connection() as connection:
+
+            cursor = connection.execute(query, parameters)
+
+            try:
+
+                while True:
+
+                    rows = cursor.fetchmany(batch_size)
+
+                    if not rows:
+
+                        break
+
+                    yield from rows
+
+            finally:
+
+                cursor.close()
+
+    def fetch_one_tuple(self, query: str, parameters: Tuple[Any]=()) -> Union[Tuple[Any, ...], None]:
+
+        listeners = self._listeners
+        start = time.perf_counter() if listeners else 0.0
+
+        with self.connection() as connection:
+
+            cursor = connection.execute(query, parameters)
+
+            try:
+
+                row = cursor.fetchone()
+
+            finally:
+
+                cursor.close()
+
+        if listeners:
+
+            self._notify("fetch_one_tuple", query, parameters_shape(parameters), start, 0 if row is None else 1)
+
+        return row
+
+    def close_connection(self) -> None:
+
+        # Conexões em uso deixam de ser contadas no pool e são fechadas quando devolvidas
+        self._open = False
+
+        while True:
+
+            try:
+
+                connection = self._idle_connections.get_nowait()
+
+            except Empty:
+
+                break
+
+            connection.close()
+
+        with self._lock:
+
+            self._all_connections.clear()
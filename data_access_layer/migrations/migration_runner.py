@@ -0,0 +1,548 @@
+"""Aplicação versionada das migrações do esquema do banco de dados SQLite
+
+Uso
+---
+    python -m data_access_layer.migrations.migration_runner database/schema.db --status
+    python -m data_access_layer.migrations.migration_runner database/schema.db --offline
+"""
+import os
+import re
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, NamedTuple, Set, Tuple, Union
+
+
+# Diretório com o script de criação do banco de dados (versão 0) e as migrações
+DATABASE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "database")
+
+# Nome dos arquivos de migração: <versão>_<nome>.sql
+MIGRATION_FILENAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+# Diretiva, no início do arquivo, das migrações lentas que não são aplicadas na inicialização do serviço
+OFFLINE_DIRECTIVE = "-- migration: offline"
+
+
+class Migration(NamedTuple):
+
+    """
+    Migração do esquema do banco de dados
+    """
+
+    version: int
+    name: str
+    path: str
+    offline: bool
+
+
+def _split_statements(script: str) -> List[str]:
+
+    """Divide um script SQL em comandos, respeitando os blocos BEGIN ... END dos gatilhos
+
+    Parameters
+    ----------
+    script: str
+        Conteúdo do script
+
+    Returns
+    -------
+    List[str]
+        Comandos do script, na ordem em que aparecem
+    """
+
+    statements = []
+    current = ""
+
+    for line in script.splitlines(keepends=True):
+
+        current += line
+
+        if sqlite3.complete_statement(current):
+
+            statements.append(current.strip())
+            current = ""
+
+    # Sobras sem ';' final (comentários ou um último comando)
+    if current.strip():
+
+        statements.append(current.strip())
+
+    return statements
+
+
+class MigrationRunner:
+
+    """
+    Aplica, em ordem e cada uma em sua própria transação, as migrações ainda não aplicadas a um banco de dados.
+    As versões aplicadas são registradas na tabela 'schema_migrations'.
+
+    A versão 0 é o script 'init.sql', que cria o banco de dados. Um banco criado por ele antes do controle de
+    versões é reconhecido pela existência da tabela 'task', e a versão 0 é apenas registrada
+    """
+
+    def __init__(self, filename: str, directory: str = DATABASE_DIRECTORY) -> None:
+
+        """Inicializa um objeto MigrationRunner
+
+        Parameters
+        ----------
+        filename: str
+            Caminho do arquivo do banco de dados. É criado se não existir
+        directory: str
+            Diretório com o script 'init.sql' e o subdiretório 'migrations' (padrão: diretório 'database' do projeto)
+        """
+
+        if not isinstance(filename, str) or filename == "" or filename == ":memory:":
+
+            raise ValueError("As migrações devem ser aplicadas a um arquivo de banco de dados!")
+
+        self._filename = filename
+        self._directory = directory
+
+    def available_migrations(self) -> Tuple[Migration]:
+
+        """Lista as migrações existentes no diretório, em ordem de versão
+
+        Returns
+        -------
+        Tuple[Migration]
+            Migrações disponíveis, a começar pela versão 0 ('init.sql')
+        """
+
+        migrations = [Migration(0, "init", os.path.join(self._directory, "init.sql"), False)]
+
+        migrations_directory = os.path.join(self._directory, "migrations")
+
+        for filename in sorted(os.listdir(migrations_directory)) if os.path.isdir(migrations_directory) else ():
+
+            match = MIGRATION_FILENAME.match(filename)
+
+            if match is None:
+
+                continue
+
+            path = os.path.join(migrations_directory, filename)
+
+            with open(path, encoding="utf-8") as migration_file:
+
+                offline = migration_file.readline().strip().lower() == OFFLINE_DIRECTIVE
+
+            migrations.append(Migration(int(match.group(1)), match.group(2), path, offline))
+
+        migrations.sort(key=lambda migration: migration.version)
+
+        versions = [migration.version for migration in migrations]
+
+        if len(set(versions)) != len(versions):
+
+            raise ValueError("Há migrações com a mesma versão!")
+
+        return tuple(migrations)
+
+    @contextmanager
+    def _connect(self, connection: Union[sqlite3.Connection, None] = None) -> Iterator[sqlite3.Connection]:
+
+        """Obtém uma conexão sem transações implícitas e garante a existência da tabela de versões
+
+        Parameters
+        ----------
+        connection: Union[sqlite3.Connection, None]
+            Conexão já aberta com o banco de dados, cujas transações implícitas são desativadas apenas durante
+            o bloco. Se None, abre uma nova conexão, fechada ao final do bloco
+
+        Returns
+        -------
+        Iterator[sqlite3.Connection]
+            Gerenciador de contexto da conexão com o banco de dados
+        """
+
+        own_connection = connection is None
+
+        if own_connection:
+
+            connection = sqlite3.connect(self._filename, isolation_level=None)
+
+        isolation_level = connection.isolation_level
+        connection.isolation_level = None
+
+        try:
+
+            connection.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations(
+                version INTEGER PRIMARY KEY,
+                name VARCHAR NOT NULL,
+                applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """)
+
+            yield connection
+
+        finally:
+
+            if own_connection:
+
+                connection.close()
+
+            else:
+
+                connection.isolation_level = isolation_level
+
+    def _applied_versions(self, connection: sqlite3.Connection) -> Set[int]:
+
+        """Obtém as versões já aplicadas, registrando a versão 0 de bancos anteriores ao controle de versões
+
+        Parameters
+        ----------
+        connection: sqlite3.Connection
+            Conexão com o banco de dados
+
+        Returns
+        -------
+        Set[int]
+            Versões aplicadas
+        """
+
+        versions = {row[0] for row in connection.execute("SELECT version FROM schema_migrations")}
+
+        if 0 not in versions:
+
+            legacy = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task'"
+            ).fetchone()
+
+            if legacy is not None:
+
+                connection.execute("INSERT OR IGNORE INTO schema_migrations(version, name) VALUES (0, 'init')")
+
+                versions.add(0)
+
+        return versions
+
+    @contextmanager
+    def _connect_read_only(self) -> Iterator[Union[sqlite3.Connection, None]]:
+
+        """Obtém uma conexão somente leitura, para as consultas que não devem alterar o banco de dados
+
+        Returns
+        -------
+        Iterator[Union[sqlite3.Connection, None]]
+            Gerenciador de contexto da conexão com o banco de dados, ou de None se o arquivo não existe
+        """
+
+        if not os.path.exists(self._filename):
+
+            yield None
+
+            return
+
+        # Importado aqui: as consultas de estado não fazem parte da inicialização dos serviços
+        from urllib.request import pathname2url
+
+        connection = sqlite3.connect(f"file:{pathname2url(os.path.abspath(self._filename))}?mode=ro", uri=True)
+
+        try:
+
+            yield connection
+
+        finally:
+
+            connection.close()
+
+    def _read_applied_versions(self) -> Set[int]:
+
+        """Obtém as versões já aplicadas sem alterar o banco de dados: nem a tabela de versões nem o registro
+        da versão 0 de bancos anteriores ao controle de versões são criados
+
+        Returns
+        -------
+        Set[int]
+            Versões aplicadas
+        """
+
+        with self._connect_read_only() as connection:
+
+            if connection is None:
+
+                return set()
+
+            tables = {row[0] for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('schema_migrations', 'task')"
+            )}
+
+            versions = set()
+
+            if "schema_migrations" in tables:
+
+                versions = {row[0] for row in connection.execute("SELECT version FROM schema_migrations")}
+
+            if "task" in tables:
+
+                versions.add(0)
+
+        return versions
+
+    def current_version(self) -> Union[int, None]:
+
+        """Obtém a maior versão aplicada ao banco de dados, sem alterá-lo
+
+        Returns
+        -------
+        Union[int, None]
+            Maior versão aplicada, ou None se o banco de dados ainda não foi criado
+        """
+
+        versions = self._read_applied_versions()
+
+        return max(versions) if versions else None
+
+    def pending_migrations(self) -> Tuple[Migration]:
+
+        """Lista as migrações ainda não aplicadas ao banco de dados, sem alterá-lo
+
+        Returns
+        -------
+        Tuple[Migration]
+            Migrações pendentes, em ordem de versão
+        """
+
+        versions = self._read_applied_versions()
+
+        return tuple([migration for migration in self.available_migrations() if migration.version not in versions])
+
+    def migrate(self, include_offline: bool = False, progress: Union[Callable[[str], None], None] = None,
+                progress_interval: float = 1.0, connection: Union[sqlite3.Connection, None] = None) -> Tuple[Migration]:
+
+        """Aplica as migrações pendentes, em ordem de versão, cada uma em uma única transação
+
+        Parameters
+        ----------
+        include_offline: bool
+            Se False, para na primeira migração marcada como offline, que deve ser aplicada com o serviço parado.
+            Um banco de dados criado nesta execução recebe também as migrações offline (padrão: False)
+        progress: Union[Callable[[str], None], None]
+            Função que recebe mensagens de progresso. Durante comandos longos, como a criação de um índice
+            sobre uma tabela grande, é chamada a cada 'progress_interval' segundos
+        progress_interval: float
+            Intervalo mínimo, em segundos, entre as mensagens de um mesmo comando (padrão: 1.0)
+        connection: Union[sqlite3.Connection, None]
+            Conexão já aberta com o banco de dados, sem transação em andamento, que continua aberta ao final.
+            Se None, abre uma conexão apenas para as migrações (padrão: None)
+
+        Returns
+        -------
+        Tuple[Migration]
+            Migrações aplicadas
+        """
+
+        report = progress or (lambda message: None)
+        applied = []
+
+        with self._connect(connection) as connection:
+
+            versions = self._applied_versions(connection)
+
+            # Um banco criado nesta execução tem as tabelas vazias, e as migrações offline são aplicadas com as demais
+            include_offline = include_offline or 0 not in versions
+
+            # Sem migrações pendentes, a inicialização não chega a pedir a trava de escrita
+            for migration in self.available_migrations():
+
+                if migration.version in versions:
+
+                    continue
+
+                if migration.offline and not include_offline:
+
+                    report(f"Migração {migration.version:04d} ({migration.name}) é offline e não foi aplicada")
+
+                    break
+
+                if self._apply(connection, migration, report, progress_interval if progress else None):
+
+                    applied.append(migration)
+
+        return tuple(applied)
+
+    def _apply(self, connection: sqlite3.Connection, migration: Migration, report: Callable[[str], None],
+               progress_interval: Union[float, None]) -> bool:
+
+        """Aplica uma migração em uma transação, caso ela ainda não tenha sido aplicada
+
+        Parameters
+        ----------
+        connection: sqlite3.Connection
+            Conexão com o banco de dados
+        migration: Migration
+            Migração aplicada
+        report: Callable[[str], None]
+            Função que recebe as mensagens de progresso
+        progress_interval: Union[float, None]
+            Intervalo entre as mensagens de progresso de um comando. Se None, não há mensagens durante os comandos
+
+        Returns
+        -------
+        bool
+            True se a migração foi aplicada, False se ela já havia sido aplicada
+        """
+
+        with open(migration.path, encoding="utf-8") as migration_file:
+
+            statements = _split_statements(migration_file.read())
+
+        label = f"Migração {migration.version:04d} ({migration.name})"
+
+        # A trava de escrita impede que dois processos apliquem a mesma migração
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+
+            if migration.version in self._applied_versions(connection):
+
+                connection.execute("ROLLBACK")
+
+                return False
+
+            start = time.monotonic()
+
+            for number, statement in enumerate(statements, 1):
+
+                if progress_interval is not None:
+
+                    connection.set_progress_handler(
+                        self._progress_handler(f"{label}: comando {number}/{len(statements)}", report, progress_interval),
+                        10_000
+                    )
+
+                connection.execute(statement)
+
+            connection.execute(
+                "INSERT INTO schema_migrations(version, name) VALUES (?, ?)", (migration.version, migration.name)
+            )
+
+            connection.execute("COMMIT")
+
+        except BaseException:
+
+            if connection.in_transaction:
+
+                connection.execute("ROLLBACK")
+
+            raise
+
+        finally:
+
+            connection.set_progress_handler(None, 0)
+
+        report(f"{label} aplicada em {time.monotonic() - start:.1f} s")
+
+        return True
+
+    @staticmethod
+    def _progress_handler(label: str, report: Callable[[str], None], interval: float) -> Callable[[], int]:
+
+        """Cria a função chamada periodicamente pelo SQLite durante a execução de um comando
+
+        Parameters
+        ----------
+        label: str
+            Descrição do comando em execução
+        report: Callable[[str], None]
+            Função que recebe as mensagens de progresso
+        interval: float
+            Intervalo mínimo, em segundos, entre as mensagens
+
+        Returns
+        -------
+        Callable[[], int]
+            Função de progresso, que sempre permite a continuação do comando
+        """
+
+        start = time.monotonic()
+        last_report = [start]
+
+        def handler() -> int:
+
+            now = time.monotonic()
+
+            if now - last_report[0] >= interval:
+
+                last_report[0] = now
+
+                report(f"{label}, {now - start:.0f} s")
+
+            return 0
+
+        return handler
+
+
+def migrate_database(filename: str, connection: Union[sqlite3.Connection, None] = None) -> Tuple[Migration]:
+
+    """Aplica as migrações pendentes que não são offline. Usado na inicialização dos serviços
+
+    Parameters
+    ----------
+    filename: str
+        Caminho do arquivo do banco de dados
+    connection: Union[sqlite3.Connection, None]
+        Conexão já aberta com o banco de dados, reaproveitada pelas migrações. Se None, abre uma conexão própria
+
+    Returns
+    -------
+    Tuple[Migration]
+        Migrações aplicadas
+    """
+
+    return MigrationRunner(filename).migrate(connection=connection)
+
+
+def main(arguments: List[str] = None) -> int:
+
+    """Aplica ou lista as migrações pela linha de comando
+
+    Parameters
+    ----------
+    arguments: List[str]
+        Argumentos da linha de comando. Se None, usa sys.argv
+
+    Returns
+    -------
+    int
+        Código de saída: 0 em caso de sucesso
+    """
+
+    # Importado aqui: o módulo também é usado na abertura da conexão da aplicação, onde o argparse não é necessário
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Migrações do esquema do banco de dados do gerenciador de tarefas")
+    parser.add_argument("filename", help="Arquivo do banco de dados")
+    parser.add_argument("--status", action="store_true", help="Apenas lista a versão atual e as migrações pendentes")
+    parser.add_argument("--offline", action="store_true", help="Aplica também as migrações offline (com o serviço parado)")
+    parser.add_argument("--progress-interval", type=float, default=1.0, help="Segundos entre as mensagens de progresso")
+
+    options = parser.parse_args(arguments)
+
+    runner = MigrationRunner(options.filename)
+
+    if options.status:
+
+        print(f"Versão atual: {runner.current_version()}")
+
+        for migration in runner.pending_migrations():
+
+            print(f"Pendente: {migration.version:04d} {migration.name}{' (offline)' if migration.offline else ''}")
+
+        return 0
+
+    runner.migrate(
+        include_offline=options.offline,
+        progress=lambda message: print(message, file=sys.stderr),
+        progress_interval=options.progress_interval,
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+
+    sys.exit(main())
@@ -0,0 +1,2 @@
+-- Índice para as consultas de tarefas filtradas e agregadas por status
+CREATE INDEX IF NOT EXISTS idx_task_status_id ON task(status_id, id);
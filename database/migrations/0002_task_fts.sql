@@ -0,0 +1,26 @@
+-- migration: offline
+-- Índice de busca textual (FTS5) sobre o nome e a descrição das tarefas.
+-- A tabela virtual não guarda cópia dos textos (content='task'); os gatilhos a mantêm sincronizada.
+-- Offline: a indexação das tarefas existentes ('rebuild') percorre a tabela inteira em uma única transação
+CREATE VIRTUAL TABLE IF NOT EXISTS task_fts USING fts5(
+    name,
+    description,
+    content='task',
+    content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS task_fts_insert AFTER INSERT ON task BEGIN
+    INSERT INTO task_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS task_fts_delete AFTER DELETE ON task BEGIN
+    INSERT INTO task_fts(task_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS task_fts_update AFTER UPDATE OF name, description ON task BEGIN
+    INSERT INTO task_fts(task_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+    INSERT INTO task_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+END;
+
+-- Indexa as tarefas já existentes
+INSERT INTO task_fts(task_fts) VALUES ('rebuild');
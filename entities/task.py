@@ -6,6 +6,9 @@ class Task:
     Representação da entidade tarefa no domínio da aplicação
     """
 
+    # Sem __dict__ por instância: listagens grandes criam muitos objetos Task
+    __slots__ = ("_id", "_name", "_description", "_status")
+
     def __init__(self, id: int, name: str, description: str, status: TaskStatus):
 
         """Inicializa um objeto Task
@@ -27,6 +30,39 @@ class Task:
         self.set_description(description)
         self.set_status(status)
     
+    @classmethod
+    def _from_row(cls, id: int, name: str, description: str, status: TaskStatus) -> 'Task':
+
+        """Cria um objeto Task sem validar os dados, para registros lidos do banco de dados.
+        Cabe ao DAO entregar os tipos esperados: o esquema aceita descrições nulas, que o DAO converte
+        em texto vazio. Dados informados pelo usuário devem usar o construtor
+
+        Parameters
+        ----------
+        id: int
+            Identificador da tarefa
+        name: str
+            Nome da tarefa
+        description: str
+            Descrição da tarefa
+        status: entities.task_status.TaskStatus
+            Status da tarefa
+
+        Returns
+        -------
+        entities.task.Task
+            Objeto Task com os dados informados
+        """
+
+        task = object.__new__(cls)
+
+        task._id = id
+        task._name = name
+        task._description = description
+        task._status = status
+
+        return task
+    
     def set_id(self, id: int) -> None:
 
         """Modifica o valor do atributo privado 'id'
@@ -4,6 +4,8 @@ class TaskStatus:
     Representação da entidade status da tarefa no domínio da aplicação
     """
 
+    __slots__ = ("_id", "_name")
+
     def __init__(self, id: int, name: str):
 
         """Inicializa um objeto TaskStatus
@@ -19,6 +21,62 @@ class TaskStatus:
         self.set_id(id)
         self.set_name(name)
     
+    @classmethod
+    def _from_row(cls, id: int, name: str) -> 'TaskStatus':
+
+        """Cria um objeto TaskStatus sem validar os dados, para registros lidos do banco de dados,
+        cujo esquema já garante os tipos. Dados informados pelo usuário devem usar o construtor
+
+        Parameters
+        ----------
+        id: int
+            Identificador do status da tarefa
+        name: str
+            Nome do status da tarefa
+
+        Returns
+        -------
+        entities.task_status.TaskStatus
+            Objeto TaskStatus com os dados informados
+        """
+
+        task_status = object.__new__(cls)
+
+        task_status._id = id
+        task_status._name = name
+
+        return task_status
+    
+    @classmethod
+    def shared(cls, id: int, name: str) -> 'TaskStatus':
+
+        """Obtém a instância compartilhada (flyweight) do status com o identificador e o nome informados.
+        Há poucos status distintos, então todas as tarefas com o mesmo status podem apontar para um
+        único objeto, que não pode ser alterado. Assim como '_from_row', não valida os dados
+
+        Parameters
+        ----------
+        id: int
+            Identificador do status da tarefa
+        name: str
+            Nome do status da tarefa
+
+        Returns
+        -------
+        entities.task_status.TaskStatus
+            Objeto TaskStatus imutável, o mesmo para todas as chamadas com os mesmos dados
+        """
+
+        key = (id, name)
+
+        task_status = _SHARED_TASK_STATUS.get(key)
+
+        if task_status is None:
+
+            task_status = _SHARED_TASK_STATUS.setdefault(key, _SharedTaskStatus._from_row(id, name))
+
+        return task_status
+    
     def set_id(self, id: int):
 
         """Modifica o valor do atributo privado 'id'
@@ -75,4 +133,25 @@ class TaskStatus:
             Nome do status da tarefa
         """
 
-        return self._name
\ No newline at end of file
+        return self._name
+
+
+class _SharedTaskStatus(TaskStatus):
+
+    """
+    Status da tarefa compartilhado entre várias tarefas, obtido por TaskStatus.shared
+    """
+
+    __slots__ = ()
+
+    def set_id(self, id: int):
+
+        raise AttributeError("Um status compartilhado não pode ser alterado!")
+
+    def set_name(self, name: str):
+
+        raise AttributeError("Um status compartilhado não pode ser alterado!")
+
+
+# Instâncias compartilhadas, indexadas por (identificador, nome)
+_SHARED_TASK_STATUS = {}
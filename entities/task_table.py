@@ -0,0 +1,384 @@
+from array import array
+from collections import Counter
+from itertools import accumulate, compress, islice
+from typing import Dict, Iterable, Iterator, Sequence, Tuple, Union
+
+
+from entities.task import Task
+from entities.task_status import TaskStatus
+
+# Quantidade de linhas convertidas por vez ao montar uma tabela
+_CHUNK_SIZE = 1000
+
+class TaskTable:
+
+    """
+    Conjunto de tarefas em formato colunar, para relatórios e leituras em massa.
+
+    Os identificadores das tarefas e dos status ficam em buffers array('q'), e os nomes e descrições
+    ficam em um único bloco de bytes UTF-8, delimitados por deslocamentos. Filtros, contagens e fatias
+    operam sobre esses buffers, sem criar um objeto Task por linha
+    """
+
+    __slots__ = ("_ids", "_status_ids", "_text", "_offsets", "_statuses")
+
+    def __init__(self, ids: array, status_ids: array, text: bytes, offsets: array, statuses: Dict[int, TaskStatus]):
+
+        """Inicializa um objeto TaskTable
+
+        Parameters
+        ----------
+        ids: array
+            Identificadores das tarefas (array('q'))
+        status_ids: array
+            Identificador do status de cada tarefa (array('q'))
+        text: bytes
+            Nomes e descrições das tarefas em UTF-8, na ordem nome, descrição, nome, descrição...
+        offsets: array
+            Deslocamentos em 'text' (array('q')): o nome da tarefa i ocupa [offsets[2i], offsets[2i + 1])
+            e a descrição, [offsets[2i + 1], offsets[2i + 2])
+        statuses: Dict[int, entities.task_status.TaskStatus]
+            Status das tarefas, indexados pelo identificador
+        """
+
+        if len(status_ids) != len(ids) or len(offsets) != 2 * len(ids) + 1:
+
+            raise ValueError("As colunas da tabela devem ter o mesmo número de linhas!")
+
+        self._ids = ids
+        self._status_ids = status_ids
+        self._text = text
+        self._offsets = offsets
+        self._statuses = statuses
+
+    @classmethod
+    def _from_rows(cls, rows: Iterable[Tuple[int, str, str, int, str]]) -> 'TaskTable':
+
+        """Monta uma tabela a partir das linhas da junção entre 'task' e 'task_status'
+
+        Parameters
+        ----------
+        rows: Iterable[Tuple[int, str, str, int, str]]
+            Linhas (id, nome, descrição, id do status, nome do status), consumidas sob demanda
+
+        Returns
+        -------
+        entities.task_table.TaskTable
+            Tabela com as linhas, na ordem em que foram lidas
+        """
+
+        ids = array("q")
+        status_ids = array("q")
+        text = bytearray()
+        offsets = array("q", [0])
+        statuses: Dict[int, TaskStatus] = {}
+
+        rows = iter(rows)
+
+        # As linhas são copiadas em blocos: cada coluna do bloco é convertida por um único laço interno
+        for chunk in iter(lambda: list(islice(rows, _CHUNK_SIZE)), []):
+
+            chunk_ids, names, descriptions, chunk_status_ids, status_names = zip(*chunk)
+
+            ids.extend(chunk_ids)
+            status_ids.extend(chunk_status_ids)
+
+            fields = [None] * (2 * len(chunk))
+            fields[0::2] = names
+            fields[1::2] = descriptions
+
+            encoded = [field.encode() if field else b"" for field in fields]
+
+            text += b"".join(encoded)
+            offsets.extend(islice(accumulate(map(len, encoded), initial=offsets[-1]), 1, None))
+
+            for status_id, status_name in set(zip(chunk_status_ids, status_names)):
+
+                if status_id not in statuses:
+
+                    statuses[status_id] = TaskStatus.shared(status_id, status_name)
+
+        return cls(ids, status_ids, bytes(text), offsets, statuses)
+
+    def __len__(self) -> int:
+
+        return len(self._ids)
+
+    @property
+    def ids(self) -> memoryview:
+
+        """Identificadores das tarefas, sem cópia e somente para leitura
+        """
+
+        return memoryview(self._ids).toreadonly()
+
+    @property
+    def status_ids(self) -> memoryview:
+
+        """Identificador do status de cada tarefa, sem cópia e somente para leitura
+        """
+
+        return memoryview(self._status_ids).toreadonly()
+
+    @property
+    def memory_bytes(self) -> int:
+
+        """Memória aproximada ocupada pelos buffers da tabela, em bytes
+        """
+
+        return (
+            self._ids.itemsize * len(self._ids)
+            + self._status_ids.itemsize * len(self._status_ids)
+            + self._offsets.itemsize * len(self._offsets)
+            + len(self._text)
+        )
+
+    def name(self, index: int) -> str:
+
+        """Obtém o nome de uma tarefa
+
+        Parameters
+        ----------
+        index: int
+            Posição da tarefa na tabela
+
+        Returns
+        -------
+        str
+            Nome da tarefa
+        """
+
+        index = self._position(index)
+
+        return self._text[self._offsets[2 * index]:self._offsets[2 * index + 1]].decode()
+
+    def description(self, index: int) -> str:
+
+        """Obtém a descrição de uma tarefa
+
+        Parameters
+        ----------
+        index: int
+            Posição da tarefa na tabela
+
+        Returns
+        -------
+        str
+            Descrição da tarefa (vazia se a tarefa não tiver descrição)
+        """
+
+        index = self._position(index)
+
+        return self._text[self._offsets[2 * index + 1]:self._offsets[2 * index + 2]].decode()
+
+    def status(self, index: int) -> TaskStatus:
+
+        """Obtém o status de uma tarefa
+
+        Parameters
+        ----------
+        index: int
+            Posição da tarefa na tabela
+
+        Returns
+        -------
+        entities.task_status.TaskStatus
+            Status da tarefa
+        """
+
+        return self._statuses[self._status_ids[self._position(index)]]
+
+    def iter_names(self) -> Iterator[str]:
+
+        """Percorre os nomes das tarefas, decodificando um por vez
+
+        Returns
+        -------
+        Iterator[str]
+            Nomes das tarefas, na ordem da tabela
+        """
+
+        text = self._text
+        offsets = self._offsets
+
+        for index in range(len(self._ids)):
+
+            yield text[offsets[2 * index]:offsets[2 * index + 1]].decode()
+
+    def _position(self, index: int) -> int:
+
+        """Valida uma posição da tabela, aceitando posições negativas
+
+        Parameters
+        ----------
+        index: int
+            Posição informada
+
+        Returns
+        -------
+        int
+            Posição não negativa correspondente
+        """
+
+        size = len(self._ids)
+
+        if index < 0:
+
+            index += size
+
+        if not 0 <= index < size:
+
+            raise IndexError("Posição fora da tabela!")
+
+        return index
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Task, 'TaskTable']:
+
+        """Obtém uma tarefa (posição) ou uma nova tabela (fatia)
+
+        Parameters
+        ----------
+        key: Union[int, slice]
+            Posição da tarefa ou fatia da tabela
+
+        Returns
+        -------
+        Union[entities.task.Task, entities.task_table.TaskTable]
+            Objeto Task da posição, ou tabela com as linhas da fatia
+        """
+
+        if isinstance(key, slice):
+
+            start, stop, step = key.indices(len(self._ids))
+
+            if step != 1:
+
+                return self.take(range(start, stop, step))
+
+            stop = max(start, stop)
+
+            # Fatia contígua: os deslocamentos só precisam ser deslocados para o início do novo bloco
+            base = self._offsets[2 * start]
+
+            return TaskTable(
+                self._ids[start:stop],
+                self._status_ids[start:stop],
+                self._text[base:self._offsets[2 * stop]],
+                array("q", [offset - base for offset in self._offsets[2 * start:2 * stop + 1]]),
+                self._statuses,
+            )
+
+        index = self._position(key)
+
+        return Task._from_row(self._ids[index], self.name(index), self.description(index), self.status(index))
+
+    def take(self, indices: Iterable[int]) -> 'TaskTable':
+
+        """Cria uma tabela com as linhas das posições informadas
+
+        Parameters
+        ----------
+        indices: Iterable[int]
+            Posições das linhas, na ordem desejada. Aceita posições negativas
+
+        Returns
+        -------
+        entities.task_table.TaskTable
+            Nova tabela com as linhas selecionadas
+
+        Raises
+        ------
+        IndexError
+            Se alguma posição estiver fora da tabela
+        """
+
+        indices = indices if isinstance(indices, (list, range)) else list(indices)
+
+        # Só converte posição a posição se alguma for negativa ou estiver fora da tabela
+        if indices and (min(indices) < 0 or max(indices) >= len(self._ids)):
+
+            indices = [self._position(index) for index in indices]
+
+        ids = self._ids
+        status_ids = self._status_ids
+        text = self._text
+        offsets = self._offsets
+
+        # Comprimentos do nome e da descrição de cada linha, intercalados
+        lengths = [0] * (2 * len(indices))
+        lengths[0::2] = [offsets[2 * index + 1] - offsets[2 * index] for index in indices]
+        lengths[1::2] = [offsets[2 * index + 2] - offsets[2 * index + 1] for index in indices]
+
+        return TaskTable(
+            array("q", [ids[index] for index in indices]),
+            array("q", [status_ids[index] for index in indices]),
+            b"".join([text[offsets[2 * index]:offsets[2 * index + 2]] for index in indices]),
+            array("q", accumulate(lengths, initial=0)),
+            self._statuses,
+        )
+
+    def filter(self, mask: Sequence[bool]) -> 'TaskTable':
+
+        """Cria uma tabela com as linhas cuja posição correspondente em 'mask' é verdadeira
+
+        Parameters
+        ----------
+        mask: Sequence[bool]
+            Máscara com um valor por linha da tabela
+
+        Returns
+        -------
+        entities.task_table.TaskTable
+            Nova tabela com as linhas selecionadas
+        """
+
+        if len(mask) != len(self._ids):
+
+            raise ValueError("A máscara deve ter um valor por linha da tabela!")
+
+        return self.take(list(compress(range(len(self._ids)), mask)))
+
+    def where_status(self, *status_ids: int) -> 'TaskTable':
+
+        """Cria uma tabela com as tarefas de determinados status
+
+        Parameters
+        ----------
+        status_ids: int
+            Identificadores dos status desejados
+
+        Returns
+        -------
+        entities.task_table.TaskTable
+            Nova tabela com as tarefas desses status
+        """
+
+        wanted = frozenset(status_ids)
+
+        return self.take([index for index, status_id in enumerate(self._status_ids) if status_id in wanted])
+
+    def count_by_status(self) -> Tuple[Tuple[TaskStatus, int]]:
+
+        """Conta as tarefas da tabela agrupadas por status
+
+        Returns
+        -------
+        Tuple[Tuple[entities.task_status.TaskStatus, int]]
+            Pares (status, quantidade de tarefas), ordenados pelo identificador do status
+        """
+
+        counts = Counter(self._status_ids)
+
+        return tuple([(self._statuses[status_id], counts[status_id]) for status_id in sorted(counts)])
+
+    def to_tasks(self) -> Tuple[Task]:
+
+        """Converte a tabela em objetos Task
+
+        Returns
+        -------
+        Tuple[entities.task.Task]
+            Um objeto Task por linha, na ordem da tabela
+        """
+
+        return tuple([self[index] for index in range(len(self._ids))])
@@ -1,4 +1,6 @@
+import sys
+
 from presentation_layer.task_controller import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
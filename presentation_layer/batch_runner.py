@@ -0,0 +1,141 @@
+import json
+from typing import Any, Dict, Iterable, TextIO
+
+
+# Tamanho padrão da página da operação "list"
+DEFAULT_LIST_LIMIT = 50
+
+
+class BatchRunner:
+    """
+    Executor não interativo de comandos. Lê um comando JSON por linha (NDJSON) e executa cada um pelos serviços,
+    em uma transação própria, escrevendo uma linha JSON com o resultado de cada comando.
+
+    Operações: {"op": "add", "name", "description", "status"} (retorna o "id" da nova tarefa), {"op": "list", "limit", "after_id", "status"},
+    {"op": "search", "text", "limit"}, {"op": "remove", "id"}, {"op": "status", "id", "status"} e {"op": "count"}
+    """
+
+    def __init__(self, task_service, status_service=None):
+        """Inicializa o executor com os serviços de tarefas e, opcionalmente, de status (usado por "add" sem status)"""
+        self.task_service = task_service
+        self.status_service = status_service
+        self._operations = {
+            "add": self._add,
+            "list": self._list,
+            "search": self._search,
+            "remove": self._remove,
+            "status": self._status,
+            "count": self._count,
+        }
+
+    def run(self, lines: Iterable[str], output: TextIO, stop_on_error: bool = False) -> int:
+        """Executa os comandos e escreve os resultados
+
+        Parameters
+        ----------
+        lines: Iterable[str]
+            Linhas NDJSON com os comandos. Linhas em branco são ignoradas
+        output: TextIO
+            Arquivo onde é escrita uma linha JSON por comando, com "line", "op" e "ok", além de "error"
+            em caso de falha ou dos dados lidos
+        stop_on_error: bool
+            Se True, interrompe a execução no primeiro comando com falha (padrão: False)
+
+        Returns
+        -------
+        int
+            Código de saída: 1 se algum comando falhou, 0 caso contrário
+        """
+        failed = False
+
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+
+            result = {"line": line_number, **self.execute_line(line)}
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+            if not result["ok"]:
+                failed = True
+                if stop_on_error:
+                    break
+
+        output.flush()
+        return 1 if failed else 0
+
+    def execute_line(self, line: str) -> Dict[str, Any]:
+        """Executa um comando em JSON, convertendo qualquer falha em um resultado com "ok" igual a False
+
+        Parameters
+        ----------
+        line: str
+            Comando em JSON
+
+        Returns
+        -------
+        Dict[str, Any]
+            Resultado do comando
+        """
+        operation = None
+
+        try:
+            command = json.loads(line)
+            if not isinstance(command, dict):
+                raise ValueError("O comando deve ser um objeto JSON!")
+
+            operation = command.get("op")
+            if operation not in self._operations:
+                raise ValueError(f"Operação '{operation}' desconhecida! Use: {', '.join(self._operations)}")
+
+            result = {"op": operation, "ok": True}
+            result.update(self._operations[operation](command))
+            return result
+
+        except json.JSONDecodeError as e:
+            return {"op": None, "ok": False, "error": f"JSON inválido: {e}"}
+        except KeyError as e:
+            return {"op": operation, "ok": False, "error": f"Campo obrigatório {e} ausente!"}
+        except Exception as e:
+            return {"op": operation, "ok": False, "error": str(e)}
+
+    def _add(self, command):
+        """Cria uma tarefa. Sem "status", usa o primeiro status disponível"""
+        status_name = command.get("status")
+        if status_name is None:
+            status_name = self.status_service.get_available_status_names()[0]
+
+        task_id = self.task_service.create_task(command["name"], command.get("description", ""), status_name)
+        return {"id": task_id}
+
+    def _list(self, command):
+        """Lista uma página de tarefas, ou todas as tarefas de um status"""
+        if command.get("status") is not None:
+            tasks = self.task_service.list_tasks_by_status(command["status"])
+        else:
+            tasks = self.task_service.list_tasks_page(command.get("limit", DEFAULT_LIST_LIMIT), command.get("after_id"))
+
+        return {"tasks": [_task_to_dict(task) for task in tasks or ()]}
+
+    def _search(self, command):
+        """Busca tarefas por palavras do nome ou da descrição"""
+        tasks = self.task_service.search_tasks(command["text"], command.get("limit", DEFAULT_LIST_LIMIT))
+        return {"tasks": [_task_to_dict(task) for task in tasks or ()]}
+
+    def _remove(self, command):
+        """Remove uma tarefa"""
+        self.task_service.delete_task(command["id"])
+        return {"id": command["id"]}
+
+    def _status(self, command):
+        """Altera o status de uma tarefa"""
+        self.task_service.update_task_status(command["id"], command["status"])
+        return {"id": command["id"], "status": command["status"]}
+
+    def _count(self, command):
+        """Conta as tarefas de cada status"""
+        return {"counts": self.task_service.count_tasks_by_status()}
+
+
+def _task_to_dict(task):
+    """Converte uma tarefa em um dicionário serializável em JSON"""
+    return {"id": task.id, "name": task.name, "description": task.description, "status": task.status.name}
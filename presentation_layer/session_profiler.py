@@ -0,0 +1,239 @@
+import cProfile
+import io
+import pstats
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+
+from data_access_layer.database_api_adapters.query_instrumentation import QueryEvent, QueryListener
+
+
+class _OperationTimes:
+    """Tempos acumulados de uma operação, separados por camada"""
+    __slots__ = ("calls", "total", "dao", "sqlite_in_dao", "sqlite_direct")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.dao = 0.0
+        self.sqlite_in_dao = 0.0
+        self.sqlite_direct = 0.0
+
+
+class _Span:
+    """Chamada em andamento de um método instrumentado"""
+    __slots__ = ("layer", "dao", "sqlite_in_dao", "sqlite_direct")
+
+    def __init__(self, layer):
+        self.layer = layer
+        self.dao = 0.0
+        self.sqlite_in_dao = 0.0
+        self.sqlite_direct = 0.0
+
+
+class SessionProfiler(QueryListener):
+    """
+    Perfilador de uma sessão do programa. Mede o tempo de cada método público dos serviços,
+    separando o tempo gasto no próprio serviço, nos DAOs e no SQLite, e executa o cProfile durante a sessão.
+    O tempo da sessão fora dos serviços é atribuído à camada de apresentação (inclui a espera pelo usuário)
+    """
+
+    def __init__(self):
+        """Inicializa o perfilador"""
+        self._operations: Dict[str, _OperationTimes] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profile = cProfile.Profile()
+        self._instrumented_adapters: List[Any] = []
+        self._start_time = None
+        self._wall_time = 0.0
+
+    def start(self):
+        """Inicia a medição da sessão"""
+        self._start_time = time.perf_counter()
+        self._profile.enable()
+
+    def stop(self):
+        """Encerra a medição da sessão e remove os ouvintes dos adaptadores. Sem uma medição iniciada por 'start',
+        apenas remove os ouvintes"""
+        if self._start_time is not None:
+            self._profile.disable()
+            self._wall_time = time.perf_counter() - self._start_time
+            self._start_time = None
+
+        for adapter in self._instrumented_adapters:
+            adapter.remove_listener(self)
+        self._instrumented_adapters.clear()
+
+    def instrument_service(self, service):
+        """Instrumenta os métodos públicos de um serviço, os seus DAOs e o seu adaptador"""
+        self._wrap_public_methods(service, "service")
+
+        # DAOs e adaptador usados pelo serviço
+        for attribute in ("_task_dao", "_task_status_dao"):
+            dao = getattr(service, attribute, None)
+            if dao is not None:
+                self._wrap_public_methods(dao, "dao")
+                self._listen(getattr(dao, "_db_api_adapter", None))
+
+                # DAOs decoradores (cache) guardam o DAO decorado
+                inner_dao = getattr(dao, attribute, None)
+                if inner_dao is not None:
+                    self._listen(getattr(inner_dao, "_db_api_adapter", None))
+
+        self._listen(getattr(service, "_db_adapter", None))
+
+    def _listen(self, adapter):
+        """Passa a receber os comandos de um adaptador, uma única vez por adaptador"""
+        # O banco de dados em memória não executa comandos SQL e não possui ouvintes
+        if adapter is None or not hasattr(adapter, "add_listener"):
+            return
+
+        if any(adapter is current for current in self._instrumented_adapters):
+            return
+
+        adapter.add_listener(self)
+        self._instrumented_adapters.append(adapter)
+
+    def _wrap_public_methods(self, target, layer):
+        """Substitui os métodos públicos de um objeto por versões cronometradas"""
+        class_name = type(target).__name__
+
+        for name in dir(type(target)):
+            if name.startswith("_"):
+                continue
+
+            method = getattr(target, name)
+            if callable(method):
+                setattr(target, name, self._timed(method, layer, f"{class_name}.{name}"))
+
+    def _stack(self) -> List[_Span]:
+        """Chamadas instrumentadas em andamento na thread atual"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _timed(self, method: Callable, layer: str, name: str) -> Callable:
+        """Cria a versão cronometrada de um método"""
+        def timed(*args, **kwargs):
+            stack = self._stack()
+
+            # Chamadas internas da mesma camada já são medidas pela chamada externa
+            if any(span.layer == layer for span in stack):
+                return method(*args, **kwargs)
+
+            span = _Span(layer)
+            stack.append(span)
+            start = time.perf_counter()
+
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+
+                if stack:
+                    # DAO chamado por um serviço: o tempo é somado à operação do serviço
+                    parent = stack[-1]
+                    parent.dao += elapsed
+                    parent.sqlite_in_dao += span.sqlite_direct
+                elif layer == "dao":
+                    # DAO chamado fora de um serviço (por exemplo, pela thread de escrita adiada)
+                    self._record(name, elapsed, elapsed, span.sqlite_direct, 0.0)
+                else:
+                    self._record(name, elapsed, span.dao, span.sqlite_in_dao, span.sqlite_direct)
+
+        return timed
+
+    def _record(self, name, total, dao, sqlite_in_dao, sqlite_direct):
+        """Acumula os tempos de uma operação concluída"""
+        with self._lock:
+            times = self._operations.get(name)
+            if times is None:
+                times = self._operations[name] = _OperationTimes()
+
+            times.calls += 1
+            times.total += total
+            times.dao += dao
+            times.sqlite_in_dao += sqlite_in_dao
+            times.sqlite_direct += sqlite_direct
+
+    def on_query(self, event: QueryEvent) -> None:
+        stack = self._stack()
+
+        if stack:
+            stack[-1].sqlite_direct += event.duration
+        else:
+            self._record(f"SQLite.{event.operation}", event.duration, 0.0, 0.0, event.duration)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Resume o tempo de cada operação por camada, da mais à menos demorada
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Para cada operação: chamadas e tempos, em milissegundos, total, no serviço, no DAO e no SQLite
+        """
+        with self._lock:
+            rows = [
+                {
+                    "operation": name,
+                    "calls": times.calls,
+                    "total_ms": times.total * 1000,
+                    "service_ms": (times.total - times.dao - times.sqlite_direct) * 1000,
+                    "dao_ms": (times.dao - times.sqlite_in_dao) * 1000,
+                    "sqlite_ms": (times.sqlite_in_dao + times.sqlite_direct) * 1000,
+                }
+                for name, times in self._operations.items()
+            ]
+
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+
+        return rows
+
+    def format_summary(self) -> str:
+        """Monta a tabela do resumo por operação, com o tempo atribuído a cada camada"""
+        rows = self.summary()
+        operations_ms = sum(row["total_ms"] for row in rows)
+
+        lines = [
+            f"Sessão: {self._wall_time * 1000:.1f} ms "
+            f"(apresentação e espera pelo usuário: {self._wall_time * 1000 - operations_ms:.1f} ms)",
+            f"{'OPERAÇÃO':40} | {'CHAMADAS':>8} | {'TOTAL ms':>10} | {'SERVIÇO ms':>10} | {'DAO ms':>10} | {'SQLITE ms':>10}",
+            "-" * 102,
+        ]
+
+        for row in rows:
+            lines.append(
+                f"{row['operation'][:40]:40} | {row['calls']:8} | {row['total_ms']:10.2f} | "
+                f"{row['service_ms']:10.2f} | {row['dao_ms']:10.2f} | {row['sqlite_ms']:10.2f}"
+            )
+
+        return "\n".join(lines)
+
+    def write_report(self, prefix: str) -> str:
+        """Grava o resumo por operação e o perfil do cProfile
+
+        Parameters
+        ----------
+        prefix: str
+            Prefixo dos arquivos: '<prefixo>.txt' (resumo e funções mais demoradas) e '<prefixo>.pstats'
+
+        Returns
+        -------
+        str
+            Resumo por operação
+        """
+        summary = self.format_summary()
+
+        self._profile.dump_stats(f"{prefix}.pstats")
+
+        functions = io.StringIO()
+        pstats.Stats(self._profile, stream=functions).sort_stats("cumulative").print_stats(30)
+
+        with open(f"{prefix}.txt", "w", encoding="utf-8") as report_file:
+            report_file.write(summary + "\n\n" + functions.getvalue())
+
+        return summary
@@ -1,17 +1,55 @@
+import os
+import sys
 
-from service_layer.task_service import TaskService
-from service_layer.task_status_service import TaskStatusService
+
+# Prefixo dos arquivos do modo de perfilamento
+DEFAULT_PROFILE_PREFIX = "profile"
+
+# Valores de TASK_MANAGER_PROFILE que ativam o perfilamento com o prefixo padrão ou o mantêm desativado.
+# Qualquer outro valor é usado como prefixo dos arquivos
+ENABLED_PROFILE_VALUES = ("1", "true", "sim")
+DISABLED_PROFILE_VALUES = ("0", "false", "nao", "não")
 
 
 class TaskController:
     """Controlador principal da interface"""
     
-    def __init__(self):
-        """Inicializa o controlador com os serviços"""
-        self.task_service = TaskService()
-        self.status_service = TaskStatusService()
+    # Quantidade de tarefas mostradas por página
+    PAGE_SIZE = 50
+    
+    def __init__(self, factory=None):
+        """Inicializa o controlador com a fábrica de serviços (por padrão, sobre database/schema.db)
+        
+        Os serviços, e com eles os DAOs, o sqlite3 e a conexão, só são criados no primeiro comando que os usa,
+        para que o menu apareça sem esperar pelo banco de dados
+        """
+        self._factory = factory
+        self._task_service = None
+        self._status_service = None
         self.running = True
     
+    @property
+    def factory(self):
+        """Fábrica de serviços, criada no primeiro uso"""
+        if self._factory is None:
+            from service_layer.service_factory import ServiceFactory
+            self._factory = ServiceFactory()
+        return self._factory
+    
+    @property
+    def task_service(self):
+        """Serviço de tarefas, criado no primeiro uso"""
+        if self._task_service is None:
+            self._task_service = self.factory.task_service()
+        return self._task_service
+    
+    @property
+    def status_service(self):
+        """Serviço de status, criado no primeiro uso"""
+        if self._status_service is None:
+            self._status_service = self.factory.task_status_service()
+        return self._status_service
+    
     def show_menu(self):
         """Mostra o menu principal"""
         print("\n" + "="*40)
@@ -21,7 +59,8 @@ class TaskController:
         print("2. Listar Tarefas")
         print("3. Remover Tarefa")
         print("4. Alterar Status")
-        print("5. Sair")
+        print("5. Buscar Tarefas")
+        print("6. Sair")
         print("="*40)
     
     def get_number(self, message, min_value, max_value):
@@ -112,42 +151,123 @@ class TaskController:
             print(f"Erro: {e}")
     
     def list_tasks(self):
-        """Mostra todas as tarefas"""
+        """Mostra as tarefas, uma página por vez"""
         print("\n" + "-"*30)
         print("LISTA DE TAREFAS")
         print("-"*30)
         
         try:
-            # Pegar tarefas
-            task_list = self.task_service.list_all_tasks()
-            
-            if not task_list:
-                print("Nenhuma tarefa ainda.")
-                return
+            # Último ID de cada página anterior, para poder voltar
+            previous_after_ids = []
+            after_id = None
+            page_number = 1
             
-            print(f"Total: {len(task_list)} tarefas")
-            print("-"*50)
-            print("ID  | NOME               | STATUS      | DESCRIÇÃO")
-            print("-"*50)
-            
-            # Mostrar cada tarefa
-            for task in task_list:
-                # Cortar textos muito longos
-                name_display = task.name
-                if len(name_display) > 18:
-                    name_display = name_display[:15] + "..."
+            while True:
+                # Pede uma tarefa a mais só para saber se existe próxima página
+                task_list = self.task_service.list_tasks_page(self.PAGE_SIZE + 1, after_id)
+                
+                if not task_list:
+                    print("Nenhuma tarefa ainda.")
+                    return
+                
+                has_next = len(task_list) > self.PAGE_SIZE
+                task_list = task_list[:self.PAGE_SIZE]
+                
+                print(f"Página {page_number}")
+                self.print_task_rows(task_list)
+                
+                if not has_next and not previous_after_ids:
+                    return
+                
+                options = []
+                if has_next:
+                    options.append("p = próxima")
+                if previous_after_ids:
+                    options.append("a = anterior")
+                options.append("Enter = voltar")
                 
-                desc_display = task.description
-                if len(desc_display) > 20:
-                    desc_display = desc_display[:17] + "..."
+                choice = input(f"{', '.join(options)}: ").lower()
                 
-                print(f"{task.id:3} | {name_display:18} | {task.status.name:11} | {desc_display}")
+                if choice == "p" and has_next:
+                    previous_after_ids.append(after_id)
+                    after_id = task_list[-1].id
+                    page_number += 1
+                elif choice == "a" and previous_after_ids:
+                    after_id = previous_after_ids.pop()
+                    page_number -= 1
+                else:
+                    return
             
-            print("-"*50)
+        except Exception as e:
+            print(f"Erro: {e}")
+    
+    def search_tasks(self):
+        """Busca tarefas por palavras do nome ou da descrição"""
+        print("\n" + "-"*30)
+        print("BUSCAR TAREFAS")
+        print("-"*30)
+        
+        text = self.get_text("Palavras da busca: ")
+        
+        try:
+            task_list = self.task_service.search_tasks(text, self.PAGE_SIZE)
+            
+            if not task_list:
+                print("Nenhuma tarefa encontrada.")
+                return
+            
+            print(f"{len(task_list)} tarefa(s) encontrada(s), das mais às menos relevantes")
+            self.print_task_rows(task_list)
             
         except Exception as e:
             print(f"Erro: {e}")
     
+    def print_task_rows(self, task_list):
+        """Mostra as tarefas em forma de tabela"""
+        print("-"*50)
+        print("ID  | NOME               | STATUS      | DESCRIÇÃO")
+        print("-"*50)
+        
+        # Mostrar cada tarefa
+        for task in task_list:
+            # Cortar textos muito longos
+            name_display = task.name
+            if len(name_display) > 18:
+                name_display = name_display[:15] + "..."
+            
+            desc_display = task.description
+            if len(desc_display) > 20:
+                desc_display = desc_display[:17] + "..."
+            
+            print(f"{task.id:3} | {name_display:18} | {task.status.name:11} | {desc_display}")
+        
+        print("-"*50)
+    
+    def show_first_page(self):
+        """Mostra a primeira página de tarefas, sem navegação. Retorna False se não houver tarefas"""
+        # Pede uma tarefa a mais só para saber se existem outras
+        task_list = self.task_service.list_tasks_page(self.PAGE_SIZE + 1)
+        
+        if not task_list:
+            return False
+        
+        self.print_task_rows(task_list[:self.PAGE_SIZE])
+        
+        if len(task_list) > self.PAGE_SIZE:
+            print(f"Mostrando as {self.PAGE_SIZE} primeiras tarefas (use Listar ou Buscar para ver as demais)")
+        
+        return True
+    
+    def choose_task_id(self, message):
+        """Pede o ID de uma tarefa existente. Retorna 0 se o usuário cancelar"""
+        while True:
+            task_id = self.get_number(message, 0, sys.maxsize)
+            
+            if task_id == 0 or self.task_service.task_exists(task_id):
+                return task_id
+            
+            print(f"Tarefa {task_id} não encontrada!")
+    
     def remove_task(self):
         """Remove uma tarefa"""
         print("\n" + "-"*30)
@@ -156,23 +276,13 @@ class TaskController:
         
         try:
             # Primeiro mostrar tarefas
-            task_list = self.task_service.list_all_tasks()
-            
-            if not task_list:
+            if not self.show_first_page():
                 print("Não tem tarefas para remover.")
                 return
             
-            self.list_tasks()  # Mostrar lista
-            
-            # Achar maior ID
-            max_id = 0
-            for task in task_list:
-                if task.id > max_id:
-                    max_id = task.id
-            
             # Pedir qual remover
             print(f"\nDigite 0 para cancelar")
-            task_id = self.get_number(f"ID para remover (1-{max_id}): ", 0, max_id)
+            task_id = self.choose_task_id("ID para remover: ")
             
             if task_id == 0:
                 print("Cancelado.")
@@ -200,23 +310,13 @@ class TaskController:
         
         try:
             # Mostrar tarefas
-            task_list = self.task_service.list_all_tasks()
-            
-            if not task_list:
+            if not self.show_first_page():
                 print("Não tem tarefas.")
                 return
             
-            self.list_tasks()  # Mostrar lista
-            
-            # Achar maior ID
-            max_id = 0
-            for task in task_list:
-                if task.id > max_id:
-                    max_id = task.id
-            
             # Pedir qual tarefa
             print(f"\nDigite 0 para cancelar")
-            task_id = self.get_number(f"ID da tarefa (1-{max_id}): ", 0, max_id)
+            task_id = self.choose_task_id("ID da tarefa: ")
             
             if task_id == 0:
                 print("Cancelado.")
@@ -243,6 +343,14 @@ class TaskController:
         except Exception as e:
             print(f"Erro: {e}")
     
+    def run_batch(self, lines, output=None, stop_on_error=False):
+        """Executa comandos NDJSON sem interação (ver BatchRunner), escrevendo os resultados em 'output'
+        (por padrão, a saída padrão). Retorna 1 se algum comando falhou e 0 caso contrário"""
+        from presentation_layer.batch_runner import BatchRunner
+        
+        runner = BatchRunner(self.task_service, self.status_service)
+        return runner.run(lines, sys.stdout if output is None else output, stop_on_error)
+    
     def run(self):
         """Método principal que executa o programa"""
         print("="*50)
@@ -254,7 +362,7 @@ class TaskController:
         while self.running:
             self.show_menu()
             
-            option = self.get_number("Sua escolha: ", 1, 5)
+            option = self.get_number("Sua escolha: ", 1, 6)
             
             if option == 1:
                 self.add_task()
@@ -265,6 +373,8 @@ class TaskController:
             elif option == 4:
                 self.change_status()
             elif option == 5:
+                self.search_tasks()
+            elif option == 6:
                 print("\n" + "="*50)
                 print("OBRIGADO POR USAR! ATÉ MAIS!")
                 print("="*50)
@@ -276,12 +386,85 @@ class TaskController:
 
 
 
-def main():
-    """Função principal que inicia o programa"""
+def main(arguments=None):
+    """Função principal que inicia o programa
+    
+    Com --profile (ou a variável de ambiente TASK_MANAGER_PROFILE), mede o tempo de cada operação por camada
+    e grava, ao sair, o resumo em '<prefixo>.txt' e o perfil do cProfile em '<prefixo>.pstats'.
+    O subcomando 'batch' executa comandos NDJSON lidos da entrada padrão (ou de --input), sem o menu,
+    e retorna o código de saída
+    """
+    if arguments is None:
+        arguments = sys.argv[1:]
+    
+    # Sem argumentos, o argparse nem chega a ser importado
+    profile_prefix = None
+    batch_options = None
+    if arguments:
+        import argparse
+        parser = argparse.ArgumentParser(description="Gerenciador de tarefas")
+        parser.add_argument("--profile", nargs="?", const=DEFAULT_PROFILE_PREFIX, metavar="PREFIXO",
+                            help=f"Perfila a sessão e grava os resultados com este prefixo (padrão: {DEFAULT_PROFILE_PREFIX})")
+        subparsers = parser.add_subparsers(dest="command")
+        batch_parser = subparsers.add_parser("batch", help="Executa comandos NDJSON (add, list, search, remove, status, count), "
+                                                           "um por linha, e escreve um resultado JSON por linha")
+        batch_parser.add_argument("--input", metavar="ARQUIVO", help="Arquivo com os comandos (padrão: entrada padrão)")
+        batch_parser.add_argument("--stop-on-error", action="store_true", help="Interrompe no primeiro comando com falha")
+        options = parser.parse_args(arguments)
+        profile_prefix = options.profile
+        if options.command == "batch":
+            batch_options = options
+    
+    if profile_prefix is None:
+        profile_prefix = _env_profile_prefix(os.environ.get("TASK_MANAGER_PROFILE", ""))
+    
+    profiler = None
+    if profile_prefix is not None:
+        from presentation_layer.session_profiler import SessionProfiler
+        profiler = SessionProfiler()
+        profiler.start()
+    
+    # No modo batch, a saída padrão fica reservada aos resultados em JSON
+    messages = sys.stdout if batch_options is None else sys.stderr
+    
     try:
         controller = TaskController()
+        if profiler is not None:
+            profiler.instrument_service(controller.task_service)
+            profiler.instrument_service(controller.status_service)
+        if batch_options is not None:
+            return _run_batch(controller, batch_options)
         controller.run()
     except KeyboardInterrupt:
-        print("\n\nPrograma interrompido pelo usuário.")
+        print("\n\nPrograma interrompido pelo usuário.", file=messages)
+        if batch_options is not None:
+            # Código de saída convencional de um processo interrompido por SIGINT (128 + 2)
+            return 130
     except Exception as e:
-        print(f"\nErro inesperado: {e}")
+        print(f"\nErro inesperado: {e}", file=messages)
+        if batch_options is not None:
+            return 1
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            print("\n" + profiler.write_report(profile_prefix), file=messages)
+            print(f"\nPerfil gravado em {profile_prefix}.txt e {profile_prefix}.pstats", file=messages)
+
+
+def _env_profile_prefix(value):
+    """Converte o valor de TASK_MANAGER_PROFILE no prefixo dos arquivos de perfil, ou None se ele estiver desativado"""
+    value = value.strip()
+    if not value or value.lower() in DISABLED_PROFILE_VALUES:
+        return None
+    if value.lower() in ENABLED_PROFILE_VALUES:
+        return DEFAULT_PROFILE_PREFIX
+    return value
+
+
+def _run_batch(controller, options):
+    """Executa o subcomando 'batch' com os comandos do arquivo informado ou da entrada padrão"""
+    if options.input is None:
+        return controller.run_batch(sys.stdin, stop_on_error=options.stop_on_error)
+    
+    with open(options.input, encoding="utf-8") as input_file:
+        return controller.run_batch(input_file, stop_on_error=options.stop_on_error)
@@ -1,4 +1,22 @@
-from service_layer.task_service import TaskService
-from service_layer.task_status_service import TaskStatusService
+from importlib import import_module
 
-__all__ = ['TaskService', 'TaskStatusService']
\ No newline at end of file
+__all__ = ['TaskService', 'TaskStatusService', 'AsyncTaskService', 'AsyncTaskStatusService']
+
+# Módulo de cada serviço exportado. Os serviços são importados no primeiro acesso, para que importar
+# um único módulo do pacote (como service_layer.service_factory) não carregue os demais
+_SERVICE_MODULES = {
+    'TaskService': 'service_layer.task_service',
+    'TaskStatusService': 'service_layer.task_status_service',
+    'AsyncTaskService': 'service_layer.async_task_service',
+    'AsyncTaskStatusService': 'service_layer.async_task_status_service',
+}
+
+def __getattr__(name):
+    if name not in _SERVICE_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    service = getattr(import_module(_SERVICE_MODULES[name]), name)
+    globals()[name] = service
+    return service
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
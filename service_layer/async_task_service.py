@@ -0,0 +1,243 @@
+from functools import partial
+from typing import AsyncIterator, Dict, Iterable, List, Tuple, Union
+from entities.task import Task
+from entities.task_status import TaskStatus
+from data_access_layer.dao.async_task_dao_impl import AsyncTaskDAOImpl
+from data_access_layer.dao.async_task_status_dao_impl import AsyncTaskStatusDAOImpl
+from data_access_layer.database_api_adapters.async_database_api_adapter import AsyncDatabaseAPIAdapter
+from data_access_layer.database_api_adapters.async_sqlite_database_api_adapter import AsyncSQLiteDatabaseAPIAdapter
+from data_access_layer.migrations.migration_runner import migrate_database
+from service_layer.task_rules import (
+    search_expression, status_not_found, task_not_found, validate_page, validate_status_name, validate_task_data,
+    validate_task_id
+)
+
+class AsyncTaskService:
+    """
+    Versão assíncrona (asyncio) de TaskService, sobre AsyncTaskDAOImpl e AsyncTaskStatusDAOImpl.
+    As regras de validação são as mesmas do serviço síncrono (service_layer.task_rules), e as escritas de cada
+    operação ocorrem em uma transação do adaptador assíncrono
+    """
+    def __init__(self, db_adapter: Union[AsyncDatabaseAPIAdapter, None] = None,
+                 database_filename: str = "database/schema.db") -> None:
+        """Inicializa um objeto AsyncTaskService
+        
+        Parameters
+        ----------
+        db_adapter: Union[AsyncDatabaseAPIAdapter, None]
+            Adaptador assíncrono do banco de dados, já conectado e com o esquema atualizado, compartilhado
+            pelas corrotinas. Se None, o serviço cria o seu próprio adaptador (padrão: None)
+        database_filename: str
+            Caminho para o arquivo do banco de dados SQLite do adaptador próprio, criado ou atualizado
+            pela thread de trabalho na abertura da conexão (padrão: "database/schema.db")
+        """
+        # O adaptador próprio só é conectado na primeira operação e é fechado por 'close'
+        self._owns_adapter = db_adapter is None
+        self._connected = not self._owns_adapter
+        
+        if db_adapter is None:
+            db_adapter = AsyncSQLiteDatabaseAPIAdapter(database_filename, setup=partial(migrate_database, database_filename))
+        
+        self._db_adapter = db_adapter
+        self._task_dao = AsyncTaskDAOImpl(db_adapter)
+        self._task_status_dao = AsyncTaskStatusDAOImpl(db_adapter)
+
+    async def _connect(self) -> None:
+        """Conecta o adaptador próprio na primeira operação"""
+        if not self._connected:
+            await self._db_adapter.connect()
+            self._connected = True
+
+    async def close(self) -> None:
+        """Fecha a conexão do adaptador próprio, caso ele tenha sido criado pelo serviço"""
+        if self._owns_adapter and self._connected:
+            await self._db_adapter.close_connection()
+            self._connected = False
+
+    async def create_task(self, name: str, description: str, status_name: str) -> int:
+        """Versão assíncrona de TaskService.create_task"""
+        await self._connect()
+        
+        async with self._db_adapter.transaction():
+            task = await self._build_task(name, description, status_name, {})
+            
+            return await self._task_dao.insert(task)
+
+    async def create_tasks(self, tasks_data: Iterable[Tuple[str, str, str]]) -> None:
+        """Versão assíncrona de TaskService.create_tasks"""
+        await self._connect()
+        
+        # Cada status distinto é buscado uma única vez no lote
+        status_cache: Dict[str, TaskStatus] = {}
+        
+        async with self._db_adapter.transaction():
+            tasks = [
+                await self._build_task(name, description, status_name, status_cache)
+                for name, description, status_name in tasks_data
+            ]
+            
+            if tasks:
+                await self._task_dao.insert_many(tasks)
+
+    async def _build_task(self, name: str, description: str, status_name: str,
+                          status_cache: Dict[str, TaskStatus]) -> Task:
+        """Versão assíncrona de TaskService._build_task"""
+        name, description = validate_task_data(name, description)
+        
+        status = await self._get_status(status_name, status_cache)
+        
+        return Task(id=0, name=name, description=description, status=status)
+
+    async def _get_status(self, status_name: str, status_cache: Dict[str, TaskStatus]) -> TaskStatus:
+        """Versão assíncrona de TaskService._get_status"""
+        validate_status_name(status_name)
+        
+        if status_name not in status_cache:
+            status = await self._task_status_dao.get_by_name(status_name)
+            
+            if status is None:
+                raise status_not_found(status_name)
+            
+            status_cache[status_name] = status
+        
+        return status_cache[status_name]
+
+    async def list_all_tasks(self) -> Union[Tuple[Task], None]:
+        """Versão assíncrona de TaskService.list_all_tasks"""
+        await self._connect()
+        
+        return await self._task_dao.list_all()
+
+    async def iter_tasks(self, batch_size: int = 1000) -> AsyncIterator[Task]:
+        """Percorre todas as tarefas sob demanda, lendo uma página de 'batch_size' tarefas por vez
+        
+        Parameters
+        ----------
+        batch_size: int
+            Quantidade de tarefas lidas do banco de dados por vez
+        
+        Returns
+        -------
+        AsyncIterator[Task]
+            Iterador assíncrono das tarefas, ordenadas pelo ID
+        """
+        after_id = None
+        
+        while True:
+            tasks = await self.list_tasks_page(batch_size, after_id)
+            
+            if not tasks:
+                return
+            
+            for task in tasks:
+                yield task
+            
+            after_id = tasks[-1].id
+
+    async def list_tasks_page(self, limit: int = 50, after_id: Union[int, None] = None) -> Union[Tuple[Task], None]:
+        """Versão assíncrona de TaskService.list_tasks_page"""
+        validate_page(limit, after_id)
+        
+        await self._connect()
+        
+        return await self._task_dao.list_page(limit, after_id)
+
+    async def list_tasks_by_status(self, status_name: str) -> Union[Tuple[Task], None]:
+        """Versão assíncrona de TaskService.list_tasks_by_status"""
+        await self._connect()
+        
+        status = await self._get_status(status_name, {})
+        
+        return await self._task_dao.list_by_status(status.id)
+
+    async def search_tasks(self, text: str, limit: int = 50) -> Union[Tuple[Task], None]:
+        """Versão assíncrona de TaskService.search_tasks"""
+        expression = search_expression(text, limit)
+        
+        await self._connect()
+        
+        return await self._task_dao.search(expression, limit)
+
+    async def count_tasks_by_status(self) -> Dict[str, int]:
+        """Versão assíncrona de TaskService.count_tasks_by_status"""
+        await self._connect()
+        
+        return {
+            status.name: total
+            for status, total in await self._task_dao.count_by_status()
+        }
+
+    async def delete_task(self, task_id: int) -> None:
+        """Versão assíncrona de TaskService.delete_task"""
+        await self._connect()
+        
+        async with self._db_adapter.transaction():
+            await self._validate_existing_task_id(task_id)
+            
+            await self._task_dao.delete(task_id)
+
+    async def delete_tasks(self, task_ids: Iterable[int]) -> None:
+        """Versão assíncrona de TaskService.delete_tasks"""
+        task_ids = list(task_ids)
+        
+        await self._connect()
+        
+        async with self._db_adapter.transaction():
+            for task_id in task_ids:
+                await self._validate_existing_task_id(task_id)
+            
+            if task_ids:
+                await self._task_dao.delete_many(task_ids)
+
+    async def update_task_status(self, task_id: int, new_status_name: str) -> None:
+        """Versão assíncrona de TaskService.update_task_status"""
+        validate_task_id(task_id)
+        validate_status_name(new_status_name)
+        
+        await self._connect()
+        
+        async with self._db_adapter.transaction():
+            if not await self._task_dao.exists(task_id):
+                raise task_not_found(task_id)
+            
+            new_status = await self._get_status(new_status_name, {})
+            
+            await self._task_dao.update_status(task_id, new_status)
+
+    async def update_task_statuses(self, updates: Iterable[Tuple[int, str]]) -> None:
+        """Versão assíncrona de TaskService.update_task_statuses"""
+        await self._connect()
+        
+        status_cache: Dict[str, TaskStatus] = {}
+        resolved_updates: List[Tuple[int, TaskStatus]] = []
+        
+        async with self._db_adapter.transaction():
+            for task_id, new_status_name in updates:
+                await self._validate_existing_task_id(task_id)
+                resolved_updates.append((task_id, await self._get_status(new_status_name, status_cache)))
+            
+            if resolved_updates:
+                await self._task_dao.update_status_many(resolved_updates)
+
+    async def _validate_existing_task_id(self, task_id: int) -> None:
+        """Versão assíncrona de TaskService._validate_existing_task_id"""
+        validate_task_id(task_id)
+        
+        if not await self._task_dao.exists(task_id):
+            raise task_not_found(task_id)
+
+    async def get_task_by_id(self, task_id: int) -> Union[Task, None]:
+        """Versão assíncrona de TaskService.get_task_by_id"""
+        validate_task_id(task_id)
+        
+        await self._connect()
+        
+        return await self._task_dao.get_by_id(task_id)
+
+    async def task_exists(self, task_id: int) -> bool:
+        """Versão assíncrona de TaskService.task_exists"""
+        validate_task_id(task_id)
+        
+        await self._connect()
+        
+        return await self._task_dao.exists(task_id)
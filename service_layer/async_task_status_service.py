@@ -0,0 +1,81 @@
+from functools import partial
+from typing import Tuple, Union
+from entities.task_status import TaskStatus
+from data_access_layer.dao.async_task_status_dao_impl import AsyncTaskStatusDAOImpl
+from data_access_layer.database_api_adapters.async_database_api_adapter import AsyncDatabaseAPIAdapter
+from data_access_layer.database_api_adapters.async_sqlite_database_api_adapter import AsyncSQLiteDatabaseAPIAdapter
+from data_access_layer.migrations.migration_runner import migrate_database
+
+class AsyncTaskStatusService:
+    """
+    Versão assíncrona (asyncio) de TaskStatusService, sobre AsyncTaskStatusDAOImpl
+    """
+    def __init__(self, db_adapter: Union[AsyncDatabaseAPIAdapter, None] = None,
+                 database_filename: str = "database/schema.db") -> None:
+        """Inicializa um objeto AsyncTaskStatusService
+        
+        Parameters
+        ----------
+        db_adapter: Union[AsyncDatabaseAPIAdapter, None]
+            Adaptador assíncrono do banco de dados, já conectado e com o esquema atualizado, compartilhado
+            pelas corrotinas. Se None, o serviço cria o seu próprio adaptador (padrão: None)
+        database_filename: str
+            Caminho para o arquivo do banco de dados SQLite do adaptador próprio, criado ou atualizado
+            pela thread de trabalho na abertura da conexão (padrão: "database/schema.db")
+        """
+        # O adaptador próprio só é conectado na primeira operação e é fechado por 'close'
+        self._owns_adapter = db_adapter is None
+        self._connected = not self._owns_adapter
+        
+        if db_adapter is None:
+            db_adapter = AsyncSQLiteDatabaseAPIAdapter(database_filename, setup=partial(migrate_database, database_filename))
+        
+        self._db_adapter = db_adapter
+        self._task_status_dao = AsyncTaskStatusDAOImpl(db_adapter)
+
+    async def _connect(self) -> None:
+        """Conecta o adaptador próprio na primeira operação"""
+        if not self._connected:
+            await self._db_adapter.connect()
+            self._connected = True
+
+    async def close(self) -> None:
+        """Fecha a conexão do adaptador próprio, caso ele tenha sido criado pelo serviço"""
+        if self._owns_adapter and self._connected:
+            await self._db_adapter.close_connection()
+            self._connected = False
+
+    async def list_all_status(self) -> Union[Tuple[TaskStatus], None]:
+        """Versão assíncrona de TaskStatusService.list_all_status"""
+        await self._connect()
+        
+        return await self._task_status_dao.list_all()
+
+    async def get_status_by_name(self, status_name: str) -> Union[TaskStatus, None]:
+        """Versão assíncrona de TaskStatusService.get_status_by_name"""
+        if not status_name or not isinstance(status_name, str) or status_name.strip() == "":
+            raise ValueError("O nome do status não pode ser vazio!")
+        
+        await self._connect()
+        
+        return await self._task_status_dao.get_by_name(status_name.strip())
+
+    async def validate_status_name(self, status_name: str) -> bool:
+        """Versão assíncrona de TaskStatusService.validate_status_name"""
+        if not status_name or not isinstance(status_name, str):
+            return False
+        
+        await self._connect()
+        
+        return await self._task_status_dao.get_by_name(status_name.strip()) is not None
+
+    async def get_available_status_names(self) -> Tuple[str]:
+        """Versão assíncrona de TaskStatusService.get_available_status_names"""
+        await self._connect()
+        
+        all_status = await self._task_status_dao.list_all()
+        
+        if all_status is None:
+            return tuple()
+        
+        return tuple(status.name for status in all_status)
@@ -0,0 +1,209 @@
+from functools import partial
+from typing import Sequence, Union
+from data_access_layer.dao.task_dao import TaskDAO
+from data_access_layer.dao.task_dao_impl import TaskDAOImpl
+from data_access_layer.dao.task_status_dao import TaskStatusDAO
+from data_access_layer.dao.task_status_dao_impl import TaskStatusDAOImpl
+from data_access_layer.dao.cached_task_status_dao import CachedTaskStatusDAO
+from data_access_layer.database_api_adapters.database_api_adapter import DatabaseAPIAdapter
+from data_access_layer.database_api_adapters.in_memory_database import DEFAULT_STATUS_NAMES, InMemoryDatabase
+from data_access_layer.database_api_adapters.sqlite_database_api_adapter import SQLiteDatabaseAPIAdapter
+from data_access_layer.database_api_adapters.sqlite_pooled_database_api_adapter import SQLitePooledDatabaseAPIAdapter
+from data_access_layer.migrations.migration_runner import migrate_database
+from service_layer.task_service import TaskService
+from service_layer.task_status_service import TaskStatusService
+
+class ServiceFactory:
+    """
+    Raiz de composição da aplicação. Constrói um único adaptador do banco de dados e um único DAO de cada
+    entidade, compartilhados por todos os serviços, e aceita adaptadores e DAOs já construídos.
+    Nenhuma conexão é aberta na construção: o adaptador conecta no primeiro comando
+    """
+    def __init__(self, database_filename: str = "database/schema.db", pool_size: Union[int, None] = None,
+                 performance_profile: Union[str, None] = "balanced",
+                 db_adapter: Union[DatabaseAPIAdapter, InMemoryDatabase, None] = None,
+                 task_dao: Union[TaskDAO, None] = None, task_status_dao: Union[TaskStatusDAO, None] = None) -> None:
+        """Inicializa um objeto ServiceFactory
+
+        Parameters
+        ----------
+        database_filename: str
+            Caminho para o arquivo do banco de dados SQLite (padrão: "database/schema.db")
+        pool_size: Union[int, None]
+            Quantidade de conexões do pool, para uso dos serviços por várias threads (necessário no modo
+            write-behind). Se None, usa a conexão única compartilhada (padrão: None)
+        performance_profile: Union[str, None]
+            Perfil de desempenho do SQLite: durable, balanced ou bulk-load.
+            Se None, mantém a configuração padrão do SQLite (padrão: "balanced")
+        db_adapter: Union[DatabaseAPIAdapter, InMemoryDatabase, None]
+            Adaptador do banco de dados já construído, com o esquema atualizado, ou banco de dados em memória.
+            Se informado, os demais parâmetros do banco são ignorados
+        task_dao: Union[TaskDAO, None]
+            DAO das tarefas já construído. Exige 'db_adapter', usado nas transações (padrão: None)
+        task_status_dao: Union[TaskStatusDAO, None]
+            DAO dos status já construído. Exige 'db_adapter' (padrão: None)
+
+        Raises
+        ------
+        ValueError
+            Se um DAO for informado sem o adaptador do banco de dados
+        """
+        if db_adapter is None and (task_dao is not None or task_status_dao is not None):
+            raise ValueError("O adaptador do banco de dados deve ser informado junto com os DAOs!")
+
+        self._database_filename = database_filename
+        self._pool_size = pool_size
+        self._performance_profile = performance_profile
+
+        # Construídos no primeiro uso, se não informados
+        self._db_adapter = db_adapter
+        self._task_dao = task_dao
+        self._task_status_dao = task_status_dao
+
+    @classmethod
+    def in_memory(cls, status_names: Sequence[str] = DEFAULT_STATUS_NAMES) -> 'ServiceFactory':
+        """Cria uma fábrica de serviços sobre um novo banco de dados em memória, para testes e cargas descartáveis
+
+        Parameters
+        ----------
+        status_names: Sequence[str]
+            Nomes dos status cadastrados (padrão: os status de database/init.sql)
+
+        Returns
+        -------
+        ServiceFactory
+            Fábrica cujos serviços compartilham o mesmo banco de dados em memória
+        """
+        # Os DAOs em memória só são importados por quem os usa
+        from data_access_layer.dao.in_memory_task_dao import InMemoryTaskDAO
+        from data_access_layer.dao.in_memory_task_status_dao import InMemoryTaskStatusDAO
+
+        database = InMemoryDatabase(status_names)
+
+        return cls(db_adapter=database, task_dao=InMemoryTaskDAO(database), task_status_dao=InMemoryTaskStatusDAO(database))
+
+    def db_adapter(self) -> Union[DatabaseAPIAdapter, InMemoryDatabase]:
+        """Obtém o adaptador do banco de dados compartilhado
+
+        Returns
+        -------
+        Union[DatabaseAPIAdapter, InMemoryDatabase]
+            Adaptador informado ou, se não informado, adaptador SQLite que cria o banco de dados ou atualiza
+            o seu esquema ao abrir a primeira conexão
+        """
+        if self._db_adapter is None:
+            setup = partial(migrate_database, self._database_filename)
+
+            if self._pool_size is None:
+                self._db_adapter = SQLiteDatabaseAPIAdapter(
+                    self._database_filename, self._performance_profile, setup=setup
+                )
+            else:
+                self._db_adapter = SQLitePooledDatabaseAPIAdapter(
+                    self._database_filename, self._pool_size, profile=self._performance_profile, setup=setup
+                )
+
+        return self._db_adapter
+
+    def task_dao(self) -> TaskDAO:
+        """Obtém o DAO das tarefas compartilhado
+
+        Returns
+        -------
+        TaskDAO
+            DAO informado ou, se não informado, TaskDAOImpl sobre o adaptador compartilhado
+        """
+        if self._task_dao is None:
+            self._task_dao = TaskDAOImpl(self.db_adapter())
+
+        return self._task_dao
+
+    def task_status_dao(self) -> TaskStatusDAO:
+        """Obtém o DAO dos status compartilhado
+
+        Returns
+        -------
+        TaskStatusDAO
+            DAO informado ou, se não informado, TaskStatusDAOImpl sobre o adaptador compartilhado,
+            com os status mantidos em memória
+        """
+        if self._task_status_dao is None:
+            self._task_status_dao = CachedTaskStatusDAO(TaskStatusDAOImpl(self.db_adapter()))
+
+        return self._task_status_dao
+
+    def task_service(self, write_behind: bool = False, flush_interval_ms: int = 5, flush_max_rows: int = 500,
+                     task_cache_entries: Union[int, None] = None, task_cache_memory_bytes: Union[int, None] = None,
+                     task_cache_ttl: Union[float, None] = None) -> TaskService:
+        """Cria um serviço de tarefas sobre o adaptador e os DAOs compartilhados
+
+        Parameters
+        ----------
+        write_behind: bool
+            Se True, habilita submit_task e submit_task_status, que apenas enfileiram a escrita, gravada em lote
+            por uma thread em segundo plano. Exige uma fábrica com 'pool_size' de pelo menos 2 (padrão: False)
+        flush_interval_ms: int
+            Tempo máximo, em milissegundos, que uma escrita enfileirada aguarda a formação do lote (padrão: 5)
+        flush_max_rows: int
+            Quantidade máxima de escritas gravadas em uma única transação (padrão: 500)
+        task_cache_entries: Union[int, None]
+            Quantidade máxima de tarefas mantidas em memória por get_task_by_id.
+            O cache só é usado se este parâmetro ou 'task_cache_memory_bytes' for informado (padrão: None)
+        task_cache_memory_bytes: Union[int, None]
+            Memória aproximada máxima, em bytes, das tarefas mantidas em memória (padrão: None)
+        task_cache_ttl: Union[float, None]
+            Tempo, em segundos, após o qual uma tarefa em memória é lida novamente. Se None, não expira (padrão: None)
+
+        Returns
+        -------
+        TaskService
+            Serviço de tarefas
+
+        Raises
+        ------
+        ValueError
+            Se o modo write-behind for pedido sobre a conexão única do SQLite ou sobre um pool de 1 conexão
+        """
+        db_adapter = self.db_adapter()
+        task_dao = self.task_dao()
+        transaction = db_adapter.transaction
+
+        # Cache opcional das tarefas lidas pelo ID, próprio de cada serviço
+        if task_cache_entries is not None or task_cache_memory_bytes is not None:
+            from data_access_layer.dao.cached_task_dao import CachedTaskDAO
+
+            task_dao = CachedTaskDAO(
+                task_dao,
+                max_entries=1024 if task_cache_entries is None else task_cache_entries,
+                max_memory_bytes=task_cache_memory_bytes,
+                ttl=task_cache_ttl
+            )
+            transaction = partial(task_dao.write_transaction, db_adapter.transaction)
+
+        # Fila de escritas adiadas, apenas no modo write-behind
+        write_behind_queue = None
+
+        if write_behind:
+            from service_layer.write_behind_queue import WriteBehindQueue
+
+            write_behind_queue = WriteBehindQueue(
+                db_adapter, flush_interval_ms / 1000, flush_max_rows, transaction=transaction
+            )
+
+        return TaskService(db_adapter, task_dao, self.task_status_dao(), transaction, write_behind_queue)
+
+    def task_status_service(self) -> TaskStatusService:
+        """Cria um serviço de status sobre o DAO dos status compartilhado
+
+        Returns
+        -------
+        TaskStatusService
+            Serviço de status
+        """
+        return TaskStatusService(self.task_status_dao())
+
+    def close(self) -> None:
+        """Fecha a conexão do adaptador compartilhado, caso ele tenha sido construído
+        """
+        if self._db_adapter is not None:
+            self._db_adapter.close_connection()
@@ -0,0 +1,145 @@
+"""Regras de validação das tarefas, comuns a TaskService e AsyncTaskService"""
+from typing import Tuple, Union
+
+def validate_task_id(task_id: int) -> None:
+    """Valida o ID de uma tarefa
+
+    Parameters
+    ----------
+    task_id: int
+        Identificador da tarefa
+
+    Raises
+    ------
+    ValueError
+        Se o ID não for um número inteiro positivo
+    """
+    if not isinstance(task_id, int) or task_id <= 0:
+        raise ValueError("O ID da tarefa deve ser um número inteiro positivo!")
+
+def validate_task_data(name: str, description: str) -> Tuple[str, str]:
+    """Valida o nome e a descrição de uma nova tarefa
+
+    Parameters
+    ----------
+    name: str
+        Nome da tarefa
+    description: str
+        Descrição da tarefa
+
+    Returns
+    -------
+    Tuple[str, str]
+        Nome e descrição sem espaços nas extremidades
+
+    Raises
+    ------
+    ValueError
+        Se o nome for vazio ou se a descrição não for uma sequência de caracteres
+    """
+    if not name or not isinstance(name, str) or name.strip() == "":
+        raise ValueError("O nome da tarefa não pode ser vazio!")
+
+    if not isinstance(description, str):
+        raise ValueError("A descrição deve ser uma sequência de caracteres!")
+
+    return name.strip(), description.strip()
+
+def validate_status_name(status_name: str) -> None:
+    """Valida o nome de um status, antes da sua busca
+
+    Parameters
+    ----------
+    status_name: str
+        Nome do status
+
+    Raises
+    ------
+    ValueError
+        Se o nome for vazio
+    """
+    if not status_name or not isinstance(status_name, str):
+        raise ValueError("O nome do status não pode ser vazio!")
+
+def status_not_found(status_name: str) -> ValueError:
+    """Cria o erro de um status inexistente
+
+    Parameters
+    ----------
+    status_name: str
+        Nome do status buscado
+
+    Returns
+    -------
+    ValueError
+        Erro a ser lançado
+    """
+    return ValueError(f"Status '{status_name}' não encontrado! Use: Disponível, Fazendo ou Feita")
+
+def task_not_found(task_id: int) -> ValueError:
+    """Cria o erro de uma tarefa inexistente
+
+    Parameters
+    ----------
+    task_id: int
+        Identificador da tarefa buscada
+
+    Returns
+    -------
+    ValueError
+        Erro a ser lançado
+    """
+    return ValueError(f"Tarefa com ID {task_id} não encontrada!")
+
+def validate_page(limit: int, after_id: Union[int, None]) -> None:
+    """Valida os parâmetros de uma página de tarefas
+
+    Parameters
+    ----------
+    limit: int
+        Quantidade máxima de tarefas da página
+    after_id: Union[int, None]
+        ID da última tarefa da página anterior, ou None na primeira página
+
+    Raises
+    ------
+    ValueError
+        Se o limite ou o ID de referência forem inválidos
+    """
+    if not isinstance(limit, int) or limit <= 0:
+        raise ValueError("O limite da página deve ser um número inteiro positivo!")
+
+    if after_id is not None and (not isinstance(after_id, int) or after_id < 0):
+        raise ValueError("O ID de referência deve ser um número inteiro não negativo!")
+
+def search_expression(text: str, limit: int) -> str:
+    """Valida uma busca e monta a expressão da busca textual
+
+    Parameters
+    ----------
+    text: str
+        Palavras buscadas. Todas devem aparecer na tarefa; a última também casa como prefixo
+    limit: int
+        Quantidade máxima de tarefas retornadas
+
+    Returns
+    -------
+    str
+        Expressão da busca, com cada palavra entre aspas
+
+    Raises
+    ------
+    ValueError
+        Se o texto for vazio ou se o limite for inválido
+    """
+    if not isinstance(text, str) or text.strip() == "":
+        raise ValueError("O texto da busca não pode ser vazio!")
+
+    if not isinstance(limit, int) or limit <= 0:
+        raise ValueError("O limite da busca deve ser um número inteiro positivo!")
+
+    # Cada palavra vira um termo entre aspas, para que caracteres do usuário não sejam lidos como operadores
+    terms = ['"' + word.replace('"', '""') + '"' for word in text.split()]
+    terms[-1] += "*"
+
+    return " ".join(terms)
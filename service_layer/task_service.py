@@ -1,30 +1,79 @@
-from typing import Tuple, Union
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, ContextManager, Dict, Iterable, Iterator, List, Tuple, Union
 from entities.task import Task
 from entities.task_status import TaskStatus
-from data_access_layer.dao.task_dao_impl import TaskDAOImpl
-from data_access_layer.dao.task_status_dao_impl import TaskStatusDAOImpl
-from data_access_layer.database_api_adapters.sqlite_database_api_adapter import SQLiteDatabaseAPIAdapter
+from entities.task_table import TaskTable
+from data_access_layer.dao.task_dao import TaskDAO
+from data_access_layer.dao.task_status_dao import TaskStatusDAO
+from data_access_layer.database_api_adapters.database_api_adapter import DatabaseAPIAdapter
+from service_layer.task_rules import (
+    search_expression, status_not_found, task_not_found, validate_page, validate_status_name, validate_task_data,
+    validate_task_id
+)
+
+# Apenas para as anotações de tipo: o serviço recebe os objetos prontos, construídos por ServiceFactory
+if TYPE_CHECKING:
+    from data_access_layer.database_api_adapters.in_memory_database import InMemoryDatabase
+    from service_layer.write_behind_queue import WriteBehindQueue
 
 class TaskService:
     """
     Serviço responsável pela lógica de negócio relacionada às tarefas
     """
-    def __init__(self, database_filename: str = "database/schema.db") -> None:
-        """Inicializa um objeto TaskService
+    def __init__(self, db_adapter: Union[DatabaseAPIAdapter, 'InMemoryDatabase'], task_dao: TaskDAO,
+                 task_status_dao: TaskStatusDAO, transaction: Union[Callable[[], ContextManager[None]], None] = None,
+                 write_behind: Union['WriteBehindQueue', None] = None) -> None:
+        """Inicializa um objeto TaskService. Os serviços são normalmente criados por ServiceFactory, que constrói
+        e compartilha o adaptador, os DAOs, o cache de tarefas e a fila do modo write-behind
         
         Parameters
         ----------
-        database_filename: str
-            Caminho para o arquivo do banco de dados SQLite (padrão: "database/schema.db")
+        db_adapter: Union[DatabaseAPIAdapter, InMemoryDatabase]
+            Adaptador do banco de dados dos DAOs, ou banco de dados em memória
+        task_dao: TaskDAO
+            DAO das tarefas, como TaskDAOImpl, CachedTaskDAO ou InMemoryTaskDAO
+        task_status_dao: TaskStatusDAO
+            DAO dos status
+        transaction: Union[Callable[[], ContextManager[None]], None]
+            Cria as transações de escrita, como CachedTaskDAO.write_transaction sobre o cache de tarefas.
+            Se None, usa 'db_adapter.transaction' (padrão: None)
+        write_behind: Union[WriteBehindQueue, None]
+            Fila de escritas adiadas usada por submit_task e submit_task_status. Deve usar a mesma transação
+            do serviço. Se None, o modo write-behind fica desativado (padrão: None)
+        """
+        self._db_adapter = db_adapter
+        self._task_dao = task_dao
+        self._task_status_dao = task_status_dao
+        self._transaction = db_adapter.transaction if transaction is None else transaction
+        self._write_behind = write_behind
+
+    def flush(self) -> None:
+        """Aguarda a gravação de todas as escritas enfileiradas até o momento. Sem efeito fora do modo write-behind
+        """
+        if self._write_behind is not None:
+            self._write_behind.flush()
+
+    def close(self) -> None:
+        """Grava as escritas pendentes e encerra a thread de escrita do modo write-behind.
+        Deve ser chamado antes do fim do programa, ou as escritas ainda na fila são perdidas
         """
-        # Instancia o adaptador do banco de dados
-        db_adapter = SQLiteDatabaseAPIAdapter(database_filename)
+        if self._write_behind is not None:
+            self._write_behind.close()
+
+    def task_cache_statistics(self) -> Union[Dict[str, int], None]:
+        """Obtém os contadores do cache de tarefas
         
-        # Instancia os DAOs necessários
-        self._task_dao = TaskDAOImpl(db_adapter)
-        self._task_status_dao = TaskStatusDAOImpl(db_adapter)
+        Returns
+        -------
+        Union[Dict[str, int], None]
+            Acertos, faltas, descartes, entradas e memória do cache, ou None se o cache não estiver ativo
+        """
+        # Apenas CachedTaskDAO mantém estatísticas
+        statistics = getattr(self._task_dao, "statistics", None)
+        
+        return None if statistics is None else statistics()
 
-    def create_task(self, name: str, description: str, status_name: str) -> None:
+    def create_task(self, name: str, description: str, status_name: str) -> int:
         """Cria uma nova tarefa no sistema
         
         Parameters
@@ -35,38 +84,162 @@ class TaskService:
             Descrição da tarefa
         status_name: str
             Nome do status inicial da tarefa (Disponível, Fazendo ou Feita)
+        
+        Returns
+        -------
+        int
+            ID da nova tarefa
             
         Raises
         ------
         ValueError
             Se o nome for vazio ou se o status não existir
         """
-        # Validações de regra de negócio
-        if not name or not isinstance(name, str) or name.strip() == "":
-            raise ValueError("O nome da tarefa não pode ser vazio!")
+        with self._transaction():
+            task = self._build_task(name, description, status_name, {})
+            
+            # Persiste no banco de dados
+            return self._task_dao.insert(task)
+
+    def submit_task(self, name: str, description: str, status_name: str) -> Future:
+        """Enfileira a criação de uma tarefa no modo write-behind
+        
+        Parameters
+        ----------
+        name: str
+            Nome da tarefa
+        description: str
+            Descrição da tarefa
+        status_name: str
+            Nome do status inicial da tarefa (Disponível, Fazendo ou Feita)
+        
+        Returns
+        -------
+        Future
+            Resolvido com o ID da nova tarefa quando o lote da escrita for confirmado
+            
+        Raises
+        ------
+        ValueError
+            Se o nome for vazio ou se o status não existir
+        RuntimeError
+            Se o modo write-behind não estiver ativo ou se a fila já tiver sido fechada
+        """
+        write_behind = self._write_behind_queue()
         
-        if not isinstance(description, str):
-            raise ValueError("A descrição deve ser uma sequência de caracteres!")
+        # Valida antes de enfileirar: apenas a gravação é adiada
+        task = self._build_task(name, description, status_name, {})
         
-        if not status_name or not isinstance(status_name, str):
-            raise ValueError("O nome do status não pode ser vazio!")
+        return write_behind.submit(self._task_dao.insert, task)
+
+    def _write_behind_queue(self) -> 'WriteBehindQueue':
+        """Obtém a fila de escritas adiadas
         
-        # Busca o status pelo nome
-        status = self._task_status_dao.get_by_name(status_name)
+        Returns
+        -------
+        WriteBehindQueue
+            Fila do modo write-behind
+            
+        Raises
+        ------
+        RuntimeError
+            Se o modo write-behind não estiver ativo
+        """
+        if self._write_behind is None:
+            raise RuntimeError("O modo write-behind não está ativo! Crie o serviço com write_behind=True")
+        
+        return self._write_behind
+
+    def create_tasks(self, tasks_data: Iterable[Tuple[str, str, str]]) -> None:
+        """Cria várias tarefas no sistema em uma única transação
+        
+        Parameters
+        ----------
+        tasks_data: Iterable[Tuple[str, str, str]]
+            Triplas (nome, descrição, nome do status) das tarefas a serem criadas
+            
+        Raises
+        ------
+        ValueError
+            Se algum nome for vazio ou se algum status não existir. Nesse caso nenhuma tarefa é criada
+        """
+        # Cada status distinto é buscado uma única vez no lote
+        status_cache: Dict[str, TaskStatus] = {}
         
-        if status is None:
-            raise ValueError(f"Status '{status_name}' não encontrado! Use: Disponível, Fazendo ou Feita")
+        with self._transaction():
+            tasks = [
+                self._build_task(name, description, status_name, status_cache)
+                for name, description, status_name in tasks_data
+            ]
+            
+            if tasks:
+                self._task_dao.insert_many(tasks)
+
+    def _build_task(self, name: str, description: str, status_name: str,
+                    status_cache: Dict[str, TaskStatus]) -> Task:
+        """Valida os dados de uma nova tarefa e monta o objeto Task correspondente
+        
+        Parameters
+        ----------
+        name: str
+            Nome da tarefa
+        description: str
+            Descrição da tarefa
+        status_name: str
+            Nome do status inicial da tarefa
+        status_cache: Dict[str, TaskStatus]
+            Status já buscados, indexados pelo nome
+            
+        Returns
+        -------
+        Task
+            Tarefa validada, ainda sem identificador
+        """
+        # Validações de regra de negócio
+        name, description = validate_task_data(name, description)
+        
+        # Busca o status pelo nome
+        status = self._get_status(status_name, status_cache)
         
         # Cria a tarefa (id será gerado pelo banco)
-        task = Task(
+        return Task(
             id=0,  # Será gerado automaticamente pelo banco
-            name=name.strip(),
-            description=description.strip(),
+            name=name,
+            description=description,
             status=status
         )
+
+    def _get_status(self, status_name: str, status_cache: Dict[str, TaskStatus]) -> TaskStatus:
+        """Busca um status pelo nome, reaproveitando os status já buscados
+        
+        Parameters
+        ----------
+        status_name: str
+            Nome do status
+        status_cache: Dict[str, TaskStatus]
+            Status já buscados, indexados pelo nome
+            
+        Returns
+        -------
+        TaskStatus
+            Status encontrado
+            
+        Raises
+        ------
+        ValueError
+            Se o nome for vazio ou se o status não existir
+        """
+        validate_status_name(status_name)
         
-        # Persiste no banco de dados
-        self._task_dao.insert(task)
+        if status_name not in status_cache:
+            status = self._task_status_dao.get_by_name(status_name)
+            
+            if status is None:
+                raise status_not_found(status_name)
+            
+            status_cache[status_name] = status
+        
+        return status_cache[status_name]
 
     def list_all_tasks(self) -> Union[Tuple[Task], None]:
         """Lista todas as tarefas cadastradas no sistema
@@ -78,6 +251,127 @@ class TaskService:
         """
         return self._task_dao.list_all()
 
+    def iter_tasks(self, batch_size: int = 1000) -> Iterator[Task]:
+        """Percorre todas as tarefas cadastradas no sistema sob demanda
+        
+        Parameters
+        ----------
+        batch_size: int
+            Quantidade de tarefas lidas do banco de dados por vez
+        
+        Returns
+        -------
+        Iterator[Task]
+            Iterador das tarefas, com uso de memória constante
+        """
+        return self._task_dao.iter_all(batch_size)
+
+    def fetch_task_table(self, status_name: Union[str, None] = None) -> TaskTable:
+        """Lê as tarefas em formato colunar, para relatórios e leituras em massa
+        
+        Parameters
+        ----------
+        status_name: Union[str, None]
+            Nome do status das tarefas (Disponível, Fazendo ou Feita). Se None, lê todas as tarefas
+        
+        Returns
+        -------
+        TaskTable
+            Tabela com as tarefas, ordenadas pelo ID (vazia se não houver tarefas)
+            
+        Raises
+        ------
+        ValueError
+            Se o status for inválido
+        """
+        if status_name is None:
+            return self._task_dao.fetch_columns()
+        
+        status = self._get_status(status_name, {})
+        
+        return self._task_dao.fetch_columns(status.id)
+
+    def list_tasks_page(self, limit: int = 50, after_id: Union[int, None] = None) -> Union[Tuple[Task], None]:
+        """Lista uma página de tarefas, ordenadas pelo ID
+        
+        Parameters
+        ----------
+        limit: int
+            Quantidade máxima de tarefas da página (padrão: 50)
+        after_id: Union[int, None]
+            ID da última tarefa da página anterior. Se None, lista a primeira página
+        
+        Returns
+        -------
+        Union[Tuple[Task], None]
+            Tupla com as tarefas da página ou None se não houver tarefas após 'after_id'
+            
+        Raises
+        ------
+        ValueError
+            Se o limite ou o ID de referência forem inválidos
+        """
+        validate_page(limit, after_id)
+        
+        return self._task_dao.list_page(limit, after_id)
+
+    def list_tasks_by_status(self, status_name: str) -> Union[Tuple[Task], None]:
+        """Lista as tarefas que possuem um determinado status
+        
+        Parameters
+        ----------
+        status_name: str
+            Nome do status (Disponível, Fazendo ou Feita)
+        
+        Returns
+        -------
+        Union[Tuple[Task], None]
+            Tupla com as tarefas do status ou None se não houver tarefas com ele
+            
+        Raises
+        ------
+        ValueError
+            Se o status for inválido
+        """
+        status = self._get_status(status_name, {})
+        
+        return self._task_dao.list_by_status(status.id)
+
+    def search_tasks(self, text: str, limit: int = 50) -> Union[Tuple[Task], None]:
+        """Busca tarefas por palavras do nome ou da descrição, das mais às menos relevantes
+        
+        Parameters
+        ----------
+        text: str
+            Palavras buscadas. Todas devem aparecer na tarefa; a última também casa como prefixo
+        limit: int
+            Quantidade máxima de tarefas retornadas (padrão: 50)
+        
+        Returns
+        -------
+        Union[Tuple[Task], None]
+            Tupla com as tarefas encontradas ou None se nenhuma tarefa for encontrada
+            
+        Raises
+        ------
+        ValueError
+            Se o texto for vazio ou se o limite for inválido
+        """
+        return self._task_dao.search(search_expression(text, limit), limit)
+
+    def count_tasks_by_status(self) -> Dict[str, int]:
+        """Conta as tarefas de cada status
+        
+        Returns
+        -------
+        Dict[str, int]
+            Quantidade de tarefas indexada pelo nome do status
+        """
+        return {
+            status.name: total
+            for status, total in self._task_dao.count_by_status()
+        }
+
     def delete_task(self, task_id: int) -> None:
         """Remove uma tarefa do sistema
         
@@ -91,22 +385,35 @@ class TaskService:
         ValueError
             Se o ID for inválido ou se a tarefa não existir
         """
-        if not isinstance(task_id, int) or task_id <= 0:
-            raise ValueError("O ID da tarefa deve ser um número inteiro positivo!")
-        
-        # Verifica se a tarefa existe
-        all_tasks = self._task_dao.list_all()
-        
-        if all_tasks is None:
-            raise ValueError("Não há tarefas cadastradas para remover!")
-        
-        task_exists = any(task.id == task_id for task in all_tasks)
+        # A verificação e a remoção ocorrem na mesma transação
+        with self._transaction():
+            # Verifica se a tarefa existe
+            self._validate_existing_task_id(task_id)
+            
+            # Remove a tarefa
+            self._task_dao.delete(task_id)
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> None:
+        """Remove várias tarefas do sistema em uma única transação
         
-        if not task_exists:
-            raise ValueError(f"Tarefa com ID {task_id} não encontrada!")
+        Parameters
+        ----------
+        task_ids: Iterable[int]
+            Identificadores das tarefas a serem removidas
+            
+        Raises
+        ------
+        ValueError
+            Se algum ID for inválido ou se alguma tarefa não existir. Nesse caso nenhuma tarefa é removida
+        """
+        task_ids = list(task_ids)
         
-        # Remove a tarefa
-        self._task_dao.delete(task_id)
+        with self._transaction():
+            for task_id in task_ids:
+                self._validate_existing_task_id(task_id)
+            
+            if task_ids:
+                self._task_dao.delete_many(task_ids)
 
     def update_task_status(self, task_id: int, new_status_name: str) -> None:
         """Altera o status de uma tarefa
@@ -117,38 +424,125 @@ class TaskService:
             Identificador da tarefa
         new_status_name: str
             Nome do novo status (Disponível, Fazendo ou Feita)
-            
+        
         Raises
         ------
         ValueError
             Se o ID for inválido, se a tarefa não existir ou se o status for inválido
         """
-        if not isinstance(task_id, int) or task_id <= 0:
-            raise ValueError("O ID da tarefa deve ser um número inteiro positivo!")
+        validate_task_id(task_id)
+        
+        validate_status_name(new_status_name)
         
-        if not new_status_name or not isinstance(new_status_name, str):
-            raise ValueError("O nome do status não pode ser vazio!")
+        # A verificação e a alteração ocorrem na mesma transação
+        with self._transaction():
+            # Verifica se a tarefa existe
+            if not self._task_dao.exists(task_id):
+                raise task_not_found(task_id)
+            
+            # Busca o novo status
+            new_status = self._task_status_dao.get_by_name(new_status_name)
+            
+            if new_status is None:
+                raise status_not_found(new_status_name)
+            
+            # Atualiza o status da tarefa
+            self._task_dao.update_status(task_id, new_status)
+
+    def submit_task_status(self, task_id: int, new_status_name: str) -> Future:
+        """Enfileira a alteração do status de uma tarefa no modo write-behind
         
-        # Verifica se a tarefa existe
-        all_tasks = self._task_dao.list_all()
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa
+        new_status_name: str
+            Nome do novo status (Disponível, Fazendo ou Feita)
         
-        if all_tasks is None:
-            raise ValueError("Não há tarefas cadastradas!")
+        Returns
+        -------
+        Future
+            Resolvido quando o lote da alteração for confirmado, ou com ValueError se a tarefa não existir
+            
+        Raises
+        ------
+        ValueError
+            Se o ID for inválido ou se o status for inválido
+        RuntimeError
+            Se o modo write-behind não estiver ativo ou se a fila já tiver sido fechada
+        """
+        write_behind = self._write_behind_queue()
         
-        task_exists = any(task.id == task_id for task in all_tasks)
+        validate_task_id(task_id)
         
-        if not task_exists:
-            raise ValueError(f"Tarefa com ID {task_id} não encontrada!")
+        # A existência da tarefa só é verificada na gravação, pois pode depender de escritas ainda na fila
+        new_status = self._get_status(new_status_name, {})
         
-        # Busca o novo status
-        new_status = self._task_status_dao.get_by_name(new_status_name)
+        return write_behind.submit(self._write_task_status, task_id, new_status)
+
+    def _write_task_status(self, task_id: int, new_status: TaskStatus) -> None:
+        """Grava a alteração de status enfileirada por submit_task_status
         
-        if new_status is None:
-            raise ValueError(f"Status '{new_status_name}' não encontrado! Use: Disponível, Fazendo ou Feita")
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa
+        new_status: TaskStatus
+            Novo status da tarefa
+            
+        Raises
+        ------
+        ValueError
+            Se a tarefa não existir
+        """
+        if not self._task_dao.exists(task_id):
+            raise task_not_found(task_id)
         
-        # Atualiza o status da tarefa
         self._task_dao.update_status(task_id, new_status)
 
+    def update_task_statuses(self, updates: Iterable[Tuple[int, str]]) -> None:
+        """Altera o status de várias tarefas em uma única transação
+        
+        Parameters
+        ----------
+        updates: Iterable[Tuple[int, str]]
+            Pares (ID da tarefa, nome do novo status)
+            
+        Raises
+        ------
+        ValueError
+            Se algum ID for inválido, se alguma tarefa não existir ou se algum status for inválido.
+            Nesse caso nenhuma tarefa é alterada
+        """
+        status_cache: Dict[str, TaskStatus] = {}
+        resolved_updates: List[Tuple[int, TaskStatus]] = []
+        
+        with self._transaction():
+            for task_id, new_status_name in updates:
+                self._validate_existing_task_id(task_id)
+                resolved_updates.append((task_id, self._get_status(new_status_name, status_cache)))
+            
+            if resolved_updates:
+                self._task_dao.update_status_many(resolved_updates)
+
+    def _validate_existing_task_id(self, task_id: int) -> None:
+        """Valida o ID de uma tarefa e verifica se ela existe
+        
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa
+            
+        Raises
+        ------
+        ValueError
+            Se o ID for inválido ou se a tarefa não existir
+        """
+        validate_task_id(task_id)
+        
+        if not self._task_dao.exists(task_id):
+            raise task_not_found(task_id)
+
     def get_task_by_id(self, task_id: int) -> Union[Task, None]:
         """Busca uma tarefa específica pelo ID
         
@@ -167,16 +561,28 @@ class TaskService:
         ValueError
             Se o ID for inválido
         """
-        if not isinstance(task_id, int) or task_id <= 0:
-            raise ValueError("O ID da tarefa deve ser um número inteiro positivo!")
-        
-        all_tasks = self._task_dao.list_all()
+        validate_task_id(task_id)
         
-        if all_tasks is None:
-            return None
+        return self._task_dao.get_by_id(task_id)
+
+    def task_exists(self, task_id: int) -> bool:
+        """Verifica se uma tarefa existe, sem carregá-la
         
-        for task in all_tasks:
-            if task.id == task_id:
-                return task
+        Parameters
+        ----------
+        task_id: int
+            Identificador da tarefa
+            
+        Returns
+        -------
+        bool
+            True se a tarefa existir
+            
+        Raises
+        ------
+        ValueError
+            Se o ID for inválido
+        """
+        validate_task_id(task_id)
         
-        return None
\ No newline at end of file
+        return self._task_dao.exists(task_id)
\ No newline at end of file
@@ -1,25 +1,20 @@
 from typing import Tuple, Union
 from entities.task_status import TaskStatus
-from data_access_layer.dao.task_status_dao_impl import TaskStatusDAOImpl
-from data_access_layer.database_api_adapters.sqlite_database_api_adapter import SQLiteDatabaseAPIAdapter
+from data_access_layer.dao.task_status_dao import TaskStatusDAO
 
 class TaskStatusService:
     """
     Serviço responsável pela lógica de negócio relacionada aos status das tarefas
     """
-    def __init__(self, database_filename: str = "database/schema.db") -> None:
-        """Inicializa um objeto TaskStatusService
+    def __init__(self, task_status_dao: TaskStatusDAO) -> None:
+        """Inicializa um objeto TaskStatusService. Os serviços são normalmente criados por ServiceFactory
         
         Parameters
         ----------
-        database_filename: str
-            Caminho para o arquivo do banco de dados SQLite (padrão: "database/schema.db")
+        task_status_dao: TaskStatusDAO
+            DAO dos status, como CachedTaskStatusDAO ou InMemoryTaskStatusDAO
         """
-        # Instancia o adaptador do banco de dados
-        db_adapter = SQLiteDatabaseAPIAdapter(database_filename)
-        
-        # Instancia o DAO necessário
-        self._task_status_dao = TaskStatusDAOImpl(db_adapter)
+        self._task_status_dao = task_status_dao
 
     def list_all_status(self) -> Union[Tuple[TaskStatus], None]:
         """Lista todos os status disponíveis no sistema
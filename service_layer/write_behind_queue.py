@@ -0,0 +1,218 @@
+import threading
+import time
+from concurrent.futures import Future
+from queue import Empty, Queue
+from typing import Any, Callable, ContextManager, List, Tuple, Union
+from data_access_layer.database_api_adapters.database_api_adapter import DatabaseAPIAdapter
+from data_access_layer.database_api_adapters.sqlite_database_api_adapter import SQLiteDatabaseAPIAdapter
+from data_access_layer.database_api_adapters.sqlite_pooled_database_api_adapter import SQLitePooledDatabaseAPIAdapter
+
+class WriteBehindQueue:
+    """
+    Fila de escritas adiadas (write-behind) com confirmação em grupo (group commit).
+
+    As operações enfileiradas são executadas por uma thread em segundo plano, que as agrupa em uma única
+    transação a cada 'flush_interval' segundos ou a cada 'max_batch_size' operações, o que ocorrer primeiro.
+    Cada operação recebe um Future, resolvido somente depois que a transação do seu lote for confirmada.
+
+    Com um pool de conexões, a thread de escrita reserva uma conexão no primeiro lote e a mantém até o fim,
+    para que conexões presas por outras threads (como um iterador ainda aberto) não impeçam a gravação
+    """
+    # Marcadores de controle da fila
+    _FLUSH = object()
+    _STOP = object()
+
+    def __init__(self, db_adapter: DatabaseAPIAdapter, flush_interval: float = 0.005, max_batch_size: int = 500,
+                 transaction: Union[Callable[[], ContextManager[None]], None] = None) -> None:
+        """Inicializa um objeto WriteBehindQueue e inicia a thread de escrita
+
+        Parameters
+        ----------
+        db_adapter: DatabaseAPIAdapter
+            Adaptador usado para abrir as transações. Deve poder ser usado por outra thread: um pool com
+            pelo menos 2 conexões, uma delas reservada à thread de escrita, ou um banco de dados em memória
+        flush_interval: float
+            Tempo máximo, em segundos, que uma operação aguarda a formação do lote (padrão: 0.005)
+        max_batch_size: int
+            Quantidade máxima de operações por transação (padrão: 500)
+        transaction: Union[Callable[[], ContextManager[None]], None]
+            Cria a transação de cada lote. Se None, usa 'db_adapter.transaction' (padrão: None)
+
+        Raises
+        ------
+        ValueError
+            Se o adaptador for de conexão única, se o pool tiver menos de 2 conexões ou se os parâmetros do lote
+            forem inválidos
+        """
+        # A conexão única pertence à thread que a abriu
+        if isinstance(db_adapter, SQLiteDatabaseAPIAdapter):
+            raise ValueError("O modo write-behind exige um adaptador com pool de conexões (pool_size)!")
+
+        # Com uma única conexão, a thread de escrita esperaria indefinidamente enquanto outra thread a usasse
+        if isinstance(db_adapter, SQLitePooledDatabaseAPIAdapter) and db_adapter.pool_size < 2:
+            raise ValueError("O modo write-behind exige um pool com pelo menos 2 conexões (pool_size)!")
+
+        if not isinstance(flush_interval, (int, float)) or flush_interval < 0:
+            raise ValueError("O intervalo de escrita deve ser um número não negativo!")
+
+        if not isinstance(max_batch_size, int) or max_batch_size <= 0:
+            raise ValueError("O tamanho máximo do lote deve ser um número inteiro positivo!")
+
+        self._db_adapter = db_adapter
+        self._transaction = db_adapter.transaction if transaction is None else transaction
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._queue: "Queue[Tuple[Any, Tuple[Any, ...], Union[Future, None]]]" = Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._reserved_connection = None
+
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, function: Callable[..., Any], *args: Any) -> Future:
+        """Enfileira uma operação de escrita
+
+        Parameters
+        ----------
+        function: Callable[..., Any]
+            Operação executada pela thread de escrita, dentro da transação do lote
+        args: Any
+            Argumentos passados à operação
+
+        Returns
+        -------
+        Future
+            Resolvido com o valor retornado pela operação após a confirmação do lote,
+            ou com a exceção lançada pela operação
+        """
+        future = Future()
+
+        # A verificação e o enfileiramento ocorrem sob o bloqueio de 'close', para que nenhuma operação fique após o _STOP
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("A fila de escritas está fechada!")
+
+            self._queue.put((function, args, future))
+
+        return future
+
+    def flush(self) -> None:
+        """Aguarda até que todas as operações enfileiradas até o momento tenham sido confirmadas
+        """
+        marker = Future()
+
+        with self._close_lock:
+            # Após 'close', todas as operações já foram gravadas
+            if self._closed or not self._thread.is_alive():
+                return
+
+            self._queue.put((self._FLUSH, (), marker))
+
+        marker.result()
+
+    def close(self) -> None:
+        """Grava todas as operações pendentes e encerra a thread de escrita. Novas operações são recusadas
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._queue.put((self._STOP, (), None))
+
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Laço da thread de escrita: forma os lotes e os grava
+        """
+        stop = False
+
+        while not stop:
+            batch: List[Tuple[Callable[..., Any], Tuple[Any, ...], Future]] = []
+            markers: List[Future] = []
+
+            # Aguarda a primeira operação por tempo indeterminado e as seguintes até o fim do intervalo
+            item = self._queue.get()
+            deadline = time.monotonic() + self._flush_interval
+
+            while True:
+                function, args, future = item
+
+                if function is self._STOP:
+                    stop = True
+                    break
+
+                if function is self._FLUSH:
+                    markers.append(future)
+                    break
+
+                batch.append(item)
+
+                if len(batch) >= self._max_batch_size:
+                    break
+
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+
+            for marker in markers:
+                marker.set_result(None)
+
+        self._fail_pending()
+
+        if self._reserved_connection is not None:
+            self._db_adapter.release(self._reserved_connection)
+            self._reserved_connection = None
+
+    def _fail_pending(self) -> None:
+        """Recusa as operações e os marcadores que tenham ficado na fila após o _STOP, para que ninguém os aguarde
+        indefinidamente
+        """
+        while True:
+            try:
+                _, _, future = self._queue.get_nowait()
+            except Empty:
+                return
+
+            if future is not None:
+                future.set_exception(RuntimeError("A fila de escritas está fechada!"))
+
+    def _write_batch(self, batch: List[Tuple[Callable[..., Any], Tuple[Any, ...], Future]]) -> None:
+        """Executa um lote de operações em uma única transação
+
+        Parameters
+        ----------
+        batch: List[Tuple[Callable[..., Any], Tuple[Any, ...], Future]]
+            Operações do lote, na ordem em que foram enfileiradas
+        """
+        outcomes = []
+
+        try:
+            if self._reserved_connection is None and isinstance(self._db_adapter, SQLitePooledDatabaseAPIAdapter):
+                # Os comandos seguintes desta thread usam a conexão reservada, sem disputar o pool
+                self._reserved_connection = self._db_adapter.acquire()
+
+            with self._transaction():
+                for function, args, future in batch:
+                    # Cada operação em um savepoint: uma falha desfaz apenas a própria operação
+                    try:
+                        with self._db_adapter.transaction():
+                            outcomes.append((future, function(*args), None))
+                    except Exception as error:
+                        outcomes.append((future, None, error))
+        except Exception as error:
+            # A confirmação do lote falhou: nenhuma operação foi gravada
+            for _, _, future in batch:
+                future.set_exception(error)
+            return
+
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
@@ -0,0 +1,102 @@
+import asyncio
+from functools import partial
+
+
+from data_access_layer.dao.async_task_dao_impl import AsyncTaskDAOImpl
+from data_access_layer.dao.async_task_status_dao_impl import AsyncTaskStatusDAOImpl
+from data_access_layer.database_api_adapters.async_sqlite_database_api_adapter import AsyncSQLiteDatabaseAPIAdapter
+from data_access_layer.migrations.migration_runner import migrate_database
+from entities.task import Task
+from entities.task_status import TaskStatus
+
+
+AVAILABLE = TaskStatus(1, "Disponível")
+DONE = TaskStatus(3, "Feita")
+
+
+class TestAsyncTaskDAOImpl:
+
+    async def _adapter(self, tmp_path) -> AsyncSQLiteDatabaseAPIAdapter:
+
+        filename = str(tmp_path / "async_dao.db")
+
+        adapter = AsyncSQLiteDatabaseAPIAdapter(filename, setup=partial(migrate_database, filename))
+
+        await adapter.connect()
+
+        return adapter
+
+    def test_operations(self, tmp_path) -> None:
+
+        async def scenario():
+
+            adapter = await self._adapter(tmp_path)
+            task_dao = AsyncTaskDAOImpl(adapter)
+
+            await task_dao.insert_many([Task(0, f"Tarefa {i}", "", AVAILABLE) for i in range(1, 6)])
+            await task_dao.insert(Task(0, "Relatório", "Mensal", AVAILABLE))
+
+            await task_dao.update_status(1, DONE)
+            await task_dao.update_status_many([(2, DONE)])
+            await task_dao.delete(3)
+            await task_dao.delete_many([4])
+
+            results = (
+                [task.id for task in await task_dao.list_all()],
+                [task.id async for task in task_dao.iter_all(batch_size=2)],
+                [task.id for task in await task_dao.list_page(2, after_id=1)],
+                [task.id for task in await task_dao.list_by_status(3)],
+                [(status.name, total) for status, total in await task_dao.count_by_status()],
+                [task.name for task in await task_dao.search('"relatorio"', 10)],
+                list((await task_dao.fetch_columns(1)).ids),
+                (await task_dao.get_by_id(1)).status.name,
+                [await task_dao.exists(task_id) for task_id in (1, 3)],
+            )
+
+            await adapter.close_connection()
+
+            return results
+
+        assert asyncio.run(scenario()) == (
+            [1, 2, 5, 6],
+            [1, 2, 5, 6],
+            [2, 5],
+            [1, 2],
+            [("Disponível", 2), ("Fazendo", 0), ("Feita", 2)],
+            ["Relatório"],
+            [5, 6],
+            "Feita",
+            [True, False],
+        )
+
+    def test_concurrent_coroutines(self, tmp_path) -> None:
+
+        async def scenario():
+
+            adapter = await self._adapter(tmp_path)
+            task_dao = AsyncTaskDAOImpl(adapter)
+            task_status_dao = AsyncTaskStatusDAOImpl(adapter)
+
+            await asyncio.gather(*[task_dao.insert(Task(0, f"Tarefa {i}", "", AVAILABLE)) for i in range(100)])
+
+            statuses = await asyncio.gather(*[task_status_dao.get_by_name("Feita") for _ in range(20)])
+
+            await asyncio.gather(*[task_dao.update_status(task_id, statuses[0]) for task_id in range(1, 51)])
+
+            results = (
+                [(status.name, total) for status, total in await task_dao.count_by_status()],
+                [status.name for status in await task_status_dao.list_all()],
+                (await task_status_dao.get_by_id(2)).name,
+                await task_status_dao.get_by_name("Inexistente"),
+            )
+
+            await adapter.close_connection()
+
+            return results
+
+        assert asyncio.run(scenario()) == (
+            [("Disponível", 50), ("Fazendo", 0), ("Feita", 50)],
+            ["Disponível", "Fazendo", "Feita"],
+            "Fazendo",
+            None,
+        )
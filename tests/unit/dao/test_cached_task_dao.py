@@ -0,0 +1,217 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+
+from data_access_layer.dao.cached_task_dao import CachedTaskDAO
+from entities.task import Task
+from entities.task_status import TaskStatus
+from service_layer.service_factory import ServiceFactory
+
+
+class TestCachedTaskDAO:
+
+    def _fake_task_dao(self) -> Mock:
+
+        fake_task_dao = Mock()
+
+        fake_task_dao.get_by_id.side_effect = lambda task_id: (
+            Task(task_id, f"Tarefa {task_id:02d}", "Descrição", TaskStatus(1, "Disponível")) if task_id <= 10 else None
+        )
+
+        return fake_task_dao
+
+    def test_arguments(self) -> None:
+
+        with pytest.raises(ValueError):
+
+            CachedTaskDAO(Mock(), max_entries=0)
+
+        with pytest.raises(ValueError):
+
+            CachedTaskDAO(Mock(), max_memory_bytes=0)
+
+        with pytest.raises(ValueError):
+
+            CachedTaskDAO(Mock(), ttl=-1)
+
+    def test_read_through(self) -> None:
+
+        fake_task_dao = self._fake_task_dao()
+
+        task_dao = CachedTaskDAO(fake_task_dao)
+
+        assert task_dao.get_by_id(1).name == "Tarefa 01"
+        assert task_dao.get_by_id(1).name == "Tarefa 01"
+        assert task_dao.exists(1)
+
+        # Tarefas inexistentes não são mantidas em cache
+        assert task_dao.get_by_id(11) is None
+        assert task_dao.get_by_id(11) is None
+
+        assert fake_task_dao.get_by_id.call_count == 3
+        fake_task_dao.exists.assert_not_called()
+
+        assert task_dao.statistics() == {"hits": 1, "misses": 3, "evictions": 0, "entries": 1, "memory_bytes": task_dao.memory_bytes}
+
+    def test_lru_eviction(self) -> None:
+
+        task_dao = CachedTaskDAO(self._fake_task_dao(), max_entries=2)
+
+        task_dao.get_by_id(1)
+        task_dao.get_by_id(2)
+        task_dao.get_by_id(1)
+        task_dao.get_by_id(3)
+
+        # A tarefa 2 era a usada há mais tempo
+        assert len(task_dao) == 2
+        assert task_dao.evictions == 1
+
+        task_dao.get_by_id(1)
+        task_dao.get_by_id(2)
+
+        assert task_dao.hits == 2
+        assert task_dao.misses == 4
+
+    def test_memory_budget(self) -> None:
+
+        task_dao = CachedTaskDAO(self._fake_task_dao(), max_entries=100)
+        task_dao.get_by_id(1)
+
+        task_size = task_dao.memory_bytes
+
+        task_dao = CachedTaskDAO(self._fake_task_dao(), max_entries=100, max_memory_bytes=task_size * 3)
+
+        for task_id in range(1, 11):
+
+            task_dao.get_by_id(task_id)
+
+        assert len(task_dao) == 3
+        assert task_dao.memory_bytes <= task_size * 3
+        assert task_dao.evictions == 7
+
+    def test_ttl(self, monkeypatch) -> None:
+
+        now = [100.0]
+
+        monkeypatch.setattr("data_access_layer.dao.cached_task_dao.time.monotonic", lambda: now[0])
+
+        task_dao = CachedTaskDAO(self._fake_task_dao(), ttl=5)
+
+        task_dao.get_by_id(1)
+        task_dao.get_by_id(1)
+
+        now[0] += 5
+
+        task_dao.get_by_id(1)
+
+        assert (task_dao.hits, task_dao.misses, task_dao.evictions) == (1, 2, 1)
+
+    def test_write_invalidation(self) -> None:
+
+        fake_task_dao = self._fake_task_dao()
+
+        task_dao = CachedTaskDAO(fake_task_dao)
+        status = TaskStatus(2, "Fazendo")
+
+        for task_id in range(1, 6):
+
+            task_dao.get_by_id(task_id)
+
+        task_dao.update_status(1, status)
+        task_dao.delete(2)
+        task_dao.update_status_many([(3, status)])
+        task_dao.delete_many([4])
+
+        fake_task_dao.update_status.assert_called_once_with(1, status)
+        fake_task_dao.delete.assert_called_once_with(2)
+        fake_task_dao.update_status_many.assert_called_once_with([(3, status)])
+        fake_task_dao.delete_many.assert_called_once_with([4])
+
+        assert len(task_dao) == 1
+
+        # Tarefas novas não tornam nenhuma entrada desatualizada
+        task_dao.insert(Task(0, "Nova", "", status))
+        task_dao.insert_many([Task(0, "Nova", "", status)])
+
+        assert len(task_dao) == 1
+
+        task_dao.insert(Task(5, "Com ID", "", status))
+
+        assert len(task_dao) == 0
+
+    def test_stale_read_discarded(self) -> None:
+
+        fake_task_dao = self._fake_task_dao()
+
+        task_dao = CachedTaskDAO(fake_task_dao)
+        load = fake_task_dao.get_by_id.side_effect
+
+        # Uma escrita ocorre enquanto a leitura da tarefa 1 está em andamento
+        def concurrent_write(task_id: int) -> Task:
+
+            task = load(task_id)
+
+            task_dao.update_status(task_id, TaskStatus(3, "Feita"))
+
+            return task
+
+        fake_task_dao.get_by_id.side_effect = concurrent_write
+
+        task_dao.get_by_id(1)
+
+        assert len(task_dao) == 0
+
+    def test_deferred_invalidation(self) -> None:
+
+        fake_task_dao = self._fake_task_dao()
+
+        task_dao = CachedTaskDAO(fake_task_dao)
+
+        with task_dao.deferred_invalidation():
+
+            with task_dao.deferred_invalidation():
+
+                task_dao.update_status(1, TaskStatus(3, "Feita"))
+
+            # Leitura da versão ainda não confirmada, como faria outra conexão
+            task_dao.get_by_id(1)
+
+            assert len(task_dao) == 1
+
+        # A tarefa escrita é descartada na saída do bloco mais externo
+        assert len(task_dao) == 0
+
+    def test_invalidated_after_commit(self, tmp_path) -> None:
+
+        task_service = ServiceFactory(str(tmp_path / "cache.db"), pool_size=2).task_service(task_cache_entries=100)
+        task_service.create_task("Tarefa", "", "Disponível")
+
+        task_dao = task_service._task_dao
+        update_status = task_dao.update_status
+
+        written = threading.Event()
+        read = threading.Event()
+
+        # A transação da escrita fica aberta, já com a tarefa descartada do cache, até a leitura pela outra conexão
+        def paused_update_status(task_id: int, status: TaskStatus) -> None:
+
+            update_status(task_id, status)
+
+            written.set()
+            read.wait(5)
+
+        task_dao.update_status = paused_update_status
+
+        writer = threading.Thread(target=task_service.update_task_status, args=(1, "Feita"))
+        writer.start()
+
+        assert written.wait(5)
+
+        assert task_service.get_task_by_id(1).status.name == "Disponível"
+
+        read.set()
+        writer.join()
+
+        assert task_service.get_task_by_id(1).status.name == "Feita"
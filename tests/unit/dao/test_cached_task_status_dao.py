@@ -0,0 +1,69 @@
+from unittest.mock import Mock
+
+
+from data_access_layer.dao.cached_task_status_dao import CachedTaskStatusDAO
+from entities.task_status import TaskStatus
+
+
+class TestCachedTaskStatusDAO:
+
+    def _fake_task_status_dao(self) -> Mock:
+
+        fake_task_status_dao = Mock()
+
+        fake_task_status_dao.list_all.return_value = (
+            TaskStatus(1, "Disponível"),
+            TaskStatus(2, "Fazendo"),
+            TaskStatus(3, "Feita"),
+        )
+
+        return fake_task_status_dao
+
+    def test_loads_once(self) -> None:
+
+        fake_task_status_dao = self._fake_task_status_dao()
+
+        task_status_dao = CachedTaskStatusDAO(fake_task_status_dao)
+
+        assert task_status_dao.get_by_name("Fazendo").id == 2
+        assert task_status_dao.get_by_name("Feito") is None
+        assert task_status_dao.get_by_id(3).name == "Feita"
+        assert task_status_dao.get_by_id(4) is None
+        assert len(task_status_dao.list_all()) == 3
+
+        # Todas as consultas são respondidas com uma única leitura do DAO decorado
+        fake_task_status_dao.list_all.assert_called_once()
+        fake_task_status_dao.get_by_name.assert_not_called()
+        fake_task_status_dao.get_by_id.assert_not_called()
+
+    def test_invalidate(self) -> None:
+
+        fake_task_status_dao = self._fake_task_status_dao()
+
+        task_status_dao = CachedTaskStatusDAO(fake_task_status_dao)
+
+        task_status_dao.list_all()
+
+        fake_task_status_dao.list_all.return_value = (
+            TaskStatus(1, "Disponível"),
+            TaskStatus(4, "Arquivada"),
+        )
+
+        assert task_status_dao.get_by_name("Arquivada") is None
+
+        task_status_dao.invalidate()
+
+        assert task_status_dao.get_by_name("Arquivada").id == 4
+
+        assert fake_task_status_dao.list_all.call_count == 2
+
+    def test_empty(self) -> None:
+
+        fake_task_status_dao = Mock()
+
+        fake_task_status_dao.list_all.return_value = None
+
+        task_status_dao = CachedTaskStatusDAO(fake_task_status_dao)
+
+        assert task_status_dao.list_all() is None
+        assert task_status_dao.get_by_name("Disponível") is None
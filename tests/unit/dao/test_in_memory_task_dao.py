@@ -0,0 +1,165 @@
+import pytest
+
+
+from data_access_layer.dao.in_memory_task_dao import InMemoryTaskDAO
+from data_access_layer.dao.in_memory_task_status_dao import InMemoryTaskStatusDAO
+from data_access_layer.dao.task_dao_impl import TaskDAOImpl
+from data_access_layer.database_api_adapters.in_memory_database import InMemoryDatabase
+from data_access_layer.database_api_adapters.sqlite_pooled_database_api_adapter import SQLitePooledDatabaseAPIAdapter
+from data_access_layer.migrations.migration_runner import MigrationRunner
+from entities.task import Task
+from entities.task_status import TaskStatus
+from service_layer.task_service import TaskService
+from service_layer.task_status_service import TaskStatusService
+
+
+AVAILABLE = TaskStatus(1, "Disponível")
+DOING = TaskStatus(2, "Fazendo")
+DONE = TaskStatus(3, "Feita")
+
+
+def _apply_operations(task_dao) -> None:
+
+    task_dao.insert_many([
+        Task(0, "Relatório mensal", "Enviar para a diretoria", AVAILABLE),
+        Task(0, "Reunião", "Discutir o relatório", DOING),
+        Task(0, "Compras", "", AVAILABLE),
+        Task(0, "Deploy", "Publicar a versão", DONE),
+    ])
+
+    task_dao.insert(Task(0, "Relatórios antigos", "Arquivar", AVAILABLE))
+
+    task_dao.update_status(3, DONE)
+    task_dao.update_status_many([(1, DOING), (100, DONE)])
+    task_dao.delete(4)
+    task_dao.delete_many([100])
+
+
+def _snapshot(task_dao) -> tuple:
+
+    def ids(tasks) -> list:
+
+        return None if tasks is None else [task.id for task in tasks]
+
+    return (
+        [(task.id, task.name, task.description, task.status.name) for task in task_dao.list_all()],
+        [task.id for task in task_dao.iter_all(batch_size=2)],
+        ids(task_dao.list_page(2, after_id=1)),
+        ids(task_dao.list_page(2, after_id=5)),
+        ids(task_dao.list_by_status(2)),
+        [(status.name, total) for status, total in task_dao.count_by_status()],
+        ids(task_dao.search('"relatorio"', 10)),
+        ids(task_dao.search('"relat"*', 10)),
+        ids(task_dao.search('"discutir" "relatorio"', 10)),
+        ids(task_dao.search('"inexistente"', 10)),
+        task_dao.get_by_id(4),
+        task_dao.get_by_id(2).name,
+        [task_dao.exists(task_id) for task_id in (1, 4)],
+        list(task_dao.fetch_columns(1).ids),
+    )
+
+
+class TestInMemoryTaskDAO:
+
+    def test_same_results_as_sqlite(self, tmp_path) -> None:
+
+        filename = str(tmp_path / "parity.db")
+
+        MigrationRunner(filename).migrate()
+
+        db_api_adapter = SQLitePooledDatabaseAPIAdapter(filename, 1)
+        db_api_adapter.connect()
+
+        sqlite_task_dao = TaskDAOImpl(db_api_adapter)
+        in_memory_task_dao = InMemoryTaskDAO(InMemoryDatabase())
+
+        _apply_operations(sqlite_task_dao)
+        _apply_operations(in_memory_task_dao)
+
+        assert _snapshot(in_memory_task_dao) == _snapshot(sqlite_task_dao)
+
+        db_api_adapter.close_connection()
+
+    def test_empty(self) -> None:
+
+        task_dao = InMemoryTaskDAO(InMemoryDatabase())
+
+        assert task_dao.list_all() is None
+        assert task_dao.list_page(10) is None
+        assert task_dao.list_by_status(1) is None
+        assert task_dao.search('"tarefa"*', 10) is None
+        assert list(task_dao.iter_all()) == []
+        assert len(task_dao.fetch_columns()) == 0
+
+        with pytest.raises(ValueError):
+
+            task_dao.insert(Task(0, "Tarefa", "", TaskStatus(9, "Desconhecido")))
+
+    def test_transaction(self) -> None:
+
+        database = InMemoryDatabase()
+        task_dao = InMemoryTaskDAO(database)
+
+        task_dao.insert(Task(0, "Primeira", "", AVAILABLE))
+
+        with pytest.raises(RuntimeError):
+
+            with database.transaction():
+
+                task_dao.insert(Task(0, "Segunda", "", AVAILABLE))
+                task_dao.update_status(1, DONE)
+                task_dao.delete(1)
+
+                # Ponto de salvamento: apenas o bloco interno é desfeito
+                with pytest.raises(ValueError):
+
+                    with database.transaction():
+
+                        task_dao.insert(Task(0, "Terceira", "", AVAILABLE))
+
+                        raise ValueError("falha interna")
+
+                assert [task.name for task in task_dao.list_all()] == ["Segunda"]
+
+                raise RuntimeError("falha")
+
+        task = task_dao.get_by_id(1)
+
+        assert (task.name, task.status.name) == ("Primeira", "Disponível")
+        assert task_dao.list_by_status(3) is None
+        assert [task.id for task in task_dao.search('"primeira"', 10)] == [1]
+
+        # Identificadores desfeitos são reutilizados, como em AUTOINCREMENT
+        task_dao.insert(Task(0, "Segunda", "", AVAILABLE))
+
+        assert [task.id for task in task_dao.list_all()] == [1, 2]
+
+    def test_status_dao(self) -> None:
+
+        task_status_dao = InMemoryTaskStatusDAO(InMemoryDatabase())
+
+        assert [status.name for status in task_status_dao.list_all()] == ["Disponível", "Fazendo", "Feita"]
+        assert task_status_dao.get_by_name("Fazendo").id == 2
+        assert task_status_dao.get_by_id(3).name == "Feita"
+        assert task_status_dao.get_by_name("Inexistente") is None
+
+        assert InMemoryTaskStatusDAO(InMemoryDatabase(())).list_all() is None
+
+    def test_services(self) -> None:
+
+        database = InMemoryDatabase()
+
+        task_service = TaskService(database, InMemoryTaskDAO(database), InMemoryTaskStatusDAO(database))
+        status_service = TaskStatusService(InMemoryTaskStatusDAO(database))
+
+        task_service.create_tasks([("Tarefa 1", "", "Disponível"), ("Tarefa 2", "", "Fazendo")])
+        task_service.update_task_status(1, "Feita")
+
+        # A transação do serviço é desfeita por completo
+        with pytest.raises(ValueError):
+
+            task_service.create_tasks([("Tarefa 3", "", "Disponível"), ("Tarefa 4", "", "Inexistente")])
+
+        assert task_service.count_tasks_by_status() == {"Disponível": 0, "Fazendo": 1, "Feita": 1}
+        assert [task.name for task in task_service.search_tasks("taref")] == ["Tarefa 1", "Tarefa 2"]
+        assert status_service.get_available_status_names() == ("Disponível", "Fazendo", "Feita")
@@ -2,6 +2,8 @@ from unittest.mock import Mock
 
 
 from data_access_layer.dao.task_dao_impl import TaskDAOImpl
+from data_access_layer.database_api_adapters.sqlite_pooled_database_api_adapter import SQLitePooledDatabaseAPIAdapter
+from data_access_layer.migrations.migration_runner import MigrationRunner
 from entities.task import Task
 from entities.task_status import TaskStatus
 
@@ -28,7 +30,8 @@ class TestTaskDAOImpl:
 
         task = Task(**data)
 
-        task_dao.insert(task)
+        # O ID gerado é o informado pelo adaptador
+        assert task_dao.insert(task) is fake_db_api_adapter.execute.return_value
         
         # Verifica se o método execute do adaptador de api foi chamado uma vez
         fake_db_api_adapter.execute.assert_called_once()
@@ -62,35 +65,17 @@ class TestTaskDAOImpl:
             Task(3, "ghi", "desc3", TaskStatus(2, "Fazendo")),
         ]
 
-        fake_db_api_adapter.fetch_all.return_value = [
-            {
-                "task_id": 1, 
-                "task_name": "abc", 
-                "task_description": "desc1", 
-                "status_id": 1, 
-                "status_name": "Disponível"
-            },
-            {
-                "task_id": 2, 
-                "task_name": "def", 
-                "task_description": "desc2", 
-                "status_id": 1, 
-                "status_name": "Disponível"
-            },
-            {
-                "task_id": 3, 
-                "task_name": "ghi", 
-                "task_description": "desc3", 
-                "status_id": 2, 
-                "status_name": "Fazendo"
-            },
+        fake_db_api_adapter.fetch_all_tuples.return_value = [
+            (1, "abc", "desc1", 1, "Disponível"),
+            (2, "def", "desc2", 1, "Disponível"),
+            (3, "ghi", "desc3", 2, "Fazendo"),
         ]
 
         tasks = task_dao.list_all()
 
-        fake_db_api_adapter.fetch_all.assert_called_once()
+        fake_db_api_adapter.fetch_all_tuples.assert_called_once()
 
-        args, _ = fake_db_api_adapter.fetch_all.call_args
+        args, _ = fake_db_api_adapter.fetch_all_tuples.call_args
 
         query_passed = args[0]
 
@@ -98,7 +83,7 @@ class TestTaskDAOImpl:
         SELECT
             t.id as task_id,
             t.name as task_name,
-            t.description as task_description,
+            COALESCE(t.description, '') as task_description,
             s.id as status_id,
             s.name as status_name
         FROM task as t
@@ -114,6 +99,9 @@ class TestTaskDAOImpl:
             assert task.description == expected_value.description
             assert task.status.id == expected_value.status.id
             assert task.status.name == expected_value.status.name
+
+        # Tarefas com o mesmo status compartilham o objeto TaskStatus
+        assert tasks[0].status is tasks[1].status
     
     def test_list_all_empty(self) -> None:
 
@@ -123,13 +111,13 @@ class TestTaskDAOImpl:
 
         expected_value = None
 
-        fake_db_api_adapter.fetch_all.return_value = None
+        fake_db_api_adapter.fetch_all_tuples.return_value = None
 
         tasks = task_dao.list_all()
 
-        fake_db_api_adapter.fetch_all.assert_called_once()
+        fake_db_api_adapter.fetch_all_tuples.assert_called_once()
 
-        args, _ = fake_db_api_adapter.fetch_all.call_args
+        args, _ = fake_db_api_adapter.fetch_all_tuples.call_args
 
         query_passed = args[0]
 
@@ -137,7 +125,7 @@ class TestTaskDAOImpl:
         SELECT
             t.id as task_id,
             t.name as task_name,
-            t.description as task_description,
+            COALESCE(t.description, '') as task_description,
             s.id as status_id,
             s.name as status_name
         FROM task as t
@@ -201,10 +189,358 @@ class TestTaskDAOImpl:
         assert parameters_passed[0] == status.id
         assert parameters_passed[1] == task_id
 
+    def test_get_by_id(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        task_id = 2
+
+        expected_value = Task(task_id, "def", "desc2", TaskStatus(2, "Fazendo"))
+
+        fake_db_api_adapter.fetch_one_tuple.return_value = (task_id, "def", "desc2", 2, "Fazendo")
+
+        task = task_dao.get_by_id(task_id)
 
+        fake_db_api_adapter.fetch_one_tuple.assert_called_once()
+
+        args, _ = fake_db_api_adapter.fetch_one_tuple.call_args
+
+        query_passed = args[0]
+        parameters_passed = args[1]
+
+        assert "WHERE t.id = ?" in query_passed
+
+        assert parameters_passed[0] == task_id
+
+        assert task.id == expected_value.id
+        assert task.name == expected_value.name
+        assert task.description == expected_value.description
+        assert task.status.id == expected_value.status.id
+        assert task.status.name == expected_value.status.name
+    
+    def test_get_by_id_empty(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
 
+        fake_db_api_adapter.fetch_one_tuple.return_value = None
+
+        task = task_dao.get_by_id(42)
+
+        fake_db_api_adapter.fetch_one_tuple.assert_called_once()
+        fake_db_api_adapter.fetch_all.assert_not_called()
+
+        assert task is None
+    
+    def test_exists(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        fake_db_api_adapter.fetch_one.return_value = {"found": 1}
+
+        assert task_dao.exists(1) is True
+
+        args, _ = fake_db_api_adapter.fetch_one.call_args
+
+        assert "WHERE id = ?" in args[0]
+        assert args[1] == (1,)
+
+        fake_db_api_adapter.fetch_one.return_value = None
+
+        assert task_dao.exists(2) is False
+
+    def test_insert_many(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        status = TaskStatus(1, "Disponível")
+
+        tasks = [
+            Task(0, "abc", "desc1", status),
+            Task(0, "def", "desc2", status),
+        ]
 
+        task_dao.insert_many(tasks)
 
+        fake_db_api_adapter.execute_many.assert_called_once()
+        fake_db_api_adapter.execute.assert_not_called()
 
+        args, _ = fake_db_api_adapter.execute_many.call_args
+
+        expected_query = """
+        INSERT INTO task(name, description, status_id) 
+        VALUES (?, ?, ?)
+        """
+
+        assert args[0] == expected_query
+
+        assert list(args[1]) == [("abc", "desc1", 1), ("def", "desc2", 1)]
+    
+    def test_delete_many(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        task_dao.delete_many([1, 2, 3])
+
+        fake_db_api_adapter.execute_many.assert_called_once()
+
+        args, _ = fake_db_api_adapter.execute_many.call_args
+
+        assert "DELETE FROM task" in args[0]
+
+        assert list(args[1]) == [(1,), (2,), (3,)]
+    
+    def test_update_status_many(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        doing = TaskStatus(2, "Fazendo")
+        done = TaskStatus(3, "Feita")
+
+        task_dao.update_status_many([(1, doing), (2, done)])
+
+        fake_db_api_adapter.execute_many.assert_called_once()
+
+        args, _ = fake_db_api_adapter.execute_many.call_args
+
+        assert "UPDATE task SET status_id = ?" in args[0]
+
+        assert list(args[1]) == [(2, 1), (3, 2)]
+
+    def test_iter_all(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        fake_db_api_adapter.iter_tuples.return_value = iter([
+            (1, "abc", "desc1", 1, "Disponível"),
+            (2, "def", "desc2", 2, "Fazendo"),
+        ])
+
+        tasks = task_dao.iter_all(batch_size=10)
+
+        # Nenhuma consulta é feita antes de o iterador ser consumido
+        fake_db_api_adapter.iter_tuples.assert_not_called()
+
+        tasks = list(tasks)
+
+        fake_db_api_adapter.iter_tuples.assert_called_once()
+        fake_db_api_adapter.fetch_all.assert_not_called()
+
+        args, _ = fake_db_api_adapter.iter_tuples.call_args
+
+        assert args[2] == 10
+
+        assert [task.id for task in tasks] == [1, 2]
+        assert [task.status.name for task in tasks] == ["Disponível", "Fazendo"]
+
+    def test_fetch_columns(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        fake_db_api_adapter.iter_tuples.return_value = iter([
+            (1, "abc", "desc1", 1, "Disponível"),
+            (2, "def", None, 2, "Fazendo"),
+        ])
+
+        table = task_dao.fetch_columns(batch_size=10)
+
+        args, _ = fake_db_api_adapter.iter_tuples.call_args
+
+        assert "WHERE" not in args[0]
+        assert "ORDER BY t.id" in args[0]
+        assert args[1:] == ((), 10)
+
+        assert list(table.ids) == [1, 2]
+        assert [table.name(0), table.description(1)] == ["abc", ""]
+
+        # Filtro por status
+        fake_db_api_adapter.iter_tuples.return_value = iter([])
+
+        table = task_dao.fetch_columns(2)
+
+        args, _ = fake_db_api_adapter.iter_tuples.call_args
+
+        assert "WHERE t.status_id = ?" in args[0]
+        assert args[1] == (2,)
+
+        assert len(table) == 0
+
+    def test_list_page(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        fake_db_api_adapter.fetch_all_tuples.return_value = [
+            (11, "abc", "desc1", 1, "Disponível"),
+        ]
+
+        tasks = task_dao.list_page(5, after_id=10)
+
+        args, _ = fake_db_api_adapter.fetch_all_tuples.call_args
+
+        query_passed = args[0]
+        parameters_passed = args[1]
+
+        assert "WHERE t.id > ?" in query_passed
+        assert "ORDER BY t.id" in query_passed
+        assert "LIMIT ?" in query_passed
+
+        assert parameters_passed == (10, 5)
+
+        assert [task.id for task in tasks] == [11]
+
+        # Primeira página
+        task_dao.list_page(5)
+
+        args, _ = fake_db_api_adapter.fetch_all_tuples.call_args
+
+        assert args[1] == (0, 5)
+    
+    def test_list_page_empty(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        fake_db_api_adapter.fetch_all_tuples.return_value = None
+
+        assert task_dao.list_page(5, after_id=100) is None
+
+    def test_list_by_status(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        fake_db_api_adapter.fetch_all_tuples.return_value = [
+            (3, "ghi", "desc3", 2, "Fazendo"),
+        ]
+
+        tasks = task_dao.list_by_status(2)
+
+        fake_db_api_adapter.fetch_all_tuples.assert_called_once()
+
+        args, _ = fake_db_api_adapter.fetch_all_tuples.call_args
+
+        assert "WHERE t.status_id = ?" in args[0]
+        assert args[1] == (2,)
+
+        assert [(task.id, task.status.id) for task in tasks] == [(3, 2)]
+
+        fake_db_api_adapter.fetch_all_tuples.return_value = None
+
+        assert task_dao.list_by_status(3) is None
+    
+    def test_search(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        fake_db_api_adapter.fetch_all_tuples.return_value = [
+            (7, "Relatório", "Escrever o relatório", 1, "Disponível"),
+        ]
+
+        tasks = task_dao.search("relatorio", 10)
+
+        args, _ = fake_db_api_adapter.fetch_all_tuples.call_args
+
+        assert "WHERE task_fts MATCH ?" in args[0]
+        assert "ORDER BY bm25(task_fts" in args[0]
+        assert args[1] == ("relatorio", 10)
+
+        assert [task.id for task in tasks] == [7]
+
+        fake_db_api_adapter.fetch_all_tuples.return_value = None
+
+        assert task_dao.search("inexistente", 10) is None
+
+    def test_search_index(self, tmp_path) -> None:
+
+        # O índice de busca é mantido pelos gatilhos criados pelas migrações
+        filename = str(tmp_path / "search.db")
+
+        MigrationRunner(filename).migrate()
+
+        db_api_adapter = SQLitePooledDatabaseAPIAdapter(filename, 1)
+        db_api_adapter.connect()
+
+        task_dao = TaskDAOImpl(db_api_adapter)
+        status = TaskStatus(1, "Disponível")
+
+        task_dao.insert_many([
+            Task(0, "Relatório mensal", "Enviar para a diretoria", status),
+            Task(0, "Reunião", "Discutir o relatório", status),
+            Task(0, "Compras", "Comprar café", status),
+        ])
+
+        # A busca ignora acentos e maiúsculas, e ocorrências no nome são mais relevantes
+        assert [task.id for task in task_dao.search("relatorio", 10)] == [1, 2]
+        assert [task.id for task in task_dao.search("relatorio", 1)] == [1]
+
+        db_api_adapter.execute("UPDATE task SET name = ? WHERE id = ?", ("Mercado", 3))
+        task_dao.delete(1)
+
+        assert [task.id for task in task_dao.search("relatorio", 10)] == [2]
+        assert task_dao.search("compras", 10) is None
+        assert [task.id for task in task_dao.search("mercado", 10)] == [3]
+
+        db_api_adapter.close_connection()
+
+    def test_null_description(self, tmp_path) -> None:
+
+        filename = str(tmp_path / "null.db")
+
+        MigrationRunner(filename).migrate()
+
+        db_api_adapter = SQLitePooledDatabaseAPIAdapter(filename, 1)
+        db_api_adapter.connect()
+
+        # O esquema aceita descrições nulas, que são lidas como texto vazio
+        db_api_adapter.execute("INSERT INTO task(name, description, status_id) VALUES (?, NULL, 1)", ("Tarefa",))
+
+        task_dao = TaskDAOImpl(db_api_adapter)
+
+        assert [task.description for task in task_dao.list_all()] == [""]
+        assert [task.description for task in task_dao.iter_all()] == [""]
+        assert [task.description for task in task_dao.list_page(10)] == [""]
+        assert [task.description for task in task_dao.list_by_status(1)] == [""]
+        assert [task.description for task in task_dao.search("tarefa", 10)] == [""]
+        assert task_dao.get_by_id(1).description == ""
+
+        db_api_adapter.close_connection()
+
+    def test_count_by_status(self) -> None:
+
+        fake_db_api_adapter = Mock()
+
+        task_dao = TaskDAOImpl(fake_db_api_adapter)
+
+        fake_db_api_adapter.fetch_all.return_value = [
+            {"status_id": 1, "status_name": "Disponível", "total": 4},
+            {"status_id": 2, "status_name": "Fazendo", "total": 0},
+        ]
+
+        counts = task_dao.count_by_status()
+
+        args, _ = fake_db_api_adapter.fetch_all.call_args
 
+        assert "GROUP BY" in args[0]
 
+        assert [(status.name, total) for status, total in counts] == [("Disponível", 4), ("Fazendo", 0)]
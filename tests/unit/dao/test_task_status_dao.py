@@ -155,5 +155,36 @@ class TestTaskStatusDAO:
 
         assert task_status == expected_value
 
+    def test_get_by_id(self) -> None:
 
+        fake_db_api_adapter = Mock()
+
+        task_status_dao = TaskStatusDAOImpl(fake_db_api_adapter)
+
+        fake_db_api_adapter.fetch_one.return_value = {
+            "id": 2,
+            "name": "Fazendo",
+        }
+
+        task_status = task_status_dao.get_by_id(2)
+
+        fake_db_api_adapter.fetch_one.assert_called_once()
+
+        args, _ = fake_db_api_adapter.fetch_one.call_args
+
+        expected_query = """
+        SELECT id, name
+        FROM task_status
+        WHERE id = ?
+        """
+
+        assert args[0] == expected_query
+
+        assert args[1][0] == 2
+
+        assert task_status.id == 2
+        assert task_status.name == "Fazendo"
+
+        fake_db_api_adapter.fetch_one.return_value = None
 
+        assert task_status_dao.get_by_id(9) is None
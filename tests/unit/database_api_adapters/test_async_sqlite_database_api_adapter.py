@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+
+from data_access_layer.database_api_adapters.async_sqlite_database_api_adapter import AsyncSQLiteDatabaseAPIAdapter
+
+
+class TestAsyncSQLiteDatabaseAPIAdapter:
+
+    async def _adapter(self, tmp_path) -> AsyncSQLiteDatabaseAPIAdapter:
+
+        adapter = AsyncSQLiteDatabaseAPIAdapter(str(tmp_path / "async.db"))
+
+        await adapter.connect()
+
+        await adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+
+        return adapter
+
+    def test_not_connected(self, tmp_path) -> None:
+
+        adapter = AsyncSQLiteDatabaseAPIAdapter(str(tmp_path / "async.db"))
+
+        with pytest.raises(RuntimeError):
+
+            asyncio.run(adapter.fetch_one("SELECT 1"))
+
+    def test_concurrent_callers(self, tmp_path) -> None:
+
+        async def scenario():
+
+            adapter = await self._adapter(tmp_path)
+
+            await asyncio.gather(*[
+                adapter.execute("INSERT INTO item(name) VALUES (?)", (str(i),))
+                for i in range(200)
+            ])
+
+            total = await adapter.fetch_one("SELECT COUNT(*) as total FROM item")
+
+            await adapter.close_connection()
+
+            return total["total"]
+
+        assert asyncio.run(scenario()) == 200
+
+    def test_transaction(self, tmp_path) -> None:
+
+        async def scenario():
+
+            adapter = await self._adapter(tmp_path)
+
+            count_query = "SELECT COUNT(*) as total FROM item"
+
+            events = []
+
+            async def other_coroutine():
+
+                # Aguarda o fim da transação, em vez de ser executado dentro dela
+                await adapter.execute("INSERT INTO item(name) VALUES (?)", ("outra",))
+
+                events.append("outra")
+
+            with pytest.raises(RuntimeError):
+
+                async with adapter.transaction():
+
+                    await adapter.execute("INSERT INTO item(name) VALUES (?)", ("a",))
+
+                    other = asyncio.create_task(other_coroutine())
+
+                    await asyncio.sleep(0.01)
+
+                    events.append("transação")
+
+                    raise RuntimeError()
+
+            await other
+
+            names = [row["name"] for row in await adapter.fetch_all("SELECT name FROM item")]
+
+            async with adapter.transaction():
+
+                await adapter.execute_many("INSERT INTO item(name) VALUES (?)", [("b",), ("c",)])
+
+            total = (await adapter.fetch_one(count_query))["total"]
+
+            await adapter.close_connection()
+
+            return events, names, total
+
+        events, names, total = asyncio.run(scenario())
+
+        assert events == ["transação", "outra"]
+        assert names == ["outra"]
+        assert total == 3
@@ -0,0 +1,165 @@
+import logging
+
+import pytest
+
+
+from data_access_layer.database_api_adapters.query_instrumentation import (
+    QueryEvent, QueryListener, QueryStatistics, SlowQueryLog, parameters_sequence_shape, parameters_shape
+)
+from data_access_layer.database_api_adapters.sqlite_database_api_adapter import SQLiteDatabaseAPIAdapter
+from data_access_layer.database_api_adapters.sqlite_pooled_database_api_adapter import SQLitePooledDatabaseAPIAdapter
+
+
+class RecordingListener(QueryListener):
+
+    def __init__(self) -> None:
+
+        self.events = []
+
+    def on_query(self, event: QueryEvent) -> None:
+
+        self.events.append(event)
+
+
+class TestQueryInstrumentation:
+
+    def test_parameters_shape(self) -> None:
+
+        assert parameters_shape(()) == "()"
+        assert parameters_shape((1, "a", None)) == "(int, str, NoneType)"
+        assert parameters_sequence_shape([(1, "a"), (2, "b")]) == "2 x (int, str)"
+        assert parameters_sequence_shape([]) == "0 x ()"
+        assert parameters_sequence_shape(iter([(1,)])) == "? x ?"
+
+    def test_adapter_events(self) -> None:
+
+        adapter = SQLiteDatabaseAPIAdapter(":memory:")
+        adapter.connect()
+
+        listener = RecordingListener()
+
+        adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+
+        adapter.add_listener(listener)
+
+        try:
+
+            adapter.execute("INSERT INTO item(name) VALUES (?)", ("a",))
+            adapter.execute_many("INSERT INTO item(name) VALUES (?)", [("b",), ("c",)])
+            adapter.fetch_all("SELECT * FROM item")
+            adapter.fetch_one("SELECT * FROM item WHERE id = ?", (10,))
+            adapter.fetch_all_tuples("SELECT * FROM item")
+            adapter.fetch_one_tuple("SELECT * FROM item WHERE id = ?", (1,))
+
+        finally:
+
+            adapter.remove_listener(listener)
+
+            adapter.close_connection()
+
+        assert [(event.operation, event.parameters_shape, event.row_count) for event in listener.events] == [
+            ("execute", "(str)", 1),
+            ("execute_many", "2 x (str)", 2),
+            ("commit", "()", None),
+            ("fetch_all", "()", 3),
+            ("fetch_one", "(int)", 0),
+            ("fetch_all_tuples", "()", 3),
+            ("fetch_one_tuple", "(int)", 1),
+        ]
+
+        # Apenas os comandos que confirmaram uma transação informam a duração da confirmação
+        assert listener.events[0].commit_duration is not None
+        assert listener.events[1].commit_duration is None
+        assert listener.events[2].commit_duration is not None
+        assert all(event.duration >= 0 for event in listener.events)
+
+    def test_pooled_adapter_events(self, tmp_path) -> None:
+
+        adapter = SQLitePooledDatabaseAPIAdapter(str(tmp_path / "instrumented.db"), 1)
+        adapter.connect()
+
+        adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+
+        listener = RecordingListener()
+        adapter.add_listener(listener)
+
+        with adapter.transaction():
+
+            adapter.execute("INSERT INTO item(name) VALUES (?)", ("a",))
+            adapter.fetch_one_tuple("SELECT COUNT(*) FROM item")
+
+        adapter.remove_listener(listener)
+
+        adapter.fetch_all_tuples("SELECT * FROM item")
+
+        assert [event.operation for event in listener.events] == ["execute", "fetch_one_tuple", "commit"]
+        assert listener.events[0].commit_duration is None
+
+        adapter.close_connection()
+
+    def test_failing_listener(self, caplog) -> None:
+
+        class FailingListener(QueryListener):
+
+            def on_query(self, event: QueryEvent) -> None:
+
+                raise RuntimeError("falha")
+
+        adapter = SQLiteDatabaseAPIAdapter(":memory:")
+        adapter.connect()
+
+        listener = FailingListener()
+        adapter.add_listener(listener)
+
+        try:
+
+            # O comando é concluído mesmo que o ouvinte falhe
+            assert adapter.fetch_one_tuple("SELECT 1") == (1,)
+
+        finally:
+
+            adapter.remove_listener(listener)
+
+            adapter.close_connection()
+
+        assert "Falha no ouvinte" in caplog.text
+
+    def test_query_statistics(self) -> None:
+
+        statistics = QueryStatistics(max_samples=100)
+
+        for duration in range(1, 101):
+
+            statistics.on_query(QueryEvent("fetch_one", "SELECT *\n  FROM item WHERE id = ?", "(int)", duration / 1000, 1, None))
+
+        statistics.on_query(QueryEvent("execute", "DELETE FROM item", "()", 0.5, 3, 0.001))
+
+        report = statistics.report()
+
+        assert [entry["query"] for entry in report] == ["SELECT * FROM item WHERE id = ?", "DELETE FROM item"]
+        assert report[0]["count"] == 100
+        assert report[0]["p50_ms"] == pytest.approx(50.5)
+        assert report[0]["p95_ms"] == pytest.approx(95.05)
+        assert report[0]["p99_ms"] == pytest.approx(99.01)
+        assert report[1]["total_ms"] == pytest.approx(500)
+
+        statistics.reset()
+
+        assert statistics.report() == []
+
+    def test_slow_query_log(self, caplog) -> None:
+
+        slow_query_log = SlowQueryLog(threshold_ms=10, max_entries=2)
+
+        with caplog.at_level(logging.WARNING):
+
+            for duration in (0.001, 0.02, 0.03, 0.04):
+
+                slow_query_log.on_query(QueryEvent("fetch_all", "SELECT * FROM item", "()", duration, 0, None))
+
+        assert [event.duration for event in slow_query_log.entries] == [0.03, 0.04]
+        assert caplog.text.count("Comando lento") == 3
+
+        with pytest.raises(ValueError):
+
+            SlowQueryLog(threshold_ms=-1)
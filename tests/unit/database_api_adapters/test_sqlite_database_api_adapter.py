@@ -1,3 +1,5 @@
+import sqlite3
+
 import pytest
 
 
@@ -31,3 +33,218 @@ class TestSQLiteDatabaseAPIAdapter:
 
             SQLiteDatabaseAPIAdapter([1, 2, 3])
 
+    def test_lazy_connect(self, tmp_path) -> None:
+
+        filename = tmp_path / "lazy.db"
+        connections = []
+
+        adapter = SQLiteDatabaseAPIAdapter(str(filename), setup=connections.append)
+
+        # A conexão só é aberta no primeiro comando, e a preparação é executada uma única vez
+        adapter.connect()
+        adapter.connect()
+
+        assert not filename.exists()
+        assert connections == []
+
+        assert adapter.fetch_one_tuple("SELECT 1") == (1,)
+        assert adapter.fetch_one_tuple("SELECT 2") == (2,)
+
+        assert connections == [adapter.connection]
+        assert filename.exists()
+
+        adapter.close_connection()
+
+    def test_execute_many(self) -> None:
+
+        adapter = SQLiteDatabaseAPIAdapter(":memory:")
+        adapter.connect()
+
+        adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+
+        adapter.execute_many(
+            "INSERT INTO item(name) VALUES (?)", [("a",), ("b",), ("c",)]
+        )
+
+        assert adapter.fetch_one("SELECT COUNT(*) as total FROM item")["total"] == 3
+
+        # Um erro no meio do lote desfaz o lote inteiro
+        with pytest.raises(sqlite3.IntegrityError):
+
+            adapter.execute_many(
+                "INSERT INTO item(name) VALUES (?)", [("d",), (None,)]
+            )
+
+        assert adapter.fetch_one("SELECT COUNT(*) as total FROM item")["total"] == 3
+
+        adapter.close_connection()
+
+    def test_transaction(self) -> None:
+
+        adapter = SQLiteDatabaseAPIAdapter(":memory:")
+        adapter.connect()
+
+        adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+
+        count_query = "SELECT COUNT(*) as total FROM item"
+
+        # Confirmação na saída do bloco
+        with adapter.transaction():
+
+            assert adapter.execute("INSERT INTO item(name) VALUES (?)", ("a",)) == 1
+            assert adapter.execute("INSERT INTO item(name) VALUES (?)", ("b",)) == 2
+
+        assert adapter.fetch_one(count_query)["total"] == 2
+
+        # Exceção desfaz o bloco inteiro
+        with pytest.raises(RuntimeError):
+
+            with adapter.transaction():
+
+                adapter.execute("INSERT INTO item(name) VALUES (?)", ("c",))
+
+                raise RuntimeError()
+
+        assert adapter.fetch_one(count_query)["total"] == 2
+
+        # Bloco aninhado desfaz apenas a si mesmo
+        with adapter.transaction():
+
+            adapter.execute("INSERT INTO item(name) VALUES (?)", ("d",))
+
+            with pytest.raises(RuntimeError):
+
+                with adapter.transaction():
+
+                    adapter.execute("INSERT INTO item(name) VALUES (?)", ("e",))
+
+                    raise RuntimeError()
+
+        assert adapter.fetch_one(count_query)["total"] == 3
+
+        assert adapter.fetch_one("SELECT name FROM item WHERE name = ?", ("e",)) is None
+
+        adapter.close_connection()
+
+    def test_failed_commit(self) -> None:
+
+        adapter = SQLiteDatabaseAPIAdapter(":memory:")
+        adapter.connect()
+
+        adapter.execute("PRAGMA foreign_keys = ON")
+        adapter.execute("CREATE TABLE parent(id INTEGER PRIMARY KEY)")
+        adapter.execute(
+            "CREATE TABLE child(id INTEGER PRIMARY KEY, "
+            "parent_id INTEGER REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED)"
+        )
+
+        # A chave estrangeira adiada só é verificada no COMMIT, que falha
+        with pytest.raises(Exception):
+
+            with adapter.transaction():
+
+                adapter.execute("INSERT INTO child(parent_id) VALUES (?)", (99,))
+
+        # A transação foi desfeita e o próximo comando é confirmado sozinho
+        assert not adapter.connection.in_transaction
+
+        adapter.execute("INSERT INTO parent(id) VALUES (?)", (1,))
+
+        assert adapter.fetch_one("SELECT COUNT(*) as total FROM child")["total"] == 0
+        assert adapter.fetch_one("SELECT COUNT(*) as total FROM parent")["total"] == 1
+
+        adapter.close_connection()
+
+    def test_reconstruction_keeps_transaction(self) -> None:
+
+        adapter = SQLiteDatabaseAPIAdapter(":memory:")
+        adapter.connect()
+
+        adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+
+        # Construir a instância compartilhada durante a transação não a confirma antes do fim do bloco
+        with pytest.raises(RuntimeError):
+
+            with adapter.transaction():
+
+                assert SQLiteDatabaseAPIAdapter(":memory:") is adapter
+
+                adapter.execute("INSERT INTO item(name) VALUES (?)", ("a",))
+
+                raise RuntimeError()
+
+        assert adapter.fetch_one("SELECT COUNT(*) as total FROM item")["total"] == 0
+
+        adapter.close_connection()
+
+    def test_iter_rows(self) -> None:
+
+        adapter = SQLiteDatabaseAPIAdapter(":memory:")
+        adapter.connect()
+
+        adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+
+        adapter.execute_many(
+            "INSERT INTO item(name) VALUES (?)", [(str(i),) for i in range(25)]
+        )
+
+        rows = list(adapter.iter_rows("SELECT id, name FROM item ORDER BY id", (), 10))
+
+        assert len(rows) == 25
+        assert rows[0] == {"id": 1, "name": "0"}
+        assert rows[-1] == {"id": 25, "name": "24"}
+
+        assert list(adapter.iter_rows("SELECT id FROM item WHERE id < 0")) == []
+
+        with pytest.raises(ValueError):
+
+            list(adapter.iter_rows("SELECT id FROM item", (), 0))
+
+        adapter.close_connection()
+
+    def test_profile(self, tmp_path) -> None:
+
+        with pytest.raises(ValueError):
+
+            SQLiteDatabaseAPIAdapter("database.db", "fast")
+
+        adapter = SQLiteDatabaseAPIAdapter(str(tmp_path / "profile.db"), "bulk-load")
+        adapter.connect()
+
+        assert adapter.fetch_one("PRAGMA journal_mode")["journal_mode"] == "wal"
+        assert adapter.fetch_one("PRAGMA synchronous")["synchronous"] == 0
+        assert adapter.fetch_one("PRAGMA temp_store")["temp_store"] == 2
+
+        # Trocar o perfil da instância compartilhada reaplica os PRAGMAs na conexão aberta
+        SQLiteDatabaseAPIAdapter(str(tmp_path / "profile.db"), "durable").connect()
+
+        assert adapter.fetch_one("PRAGMA synchronous")["synchronous"] == 2
+
+        adapter.close_connection()
+
+    def test_tuples(self) -> None:
+
+        with pytest.raises(ValueError):
+
+            SQLiteDatabaseAPIAdapter(":memory:", statement_cache_size=-1)
+
+        adapter = SQLiteDatabaseAPIAdapter(":memory:", statement_cache_size=16)
+        adapter.connect()
+
+        adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+
+        adapter.execute_many(
+            "INSERT INTO item(name) VALUES (?)", [("a",), ("b",), ("c",)]
+        )
+
+        query = "SELECT id, name FROM item WHERE id >= ? ORDER BY id"
+
+        assert adapter.fetch_all_tuples(query, (2,)) == [(2, "b"), (3, "c")]
+        assert adapter.fetch_all_tuples(query, (4,)) is None
+
+        assert list(adapter.iter_tuples(query, (1,), 2)) == [(1, "a"), (2, "b"), (3, "c")]
+
+        assert adapter.fetch_one_tuple(query, (3,)) == (3, "c")
+        assert adapter.fetch_one_tuple(query, (4,)) is None
+
+        adapter.close_connection()
@@ -0,0 +1,63 @@
+import pytest
+
+
+from data_access_layer.database_api_adapters.sqlite_performance_profile import PERFORMANCE_PROFILES, SQLitePerformanceProfile
+
+
+class TestSQLitePerformanceProfile:
+
+    def test_arguments(self) -> None:
+
+        SQLitePerformanceProfile(journal_mode="wal", synchronous="normal", temp_store="memory")
+
+        with pytest.raises(ValueError):
+
+            SQLitePerformanceProfile(journal_mode="WALL")
+
+        with pytest.raises(ValueError):
+
+            SQLitePerformanceProfile(synchronous=1)
+
+        with pytest.raises(ValueError):
+
+            SQLitePerformanceProfile(temp_store="RAM")
+
+        with pytest.raises(ValueError):
+
+            SQLitePerformanceProfile(cache_size="64MB")
+
+        with pytest.raises(ValueError):
+
+            SQLitePerformanceProfile(mmap_size=-1)
+
+        with pytest.raises(ValueError):
+
+            SQLitePerformanceProfile(busy_timeout=-1)
+
+    def test_pragmas(self) -> None:
+
+        profile = SQLitePerformanceProfile("WAL", "NORMAL", -64000, 1024, "MEMORY", 3000)
+
+        assert profile.pragmas() == (
+            "PRAGMA busy_timeout = 3000",
+            "PRAGMA journal_mode = WAL",
+            "PRAGMA synchronous = NORMAL",
+            "PRAGMA cache_size = -64000",
+            "PRAGMA mmap_size = 1024",
+            "PRAGMA temp_store = MEMORY",
+        )
+
+    def test_resolve(self) -> None:
+
+        profile = SQLitePerformanceProfile()
+
+        assert SQLitePerformanceProfile.resolve(profile) is profile
+        assert SQLitePerformanceProfile.resolve(None) is None
+
+        for name in ("durable", "balanced", "bulk-load"):
+
+            assert SQLitePerformanceProfile.resolve(name) is PERFORMANCE_PROFILES[name]
+
+        with pytest.raises(ValueError):
+
+            SQLitePerformanceProfile.resolve("fast")
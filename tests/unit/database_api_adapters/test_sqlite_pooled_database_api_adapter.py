@@ -0,0 +1,159 @@
+import threading
+
+import pytest
+
+
+from data_access_layer.database_api_adapters.sqlite_pooled_database_api_adapter import SQLitePooledDatabaseAPIAdapter
+
+
+class TestSQLitePooledDatabaseAPIAdapter:
+
+    def _adapter(self, tmp_path, pool_size: int = 2, **kwargs) -> SQLitePooledDatabaseAPIAdapter:
+
+        adapter = SQLitePooledDatabaseAPIAdapter(str(tmp_path / "pool.db"), pool_size, **kwargs)
+        adapter.connect()
+
+        adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+
+        return adapter
+
+    def test_arguments(self) -> None:
+
+        with pytest.raises(ValueError):
+
+            SQLitePooledDatabaseAPIAdapter("")
+
+        # Cada conexão a ':memory:' seria um banco diferente
+        with pytest.raises(ValueError):
+
+            SQLitePooledDatabaseAPIAdapter(":memory:")
+
+        with pytest.raises(ValueError):
+
+            SQLitePooledDatabaseAPIAdapter("database.db", 0)
+
+        assert SQLitePooledDatabaseAPIAdapter("database.db", 3).pool_size == 3
+
+    def test_acquire_release(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path, pool_size=1, acquire_timeout=0.05)
+
+        connection = adapter.acquire()
+
+        # Chamadas aninhadas na mesma thread recebem a mesma conexão
+        assert adapter.acquire() is connection
+
+        adapter.release(connection)
+
+        # Outra thread espera pela única conexão do pool
+        errors = []
+
+        def acquire_in_thread():
+
+            try:
+
+                adapter.acquire()
+
+            except TimeoutError as error:
+
+                errors.append(error)
+
+        thread = threading.Thread(target=acquire_in_thread)
+        thread.start()
+        thread.join()
+
+        assert len(errors) == 1
+
+        adapter.release(connection)
+
+        assert adapter.fetch_one("PRAGMA journal_mode")["journal_mode"] == "wal"
+
+        adapter.close_connection()
+
+    def test_concurrent_writes(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path, pool_size=4)
+
+        def insert_items(prefix: str):
+
+            for i in range(50):
+
+                adapter.execute("INSERT INTO item(name) VALUES (?)", (f"{prefix}{i}",))
+
+        threads = [threading.Thread(target=insert_items, args=(str(n),)) for n in range(8)]
+
+        for thread in threads:
+
+            thread.start()
+
+        for thread in threads:
+
+            thread.join()
+
+        assert adapter.fetch_one("SELECT COUNT(*) as total FROM item")["total"] == 400
+
+        adapter.close_connection()
+
+    def test_transaction(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path)
+
+        count_query = "SELECT COUNT(*) as total FROM item"
+
+        with pytest.raises(RuntimeError):
+
+            with adapter.transaction():
+
+                adapter.execute("INSERT INTO item(name) VALUES (?)", ("a",))
+
+                raise RuntimeError()
+
+        assert adapter.fetch_one(count_query)["total"] == 0
+
+        with adapter.transaction():
+
+            adapter.execute_many("INSERT INTO item(name) VALUES (?)", [("b",), ("c",)])
+
+            with pytest.raises(RuntimeError):
+
+                with adapter.transaction():
+
+                    adapter.execute("INSERT INTO item(name) VALUES (?)", ("d",))
+
+                    raise RuntimeError()
+
+        assert adapter.fetch_one(count_query)["total"] == 2
+
+        assert [row["name"] for row in adapter.iter_rows("SELECT name FROM item ORDER BY id")] == ["b", "c"]
+
+        assert adapter.fetch_all_tuples("SELECT name FROM item ORDER BY id") == [("b",), ("c",)]
+        assert list(adapter.iter_tuples("SELECT name FROM item ORDER BY id", (), 1)) == [("b",), ("c",)]
+        assert adapter.fetch_one_tuple("SELECT name FROM item WHERE name = ?", ("c",)) == ("c",)
+
+        adapter.close_connection()
+
+    def test_reconnect_with_connection_in_use(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path, 1)
+
+        adapter.execute_many("INSERT INTO item(name) VALUES (?)", [("a",), ("b",)])
+
+        # Iterador ainda aberto quando o pool é fechado e reaberto
+        rows = adapter.iter_tuples("SELECT name FROM item ORDER BY id", (), 1)
+
+        assert next(rows) == ("a",)
+
+        adapter.close_connection()
+        adapter.connect()
+
+        # Outra thread abre uma conexão do novo pool e a devolve
+        thread = threading.Thread(target=adapter.fetch_all, args=("SELECT name FROM item",))
+        thread.start()
+        thread.join(5)
+
+        # A conexão antiga é fechada na devolução, em vez de ocupar o lugar da nova no pool
+        assert list(rows) == [("b",)]
+
+        assert adapter.fetch_one_tuple("SELECT COUNT(*) FROM item") == (2,)
+
+        adapter.close_connection()
@@ -230,4 +230,31 @@ class TestTask:
         }
 
         task = Task(**data)
-        assert task.status == status
\ No newline at end of file
+        assert task.status == status
+    
+    def test_from_row(self):
+
+        status = TaskStatus(1, "Disponível")
+
+        task = Task._from_row(7, "Atividade", "Descrição", status)
+
+        assert isinstance(task, Task)
+        assert task.id == 7
+        assert task.name == "Atividade"
+        assert task.description == "Descrição"
+        assert task.status is status
+
+        # Os setters continuam validando após a criação
+        with pytest.raises(ValueError):
+
+            task.set_name("")
+    
+    def test_slots(self):
+
+        task = Task(1, "Atividade", "Descrição", TaskStatus(1, "Disponível"))
+
+        assert not hasattr(task, "__dict__")
+
+        with pytest.raises(AttributeError):
+
+            task.other = 1
@@ -90,4 +90,39 @@ class TestTaskStatus:
 
         task_status = TaskStatus(**data)
 
-        assert task_status.name == "Disponível"
\ No newline at end of file
+        assert task_status.name == "Disponível"
+    
+    def test_from_row(self):
+
+        task_status = TaskStatus._from_row(2, "Fazendo")
+
+        assert isinstance(task_status, TaskStatus)
+        assert task_status.id == 2
+        assert task_status.name == "Fazendo"
+    
+    def test_slots(self):
+
+        task_status = TaskStatus(1, "Disponível")
+
+        assert not hasattr(task_status, "__dict__")
+    
+    def test_shared(self):
+
+        task_status = TaskStatus.shared(1, "Disponível")
+
+        assert isinstance(task_status, TaskStatus)
+        assert task_status.id == 1
+        assert task_status.name == "Disponível"
+
+        # Mesmos dados, mesma instância
+        assert TaskStatus.shared(1, "Disponível") is task_status
+        assert TaskStatus.shared(2, "Fazendo") is not task_status
+
+        # A instância compartilhada não pode ser alterada
+        with pytest.raises(AttributeError):
+
+            task_status.set_name("Feita")
+
+        with pytest.raises(AttributeError):
+
+            task_status.set_id(3)
@@ -0,0 +1,130 @@
+from array import array
+
+import pytest
+
+
+from entities.task_table import TaskTable
+
+
+ROWS = [
+    (1, "Café", "Comprar café", 1, "Disponível"),
+    (2, "Relatório", None, 2, "Fazendo"),
+    (3, "Reunião", "Preparar a pauta", 1, "Disponível"),
+    (4, "Deploy", "", 3, "Feita"),
+    (5, "Testes", "Escrever testes", 2, "Fazendo"),
+]
+
+
+class TestTaskTable:
+
+    def test_from_rows(self) -> None:
+
+        table = TaskTable._from_rows(iter(ROWS))
+
+        assert len(table) == 5
+        assert list(table.ids) == [1, 2, 3, 4, 5]
+        assert list(table.status_ids) == [1, 2, 1, 3, 2]
+        assert list(table.iter_names()) == ["Café", "Relatório", "Reunião", "Deploy", "Testes"]
+
+        # Descrições ausentes são lidas como texto vazio
+        assert table.description(1) == ""
+        assert table.description(-1) == "Escrever testes"
+
+        # Os status são compartilhados entre as linhas
+        assert table.status(0) is table.status(2)
+
+        # As colunas não podem ser alteradas pelo chamador
+        with pytest.raises(TypeError):
+
+            table.ids[0] = 10
+
+        with pytest.raises(IndexError):
+
+            table.name(5)
+
+    def test_getitem(self) -> None:
+
+        table = TaskTable._from_rows(ROWS)
+
+        task = table[1]
+
+        assert (task.id, task.name, task.description, task.status.name) == (2, "Relatório", "", "Fazendo")
+
+        # Fatia contígua
+        window = table[1:4]
+
+        assert list(window.ids) == [2, 3, 4]
+        assert [window.name(i) for i in range(len(window))] == ["Relatório", "Reunião", "Deploy"]
+        assert window.description(1) == "Preparar a pauta"
+
+        # Fatia com passo e fatia vazia
+        assert list(table[::2].iter_names()) == ["Café", "Reunião", "Testes"]
+        assert len(table[4:2]) == 0
+
+        assert [task.id for task in table[3:].to_tasks()] == [4, 5]
+
+    def test_take(self) -> None:
+
+        table = TaskTable._from_rows(ROWS)
+
+        taken = table.take([4, 0, 2])
+
+        assert list(taken.ids) == [5, 1, 3]
+        assert list(taken.iter_names()) == ["Testes", "Café", "Reunião"]
+        assert taken.description(1) == "Comprar café"
+
+        # Posições negativas contam a partir do fim, como em table[-1]
+        assert table.take([-1]).name(0) == "Testes"
+        assert list(table.take(range(-2, 0)).ids) == [4, 5]
+
+        with pytest.raises(IndexError):
+
+            table.take([5])
+
+        with pytest.raises(IndexError):
+
+            table.take([-6])
+
+        assert len(table.take([])) == 0
+
+    def test_filter(self) -> None:
+
+        table = TaskTable._from_rows(ROWS)
+
+        doing = table.where_status(2)
+
+        assert list(doing.ids) == [2, 5]
+        assert doing.description(1) == "Escrever testes"
+
+        assert list(table.where_status(1, 3).ids) == [1, 3, 4]
+
+        long_names = table.filter([len(name) > 6 for name in table.iter_names()])
+
+        assert list(long_names.iter_names()) == ["Relatório", "Reunião"]
+
+        with pytest.raises(ValueError):
+
+            table.filter([True])
+
+    def test_count_by_status(self) -> None:
+
+        table = TaskTable._from_rows(ROWS)
+
+        assert [(status.name, total) for status, total in table.count_by_status()] == [
+            ("Disponível", 2), ("Fazendo", 2), ("Feita", 1)
+        ]
+
+        assert TaskTable._from_rows([]).count_by_status() == tuple()
+
+    def test_memory(self) -> None:
+
+        rows = [(task_id, f"Tarefa {task_id:06d}", "", 1, "Disponível") for task_id in range(1, 10_001)]
+
+        table = TaskTable._from_rows(rows)
+
+        # 8 bytes de ID, 8 de status, 16 de deslocamentos e 13 de nome por tarefa
+        assert table.memory_bytes == 10_000 * (8 + 8 + 16 + 13) + 8
+
+        with pytest.raises(ValueError):
+
+            TaskTable(array("q", [1]), array("q"), b"", array("q", [0]), {})
@@ -0,0 +1,190 @@
+import sqlite3
+
+import pytest
+
+
+from data_access_layer.migrations.migration_runner import MigrationRunner, _split_statements
+
+
+class TestMigrationRunner:
+
+    def _directory(self, tmp_path, migrations: dict) -> str:
+
+        directory = tmp_path / "database"
+        (directory / "migrations").mkdir(parents=True)
+
+        (directory / "init.sql").write_text("CREATE TABLE task(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL);\n")
+
+        for filename, script in migrations.items():
+
+            (directory / "migrations" / filename).write_text(script)
+
+        return str(directory)
+
+    def _tables(self, filename: str) -> set:
+
+        connection = sqlite3.connect(filename)
+
+        try:
+
+            return {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+
+        finally:
+
+            connection.close()
+
+    def test_split_statements(self) -> None:
+
+        script = """
+        -- Comentário
+        CREATE TABLE a(id INTEGER);
+        CREATE TRIGGER a_insert AFTER INSERT ON a BEGIN
+            INSERT INTO a VALUES (new.id + 1);
+        END;
+        """
+
+        statements = _split_statements(script)
+
+        assert len(statements) == 2
+        assert statements[1].startswith("CREATE TRIGGER")
+        assert statements[1].endswith("END;")
+
+    def test_project_migrations(self, tmp_path) -> None:
+
+        filename = str(tmp_path / "schema.db")
+        runner = MigrationRunner(filename)
+
+        applied = runner.migrate()
+
+        assert [migration.version for migration in applied] == [migration.version for migration in runner.available_migrations()]
+        assert {"task", "task_status", "task_fts", "idx_task_status_id"} <= self._tables(filename)
+
+        # Uma segunda execução não aplica nada
+        assert runner.migrate() == ()
+        assert runner.pending_migrations() == ()
+
+    def test_ordered_and_recorded(self, tmp_path) -> None:
+
+        directory = self._directory(tmp_path, {
+            "0002_add_index.sql": "CREATE INDEX idx_task_name ON task(name);\n",
+            "0001_add_column.sql": "ALTER TABLE task ADD COLUMN description VARCHAR;\n",
+            "notes.txt": "ignorado",
+        })
+
+        filename = str(tmp_path / "ordered.db")
+        runner = MigrationRunner(filename, directory)
+
+        assert runner.current_version() is None
+        assert [migration.name for migration in runner.migrate()] == ["init", "add_column", "add_index"]
+        assert runner.current_version() == 2
+
+    def test_failed_migration_rolled_back(self, tmp_path) -> None:
+
+        directory = self._directory(tmp_path, {
+            "0001_partial.sql": "CREATE TABLE extra(id INTEGER);\nINSERT INTO missing VALUES (1);\n",
+        })
+
+        filename = str(tmp_path / "failed.db")
+        runner = MigrationRunner(filename, directory)
+
+        with pytest.raises(sqlite3.OperationalError):
+
+            runner.migrate()
+
+        # A versão 0 foi confirmada; a migração 1 foi desfeita por inteiro
+        assert runner.current_version() == 0
+        assert "extra" not in self._tables(filename)
+        assert [migration.version for migration in runner.pending_migrations()] == [1]
+
+    def test_legacy_database(self, tmp_path) -> None:
+
+        directory = self._directory(tmp_path, {
+            "0001_add_index.sql": "CREATE INDEX idx_task_name ON task(name);\n",
+        })
+
+        # Banco criado pelo script inicial antes do controle de versões
+        filename = str(tmp_path / "legacy.db")
+
+        connection = sqlite3.connect(filename)
+        connection.execute("CREATE TABLE task(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+        connection.close()
+
+        runner = MigrationRunner(filename, directory)
+
+        assert [migration.version for migration in runner.migrate()] == [1]
+
+    def test_offline_migration(self, tmp_path) -> None:
+
+        directory = self._directory(tmp_path, {})
+
+        filename = str(tmp_path / "offline.db")
+        runner = MigrationRunner(filename, directory)
+        messages = []
+
+        assert [migration.version for migration in runner.migrate()] == [0]
+
+        connection = sqlite3.connect(filename)
+        connection.executemany("INSERT INTO task(name) VALUES (?)", [(f"Tarefa {i}",) for i in range(50_000)])
+        connection.commit()
+        connection.close()
+
+        migrations = tmp_path / "database" / "migrations"
+
+        (migrations / "0001_index_name.sql").write_text("-- migration: offline\nCREATE INDEX idx_task_name ON task(name);\n")
+        (migrations / "0002_index_id_name.sql").write_text("CREATE INDEX idx_task_id_name ON task(id, name);\n")
+
+        # Na inicialização, as migrações param na primeira migração offline
+        assert runner.migrate(progress=messages.append) == ()
+        assert any("offline" in message for message in messages)
+
+        messages.clear()
+
+        applied = runner.migrate(include_offline=True, progress=messages.append, progress_interval=0)
+
+        assert [migration.version for migration in applied] == [1, 2]
+        assert any("comando 1/1, " in message for message in messages)
+        assert {"idx_task_name", "idx_task_id_name"} <= self._tables(filename)
+
+    def test_offline_migration_on_new_database(self, tmp_path) -> None:
+
+        directory = self._directory(tmp_path, {
+            "0001_index_name.sql": "-- migration: offline\nCREATE INDEX idx_task_name ON task(name);\n",
+        })
+
+        # Um banco criado na própria execução está vazio, e a migração offline é aplicada na inicialização
+        filename = str(tmp_path / "new.db")
+
+        assert [migration.version for migration in MigrationRunner(filename, directory).migrate()] == [0, 1]
+
+    def test_status_is_read_only(self, tmp_path) -> None:
+
+        directory = self._directory(tmp_path, {
+            "0001_add_index.sql": "CREATE INDEX idx_task_name ON task(name);\n",
+        })
+
+        # Sem o arquivo, não há versão aplicada e o arquivo não é criado
+        missing = tmp_path / "missing.db"
+        runner = MigrationRunner(str(missing), directory)
+
+        assert runner.current_version() is None
+        assert [migration.version for migration in runner.pending_migrations()] == [0, 1]
+        assert not missing.exists()
+
+        # Um banco anterior ao controle de versões está na versão 0, sem que a tabela de versões seja criada
+        filename = str(tmp_path / "legacy.db")
+
+        connection = sqlite3.connect(filename)
+        connection.execute("CREATE TABLE task(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL)")
+        connection.close()
+
+        runner = MigrationRunner(filename, directory)
+
+        assert runner.current_version() == 0
+        assert [migration.version for migration in runner.pending_migrations()] == [1]
+        assert "schema_migrations" not in self._tables(filename)
+
+    def test_memory_database(self) -> None:
+
+        with pytest.raises(ValueError):
+
+            MigrationRunner(":memory:")
@@ -0,0 +1,85 @@
+import io
+import json
+
+
+from presentation_layer.batch_runner import BatchRunner
+from service_layer.service_factory import ServiceFactory
+
+
+def _run(runner: BatchRunner, commands: list, stop_on_error: bool = False) -> tuple:
+
+    output = io.StringIO()
+
+    exit_code = runner.run(commands, output, stop_on_error)
+
+    return exit_code, [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+class TestBatchRunner:
+
+    def test_operations(self) -> None:
+
+        factory = ServiceFactory.in_memory()
+        runner = BatchRunner(factory.task_service(), factory.task_status_service())
+
+        exit_code, results = _run(runner, [
+            '{"op": "add", "name": "Relatório", "description": "Mensal", "status": "Fazendo"}\n',
+            '{"op": "add", "name": "Compras"}\n',
+            '\n',
+            '{"op": "status", "id": 2, "status": "Feita"}\n',
+            '{"op": "list", "limit": 1, "after_id": 1}\n',
+            '{"op": "list", "status": "Fazendo"}\n',
+            '{"op": "search", "text": "relat*"}\n',
+            '{"op": "remove", "id": 1}\n',
+            '{"op": "count"}\n',
+        ])
+
+        assert exit_code == 0
+        assert [result["line"] for result in results] == [1, 2, 4, 5, 6, 7, 8, 9]
+        assert all(result["ok"] for result in results)
+
+        # "add" informa o ID gerado para a nova tarefa
+        assert [results[0]["id"], results[1]["id"]] == [1, 2]
+
+        assert results[3]["tasks"] == [{"id": 2, "name": "Compras", "description": "", "status": "Feita"}]
+        assert [task["id"] for task in results[4]["tasks"]] == [1]
+        assert [task["name"] for task in results[5]["tasks"]] == ["Relatório"]
+        assert results[7]["counts"] == {"Disponível": 0, "Fazendo": 0, "Feita": 1}
+
+    def test_errors(self) -> None:
+
+        factory = ServiceFactory.in_memory()
+        runner = BatchRunner(factory.task_service(), factory.task_status_service())
+
+        exit_code, results = _run(runner, [
+            'não é JSON',
+            '["add"]',
+            '{"op": "apagar"}',
+            '{"op": "remove"}',
+            '{"op": "remove", "id": 7}',
+            '{"op": "add", "name": "Tarefa", "status": "Inexistente"}',
+            '{"op": "count"}',
+        ])
+
+        assert exit_code == 1
+        assert [result["ok"] for result in results] == [False] * 6 + [True]
+        assert results[3]["error"] == "Campo obrigatório 'id' ausente!"
+        assert results[4]["error"] == "Tarefa com ID 7 não encontrada!"
+
+        # Cada comando é uma transação: a falha de um não desfaz os demais
+        assert results[6]["counts"] == {"Disponível": 0, "Fazendo": 0, "Feita": 0}
+
+    def test_stop_on_error(self) -> None:
+
+        factory = ServiceFactory.in_memory()
+        runner = BatchRunner(factory.task_service(), factory.task_status_service())
+
+        exit_code, results = _run(runner, [
+            '{"op": "add", "name": "Primeira"}',
+            '{"op": "status", "id": 9, "status": "Feita"}',
+            '{"op": "add", "name": "Segunda"}',
+        ], stop_on_error=True)
+
+        assert exit_code == 1
+        assert [result["line"] for result in results] == [1, 2]
+        assert [task.name for task in factory.task_service().list_all_tasks()] == ["Primeira"]
@@ -0,0 +1,123 @@
+import time
+
+import pytest
+
+
+from data_access_layer.database_api_adapters.query_instrumentation import QueryEvent
+from presentation_layer.session_profiler import SessionProfiler
+
+
+class FakeAdapter:
+
+    def __init__(self) -> None:
+
+        self.listeners = []
+
+    def add_listener(self, listener) -> None:
+
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+
+        self.listeners.remove(listener)
+
+    def query(self, duration: float) -> None:
+
+        time.sleep(duration)
+
+        for listener in self.listeners:
+
+            listener.on_query(QueryEvent("fetch_one", "SELECT 1", "()", duration, 1, None))
+
+
+class FakeDAO:
+
+    def __init__(self, adapter: FakeAdapter) -> None:
+
+        self._db_api_adapter = adapter
+
+    def get_by_id(self, task_id: int) -> int:
+
+        time.sleep(0.001)
+
+        self._db_api_adapter.query(0.001)
+
+        return task_id
+
+
+class FakeService:
+
+    def __init__(self, adapter: FakeAdapter) -> None:
+
+        self._db_adapter = adapter
+        self._task_dao = FakeDAO(adapter)
+
+    def get_task_by_id(self, task_id: int) -> int:
+
+        # Chamada interna de outro método público: medida como parte desta operação
+        self.validate(task_id)
+
+        self._db_adapter.query(0.0005)
+
+        return self._task_dao.get_by_id(task_id)
+
+    def validate(self, task_id: int) -> None:
+
+        time.sleep(0.001)
+
+
+class TestSessionProfiler:
+
+    def test_layers(self, tmp_path) -> None:
+
+        adapter = FakeAdapter()
+        service = FakeService(adapter)
+
+        profiler = SessionProfiler()
+        profiler.start()
+        profiler.instrument_service(service)
+
+        assert service.get_task_by_id(7) == 7
+        assert service.get_task_by_id(8) == 8
+
+        # Acesso direto ao DAO, fora de um serviço
+        service._task_dao.get_by_id(9)
+
+        profiler.stop()
+
+        # O ouvinte é removido do adaptador ao final da sessão
+        assert adapter.listeners == []
+
+        summary = {row["operation"]: row for row in profiler.summary()}
+
+        assert set(summary) == {"FakeService.get_task_by_id", "FakeDAO.get_by_id"}
+
+        operation = summary["FakeService.get_task_by_id"]
+
+        assert operation["calls"] == 2
+        assert operation["sqlite_ms"] == pytest.approx(3.0)
+        assert operation["dao_ms"] >= 2 * 1
+        assert operation["service_ms"] >= 2 * 1
+        assert abs(operation["total_ms"] - operation["service_ms"] - operation["dao_ms"] - operation["sqlite_ms"]) < 1e-6
+
+        assert summary["FakeDAO.get_by_id"]["calls"] == 1
+        assert summary["FakeDAO.get_by_id"]["sqlite_ms"] == pytest.approx(1.0)
+
+        prefix = str(tmp_path / "sessao")
+
+        assert "FakeService.get_task_by_id" in profiler.write_report(prefix)
+        assert (tmp_path / "sessao.pstats").exists()
+        assert "FakeService.get_task_by_id" in (tmp_path / "sessao.txt").read_text(encoding="utf-8")
+
+    def test_stop_without_start(self, tmp_path) -> None:
+
+        adapter = FakeAdapter()
+
+        profiler = SessionProfiler()
+        profiler.instrument_service(FakeService(adapter))
+
+        # Sem 'start', 'stop' apenas remove os ouvintes, e pode ser chamado mais de uma vez
+        profiler.stop()
+        profiler.stop()
+
+        assert adapter.listeners == []
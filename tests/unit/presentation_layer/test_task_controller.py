@@ -0,0 +1,149 @@
+import json
+import subprocess
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+
+from benchmarks.bench_startup import DEFERRED_MODULES, PROJECT_DIRECTORY
+from presentation_layer.task_controller import TaskController, main
+from service_layer.service_factory import ServiceFactory
+
+
+class TestTaskController:
+
+    def test_import_main_defers_modules(self) -> None:
+
+        # Um processo novo, pois os módulos já foram importados pelos demais testes
+        process = subprocess.run(
+            [sys.executable, "-c", "import sys, main; print('\\n'.join(sys.modules))"],
+            cwd=PROJECT_DIRECTORY, capture_output=True, text=True, check=True
+        )
+
+        imported = set(process.stdout.split())
+
+        assert "presentation_layer.task_controller" in imported
+        assert [module for module in DEFERRED_MODULES if module in imported] == []
+
+    def test_lazy_services(self) -> None:
+
+        factory = Mock()
+
+        controller = TaskController(factory)
+
+        # Nenhum serviço é criado antes do primeiro comando
+        factory.task_service.assert_not_called()
+        factory.task_status_service.assert_not_called()
+
+        assert controller.task_service is controller.task_service
+        assert controller.status_service is factory.task_status_service.return_value
+
+        factory.task_service.assert_called_once_with()
+        factory.task_status_service.assert_called_once_with()
+
+    def test_main_batch(self, tmp_path, monkeypatch, capsys) -> None:
+
+        (tmp_path / "database").mkdir()
+        commands = tmp_path / "commands.ndjson"
+        commands.write_text('{"op": "add", "name": "Tarefa", "status": "Fazendo"}\n{"op": "count"}\n', encoding="utf-8")
+
+        monkeypatch.chdir(tmp_path)
+
+        assert main(["batch", "--input", str(commands)]) == 0
+
+        results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+        assert results[1]["counts"] == {"Disponível": 0, "Fazendo": 1, "Feita": 0}
+
+    def test_main_batch_interrupted(self, tmp_path, monkeypatch, capsys) -> None:
+
+        commands = tmp_path / "commands.ndjson"
+        commands.write_text('{"op": "count"}\n', encoding="utf-8")
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(TaskController, "run_batch", Mock(side_effect=KeyboardInterrupt))
+
+        # Interrompido, o modo batch termina com o código de saída de SIGINT, e não com sucesso
+        assert main(["batch", "--input", str(commands)]) == 130
+
+        assert "interrompido" in capsys.readouterr().err
+
+    def test_remove_and_change_status(self, monkeypatch, capsys) -> None:
+
+        controller = TaskController(ServiceFactory.in_memory())
+
+        for number in range(TaskController.PAGE_SIZE + 2):
+
+            controller.task_service.create_task(f"Tarefa {number}", "", "Disponível")
+
+        # Nenhum dos comandos carrega todas as tarefas
+        monkeypatch.setattr(controller.task_service, "list_all_tasks", Mock(side_effect=AssertionError))
+
+        # Um ID inexistente é pedido de novo, sem limite pelo maior ID listado
+        answers = iter(["999", "52", "s"])
+        monkeypatch.setattr("builtins.input", lambda message="": next(answers))
+
+        controller.remove_task()
+
+        output = capsys.readouterr().out
+
+        assert "Tarefa 999 não encontrada!" in output
+        assert "Tarefa 52 removida!" in output
+        assert "voltar" not in output
+        assert not controller.task_service.task_exists(52)
+
+        answers = iter(["1", "2", "s"])
+
+        controller.change_status()
+
+        output = capsys.readouterr().out
+
+        assert "Status da tarefa 1 mudado para 'Fazendo'!" in output
+        assert "voltar" not in output
+        assert controller.task_service.get_task_by_id(1).status.name == "Fazendo"
+
+    @pytest.mark.parametrize("value, prefix", [
+        ("", None),
+        ("0", None),
+        ("false", None),
+        ("nao", None),
+        ("Não", None),
+        ("1", "profile"),
+        ("sim", "profile"),
+        ("sessao", "sessao"),
+    ])
+    def test_main_profile_env(self, tmp_path, monkeypatch, capsys, value, prefix) -> None:
+
+        (tmp_path / "database").mkdir()
+        (tmp_path / "commands.ndjson").write_text('{"op": "count"}\n', encoding="utf-8")
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("TASK_MANAGER_PROFILE", value)
+
+        assert main(["batch", "--input", "commands.ndjson"]) == 0
+
+        reports = sorted(path.name for path in tmp_path.glob("*.txt"))
+
+        assert reports == ([] if prefix is None else [f"{prefix}.txt"])
+
+        # O relatório vai para a saída de erros, sem misturar-se aos resultados em JSON
+        output = capsys.readouterr()
+
+        assert len(output.out.splitlines()) == 1
+        assert ("Perfil gravado" in output.err) == (prefix is not None)
+
+    def test_main_profile_flag(self, tmp_path, monkeypatch, capsys) -> None:
+
+        (tmp_path / "database").mkdir()
+        (tmp_path / "commands.ndjson").write_text('{"op": "count"}\n', encoding="utf-8")
+
+        monkeypatch.chdir(tmp_path)
+
+        # A opção --profile tem precedência sobre a variável de ambiente
+        monkeypatch.setenv("TASK_MANAGER_PROFILE", "0")
+
+        assert main(["--profile", "flag", "batch", "--input", "commands.ndjson"]) == 0
+
+        assert (tmp_path / "flag.txt").exists()
+        assert (tmp_path / "flag.pstats").exists()
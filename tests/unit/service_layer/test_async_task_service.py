@@ -0,0 +1,125 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+
+from data_access_layer.database_api_adapters.async_sqlite_database_api_adapter import AsyncSQLiteDatabaseAPIAdapter
+from data_access_layer.migrations.migration_runner import migrate_database
+from service_layer.async_task_service import AsyncTaskService
+
+
+class TestAsyncTaskService:
+
+    def test_fresh_database(self, tmp_path) -> None:
+
+        async def scenario():
+
+            # O adaptador próprio cria o esquema na thread de trabalho, ao abrir a conexão
+            task_service = AsyncTaskService(database_filename=str(tmp_path / "fresh.db"))
+
+            await task_service.create_task("Tarefa", "Descrição", "Fazendo")
+
+            tasks = await task_service.list_all_tasks()
+
+            await task_service.close()
+
+            return [(task.name, task.status.name) for task in tasks]
+
+        assert asyncio.run(scenario()) == [("Tarefa", "Fazendo")]
+
+    def test_operations(self, tmp_path) -> None:
+
+        filename = str(tmp_path / "async.db")
+
+        async def scenario():
+
+            adapter = AsyncSQLiteDatabaseAPIAdapter(filename, setup=partial(migrate_database, filename))
+
+            await adapter.connect()
+
+            task_service = AsyncTaskService(adapter)
+
+            await task_service.create_tasks([("Relatório", "Mensal", "Disponível"), ("Reunião", "", "Fazendo")])
+            await task_service.create_task("Compras", "", "Disponível")
+
+            await task_service.update_task_status(1, "Feita")
+            await task_service.update_task_statuses([(2, "Feita")])
+            await task_service.delete_task(3)
+
+            with pytest.raises(ValueError):
+
+                await task_service.delete_tasks([1, 99])
+
+            results = (
+                await task_service.count_tasks_by_status(),
+                [task.id async for task in task_service.iter_tasks(batch_size=1)],
+                [task.id for task in await task_service.list_tasks_page(1, after_id=1)],
+                [task.name for task in await task_service.list_tasks_by_status("Feita")],
+                [task.name for task in await task_service.search_tasks("relat")],
+                (await task_service.get_task_by_id(2)).status.name,
+            )
+
+            await adapter.close_connection()
+
+            return results
+
+        assert asyncio.run(scenario()) == (
+            {"Disponível": 0, "Fazendo": 0, "Feita": 2},
+            [1, 2],
+            [2],
+            ["Relatório", "Reunião"],
+            ["Relatório"],
+            "Feita",
+        )
+
+    def test_concurrent_coroutines(self, tmp_path) -> None:
+
+        async def scenario():
+
+            task_service = AsyncTaskService(database_filename=str(tmp_path / "concurrent.db"))
+
+            await asyncio.gather(*[
+                task_service.create_task(f"Tarefa {i}", "", "Disponível")
+                for i in range(200)
+            ])
+
+            # Alterações e leituras concorrentes, cada uma na sua transação
+            await asyncio.gather(*[
+                task_service.update_task_status(task_id, "Feita")
+                for task_id in range(1, 101)
+            ], *[
+                task_service.get_task_by_id(task_id)
+                for task_id in range(1, 201)
+            ])
+
+            counts = await task_service.count_tasks_by_status()
+
+            await task_service.close()
+
+            return counts
+
+        assert asyncio.run(scenario()) == {"Disponível": 100, "Fazendo": 0, "Feita": 100}
+
+    def test_invalid_batch_is_rolled_back(self, tmp_path) -> None:
+
+        async def scenario():
+
+            task_service = AsyncTaskService(database_filename=str(tmp_path / "rollback.db"))
+
+            # O status inválido do segundo item desfaz o lote inteiro, na transação do adaptador assíncrono
+            with pytest.raises(ValueError):
+
+                await task_service.create_tasks([("Tarefa", "", "Disponível"), ("Outra", "", "Inexistente")])
+
+            with pytest.raises(ValueError):
+
+                await task_service.update_task_status(1, "Feita")
+
+            tasks = await task_service.list_all_tasks()
+
+            await task_service.close()
+
+            return tasks
+
+        assert asyncio.run(scenario()) is None
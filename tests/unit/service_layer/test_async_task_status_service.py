@@ -0,0 +1,32 @@
+import asyncio
+
+
+from service_layer.async_task_status_service import AsyncTaskStatusService
+
+
+class TestAsyncTaskStatusService:
+
+    def test_operations(self, tmp_path) -> None:
+
+        async def scenario():
+
+            status_service = AsyncTaskStatusService(database_filename=str(tmp_path / "status.db"))
+
+            results = await asyncio.gather(
+                status_service.get_available_status_names(),
+                status_service.validate_status_name("Fazendo"),
+                status_service.validate_status_name("Inexistente"),
+                status_service.get_status_by_name("Feita"),
+                status_service.list_all_status(),
+            )
+
+            await status_service.close()
+
+            return results
+
+        names, valid, invalid, status, all_status = asyncio.run(scenario())
+
+        assert names == ("Disponível", "Fazendo", "Feita")
+        assert (valid, invalid) == (True, False)
+        assert status.id == 3
+        assert len(all_status) == 3
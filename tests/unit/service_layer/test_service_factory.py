@@ -0,0 +1,167 @@
+import sqlite3
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+
+from data_access_layer.dao.in_memory_task_dao import InMemoryTaskDAO
+from data_access_layer.database_api_adapters.in_memory_database import InMemoryDatabase
+from data_access_layer.database_api_adapters.sqlite_pooled_database_api_adapter import SQLitePooledDatabaseAPIAdapter
+from presentation_layer.task_controller import TaskController
+from service_layer.service_factory import ServiceFactory
+
+
+class TestServiceFactory:
+
+    def test_lazy_shared_adapter(self, tmp_path) -> None:
+
+        filename = tmp_path / "factory.db"
+
+        factory = ServiceFactory(str(filename), pool_size=2)
+
+        task_service = factory.task_service()
+        status_service = factory.task_status_service()
+
+        adapter = factory.db_adapter()
+
+        # Um único adaptador e um único DAO de cada entidade, sem conexão aberta antes do primeiro comando
+        assert isinstance(adapter, SQLitePooledDatabaseAPIAdapter)
+        assert task_service._db_adapter is adapter
+        assert task_service._task_status_dao is status_service._task_status_dao
+        assert factory.task_service()._task_dao is task_service._task_dao
+        assert not filename.exists()
+
+        task_service.create_task("Tarefa", "Descrição", "Disponível")
+
+        assert status_service.get_available_status_names() == ("Disponível", "Fazendo", "Feita")
+        assert [task.name for task in task_service.list_all_tasks()] == ["Tarefa"]
+
+        # O esquema foi criado pela própria conexão do adaptador, a única aberta
+        assert len(adapter._all_connections) == 1
+
+        factory.close()
+
+        connection = sqlite3.connect(filename)
+
+        assert connection.execute("SELECT COUNT(*) FROM schema_migrations").fetchone()[0] >= 1
+
+        connection.close()
+
+    def test_in_memory(self) -> None:
+
+        factory = ServiceFactory.in_memory()
+
+        controller = TaskController(factory)
+
+        controller.task_service.create_tasks([("Tarefa 1", "", "Disponível"), ("Tarefa 2", "", "Feita")])
+
+        assert controller.task_service.count_tasks_by_status() == {"Disponível": 1, "Fazendo": 0, "Feita": 1}
+        assert controller.status_service.validate_status_name("Fazendo")
+
+        # Fábricas em memória diferentes não compartilham dados
+        assert ServiceFactory.in_memory().task_service().list_all_tasks() is None
+
+    def test_injected(self) -> None:
+
+        database = InMemoryDatabase()
+        task_dao = InMemoryTaskDAO(database)
+        task_status_dao = Mock()
+        task_status_dao.get_by_name.return_value = database.statuses_by_name["Fazendo"]
+
+        factory = ServiceFactory(db_adapter=database, task_dao=task_dao, task_status_dao=task_status_dao)
+
+        factory.task_service().create_task("Tarefa", "", "Fazendo")
+
+        assert [task.status.name for task in task_dao.list_all()] == ["Fazendo"]
+        task_status_dao.get_by_name.assert_called_once_with("Fazendo")
+
+        with pytest.raises(ValueError):
+
+            ServiceFactory(task_dao=task_dao)
+
+    def test_write_behind(self, tmp_path) -> None:
+
+        # A thread de escrita não pode usar a conexão única do SQLite
+        with pytest.raises(ValueError):
+
+            ServiceFactory(str(tmp_path / "single.db")).task_service(write_behind=True)
+
+        # Com uma única conexão no pool, a thread de escrita esperaria por ela indefinidamente
+        with pytest.raises(ValueError):
+
+            ServiceFactory(str(tmp_path / "pooled.db"), pool_size=1).task_service(write_behind=True)
+
+        factory = ServiceFactory(str(tmp_path / "pooled.db"), pool_size=2)
+
+        task_service = factory.task_service(write_behind=True)
+
+        # As escritas adiadas têm métodos próprios: create_task continua síncrono
+        assert task_service.submit_task("Tarefa", "", "Fazendo").result(5) == 1
+        assert task_service.create_task("Outra", "", "Fazendo") == 2
+
+        task_service.submit_task_status(2, "Feita").result(5)
+
+        task_service.close()
+
+        assert [task.name for task in factory.task_service().list_all_tasks()] == ["Tarefa", "Outra"]
+
+        with pytest.raises(RuntimeError):
+
+            factory.task_service().submit_task("Sem fila", "", "Fazendo")
+
+        factory.close()
+
+    def test_write_behind_with_open_iterators(self, tmp_path) -> None:
+
+        factory = ServiceFactory(str(tmp_path / "pooled.db"), pool_size=2)
+
+        task_service = factory.task_service(write_behind=True, flush_interval_ms=0)
+
+        task_service.create_tasks([(f"Tarefa {number}", "", "Disponível") for number in range(4)])
+
+        # O primeiro lote reserva uma das duas conexões do pool para a thread de escrita
+        task_service.submit_task("Primeira", "", "Fazendo").result(5)
+
+        # Um iterador aberto nesta thread prende a outra conexão
+        tasks = task_service.iter_tasks(2)
+        next(tasks)
+
+        holding = threading.Event()
+        release = threading.Event()
+
+        def hold_connection() -> None:
+
+            # Aguarda uma conexão livre e a prende até o fim do teste
+            other_tasks = task_service.iter_tasks(2)
+            next(other_tasks)
+
+            holding.set()
+            release.wait(5)
+
+            other_tasks.close()
+
+        thread = threading.Thread(target=hold_connection, daemon=True)
+        thread.start()
+
+        # Uma leitura à espera de conexão não impede a gravação das escritas enfileiradas
+        assert not holding.wait(0.2)
+
+        future = task_service.submit_task("Com iteradores abertos", "", "Fazendo")
+
+        try:
+
+            assert future.result(5) == 6
+
+            task_service.flush()
+
+        finally:
+
+            release.set()
+            tasks.close()
+            thread.join(5)
+
+        assert holding.is_set()
+
+        task_service.close()
+        factory.close()
@@ -0,0 +1,164 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+
+from data_access_layer.database_api_adapters.sqlite_database_api_adapter import SQLiteDatabaseAPIAdapter
+from data_access_layer.database_api_adapters.sqlite_pooled_database_api_adapter import SQLitePooledDatabaseAPIAdapter
+from service_layer.write_behind_queue import WriteBehindQueue
+
+
+class TestWriteBehindQueue:
+
+    def _adapter(self, tmp_path) -> SQLitePooledDatabaseAPIAdapter:
+
+        adapter = SQLitePooledDatabaseAPIAdapter(str(tmp_path / "write_behind.db"), 2)
+        adapter.connect()
+
+        adapter.execute("CREATE TABLE item(id INTEGER PRIMARY KEY, name VARCHAR NOT NULL UNIQUE)")
+
+        return adapter
+
+    def _insert(self, adapter: SQLitePooledDatabaseAPIAdapter, name: str) -> str:
+
+        adapter.execute("INSERT INTO item(name) VALUES (?)", (name,))
+
+        return name
+
+    def test_arguments(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path)
+
+        with pytest.raises(ValueError):
+
+            WriteBehindQueue(adapter, flush_interval=-1)
+
+        with pytest.raises(ValueError):
+
+            WriteBehindQueue(adapter, max_batch_size=0)
+
+        # A thread de escrita precisa de uma conexão própria
+        with pytest.raises(ValueError):
+
+            WriteBehindQueue(SQLiteDatabaseAPIAdapter(str(tmp_path / "single.db")))
+
+        with pytest.raises(ValueError):
+
+            WriteBehindQueue(SQLitePooledDatabaseAPIAdapter(str(tmp_path / "single_pool.db"), 1))
+
+    def test_submit_flush(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path)
+        queue = WriteBehindQueue(adapter, flush_interval=0.01, max_batch_size=3)
+
+        futures = [queue.submit(self._insert, adapter, f"item {i}") for i in range(10)]
+
+        queue.flush()
+
+        assert all(future.done() for future in futures)
+        assert [future.result() for future in futures] == [f"item {i}" for i in range(10)]
+        assert adapter.fetch_one("SELECT count(*) as total FROM item") == {"total": 10}
+
+        queue.close()
+
+    def test_failed_operation(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path)
+        queue = WriteBehindQueue(adapter, flush_interval=1)
+
+        first = queue.submit(self._insert, adapter, "repetido")
+        duplicate = queue.submit(self._insert, adapter, "repetido")
+        last = queue.submit(self._insert, adapter, "último")
+
+        queue.flush()
+
+        # Apenas a operação que falhou é desfeita; as demais do lote são gravadas
+        assert first.result() == "repetido"
+        assert last.result() == "último"
+
+        with pytest.raises(Exception):
+
+            duplicate.result()
+
+        assert adapter.fetch_all_tuples("SELECT name FROM item ORDER BY id") == [("repetido",), ("último",)]
+
+        queue.close()
+
+    def test_close(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path)
+        queue = WriteBehindQueue(adapter, flush_interval=60)
+
+        future = queue.submit(self._insert, adapter, "pendente")
+
+        # O encerramento grava a escrita pendente sem aguardar o intervalo
+        queue.close()
+
+        assert future.result(timeout=0) == "pendente"
+
+        with pytest.raises(RuntimeError):
+
+            queue.submit(self._insert, adapter, "recusado")
+
+    def test_close_race(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path)
+        queue = WriteBehindQueue(adapter, flush_interval=0)
+
+        futures = []
+        refused = []
+
+        def producer(number: int) -> None:
+
+            for index in range(50):
+
+                try:
+
+                    futures.append(queue.submit(self._insert, adapter, f"{number}-{index}"))
+                    queue.flush()
+
+                except RuntimeError:
+
+                    refused.append(number)
+
+                    return
+
+        producers = [threading.Thread(target=producer, args=(number,)) for number in range(4)]
+
+        for thread in producers:
+
+            thread.start()
+
+        queue.close()
+
+        for thread in producers:
+
+            thread.join(5)
+
+            assert not thread.is_alive()
+
+        # Toda operação aceita é gravada antes do encerramento; nenhuma fica sem resposta
+        for future in futures:
+
+            future.result(timeout=0)
+
+    def test_pending_after_stop(self, tmp_path) -> None:
+
+        adapter = self._adapter(tmp_path)
+        queue = WriteBehindQueue(adapter, flush_interval=0)
+
+        # Operação deixada para trás do _STOP, como numa corrida com 'close'
+        future = Future()
+
+        with queue._close_lock:
+
+            queue._closed = True
+            queue._queue.put((WriteBehindQueue._STOP, (), None))
+            queue._queue.put((self._insert, (adapter, "tardio"), future))
+
+        queue._thread.join(5)
+
+        with pytest.raises(RuntimeError):
+
+            future.result(timeout=0)